@@ -27,7 +27,7 @@ def ml_pipeline():
     transformed_data = feature_engineering_step(filled_data,
                                                 strategy="log", 
                                                 features=["Gr Liv Area", "SalePrice"])
-    cleaned_data, plot = outlier_detection_step(transformed_data,
+    cleaned_data, outlier_summary = outlier_detection_step(transformed_data,
                                                 features=["Gr Liv Area", "SalePrice"])
     
     X_train, X_test, y_train, y_test = data_splitter_step(cleaned_data, target_column="SalePrice")
@@ -0,0 +1,112 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from source.data_splitter import TemporalSplitStrategy
+from source.model_building import ModelBuildingStrategy
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Data shared read-only by the backtest workers, set once per process by _init_worker
+_SHARED = {}
+
+
+def _init_worker(X: pd.DataFrame, y: pd.Series, model_strategy: ModelBuildingStrategy):
+    """Receives the data once per worker process, so windows only ship their row indices."""
+    _SHARED["X"] = X
+    _SHARED["y"] = y
+    _SHARED["model_strategy"] = model_strategy
+
+
+def _run_window(window: dict) -> dict:
+    """Trains on one window's training rows and evaluates on its test rows."""
+    X, y = _SHARED["X"], _SHARED["y"]
+    train, test = window["train_indices"], window["test_indices"]
+    model = _SHARED["model_strategy"].build_and_train_model(X.iloc[train], y.iloc[train])
+    y_test = y.iloc[test].to_numpy()
+    y_pred = model.predict(X.iloc[test])
+    return {
+        "train_start": window["train_start"],
+        "train_end": window["train_end"],
+        "test_start": window["test_start"],
+        "test_end": window["test_end"],
+        "n_train": int(len(train)),
+        "n_test": int(len(test)),
+        "mse": float(mean_squared_error(y_test, y_pred)),
+        "mae": float(mean_absolute_error(y_test, y_pred)),
+        "r2": float(r2_score(y_test, y_pred)) if len(test) > 1 else float("nan"),
+        "y_test": y_test,
+        "y_pred": np.asarray(y_pred),
+    }
+
+
+class BacktestRunner:
+    def __init__(self, model_strategy: ModelBuildingStrategy, splitter: Optional[TemporalSplitStrategy] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initializes the BacktestRunner, which trains and evaluates a model on every temporal window of a splitter.
+
+        Parameters:
+        model_strategy (ModelBuildingStrategy): The strategy building the model of each window.
+        splitter (TemporalSplitStrategy): The windows to evaluate. Defaults to 6-month expanding windows.
+        max_workers (int): Number of worker processes evaluating windows. Defaults to the number of CPUs.
+        """
+        self.model_strategy = model_strategy
+        self.splitter = splitter or TemporalSplitStrategy()
+        self.max_workers = max_workers
+
+    def run(self, df: pd.DataFrame, target_column: str) -> dict:
+        """
+        Evaluates every window in parallel worker processes and aggregates the results.
+
+        Parameters:
+        df (pd.DataFrame): The data, including the target and the splitter's year/month columns.
+        target_column (str): The name of the target column.
+
+        Returns:
+        dict: The backtest report: per-window metrics, their mean and standard deviation, and the metrics
+              pooled over the predictions of every test window.
+        """
+        windows = list(self.splitter.iter_windows(df))
+        if not windows:
+            raise ValueError("Not enough history for a single backtest window.")
+        X = df.drop(columns=target_column)
+        y = df[target_column]
+
+        max_workers = min(self.max_workers or os.cpu_count() or 1, len(windows))
+        logging.info(f"Backtesting {len(windows)} {self.splitter.window} windows with {max_workers} workers.")
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(X, y, self.model_strategy)) as executor:
+            results = list(executor.map(_run_window, windows))
+
+        y_test = np.concatenate([result.pop("y_test") for result in results])
+        y_pred = np.concatenate([result.pop("y_pred") for result in results])
+        per_window = pd.DataFrame(results)
+        metrics = ["mse", "mae", "r2"]
+        report = {
+            "window": self.splitter.window,
+            "n_windows": len(results),
+            "windows": results,
+            "mean": {metric: float(per_window[metric].mean()) for metric in metrics},
+            "std": {metric: float(per_window[metric].std(ddof=0)) for metric in metrics},
+            "pooled": {
+                "mse": float(mean_squared_error(y_test, y_pred)),
+                "mae": float(mean_absolute_error(y_test, y_pred)),
+                "r2": float(r2_score(y_test, y_pred)),
+                "n_test": int(len(y_test)),
+            },
+        }
+        logging.info(f"Backtest completed: pooled metrics {report['pooled']}.")
+        return report
+
+
+# Example usage
+if __name__ == "__main__":
+    # from source.model_building import LinearRegressionStrategy
+    # splitter = TemporalSplitStrategy(window="rolling", train_months=24, test_months=3)
+    # report = BacktestRunner(LinearRegressionStrategy(), splitter).run(df_numeric, target_column='SalePrice')
+    pass
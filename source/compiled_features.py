@@ -0,0 +1,258 @@
+import logging
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from source.feature_engineering import FeatureEngineer, HashingEncoding, OneHotEncoding
+from source.handle_missing_values import FillingMissingValuesStrategy
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def _is_missing(value) -> bool:
+    # None or NaN, without going through pandas.
+    return value is None or value != value
+
+
+# Compiled Feature Transform
+# --------------------------
+# This class flattens a fitted imputation + FeatureEngineer plan into NumPy operations over a fixed input column order,
+# for serving single rows or small batches without building DataFrames or logging on every call.
+# Numeric columns go through vectorized fill, affine (consecutive scalings merged into one) and log1p layers;
+# one-hot and hashed columns are written straight into the output row from a precomputed lookup.
+class CompiledFeatureTransform:
+    def __init__(self, engineer: FeatureEngineer, input_columns: Sequence[str],
+                 imputer: Optional[FillingMissingValuesStrategy] = None):
+        """
+        Compiles a fitted feature engineering plan.
+
+        Parameters:
+        engineer (FeatureEngineer): The fitted plan, e.g. from FeatureEngineer.load.
+        input_columns (list): The order of the values in each input row. Columns that are not encoded by the plan
+                              are treated as numeric.
+        imputer (FillingMissingValuesStrategy): Optional fitted imputation applied before the plan.
+        """
+        if imputer is not None and imputer.fill_values_ is None:
+            raise ValueError("The imputer must be fitted before it is compiled.")
+        fill_values = imputer.fill_values_ if imputer is not None else {}
+
+        self.input_columns = list(input_columns)
+        input_positions = {column: i for i, column in enumerate(self.input_columns)}
+
+        # Trace the plan over the column layout: which outputs are numeric inputs (with their chain of
+        # operations) and which come from encoders.
+        columns = list(self.input_columns)
+        ops: Dict[str, list] = {column: [] for column in self.input_columns}
+        encoded = set()
+        encoders = []
+        for stage in engineer._plan:
+            if isinstance(stage, dict):
+                for feature, chain in stage.items():
+                    if feature not in columns:
+                        continue
+                    if feature in encoded:
+                        raise ValueError(f"Column-wise transforms of encoded column '{feature}' cannot be compiled.")
+                    for strategy in chain:
+                        ops[feature].extend(strategy.column_ops(feature))
+            elif isinstance(stage, (OneHotEncoding, HashingEncoding)):
+                features = [feature for feature in stage.features if feature in columns]
+                for feature in features:
+                    if feature not in input_positions or ops[feature]:
+                        raise ValueError(f"Encoding of transformed column '{feature}' cannot be compiled.")
+                    columns.remove(feature)
+                if isinstance(stage, OneHotEncoding):
+                    first = 1 if stage.drop_first else 0
+                    names = [
+                        f"{feature}_{category}"
+                        for feature, categories in zip(stage.features, stage.categories_) if feature in features
+                        for category in categories[first:]
+                    ]
+                else:
+                    names = stage.get_feature_names_out()
+                encoders.append((stage, features))
+                columns.extend(names)
+                encoded.update(names)
+            else:
+                raise TypeError(f"{type(stage).__name__} cannot be compiled.")
+
+        self.output_columns = columns
+        output_positions = {column: i for i, column in enumerate(columns)}
+
+        numeric = [column for column in columns if column in input_positions]
+        self._numeric_inputs = np.array([input_positions[column] for column in numeric], dtype=np.intp)
+        self._numeric_outputs = np.array([output_positions[column] for column in numeric], dtype=np.intp)
+        self._numeric_fill = np.array([fill_values.get(column, np.nan) for column in numeric], dtype=np.float64)
+        self._layers = self._compile_layers([ops[column] for column in numeric])
+        self._encoders = [
+            self._compile_encoder(stage, features, input_positions, output_positions, fill_values)
+            for stage, features in encoders
+        ]
+        self.n_outputs = len(columns)
+
+    @staticmethod
+    def _compile_layers(column_ops: List[list]) -> list:
+        """
+        Turns per-column operation chains into vectorized layers over all numeric columns: alternating affine
+        layers (one scale and offset per column, identity where a column has nothing to do) and log1p layers
+        (on the columns that have a log at that depth).
+        """
+        segments = []
+        for chain in column_ops:
+            # Each column becomes affine, (log1p, affine)*: consecutive affines are merged.
+            column_segments = [[1.0, 0.0]]
+            for op in chain:
+                if op[0] == "affine":
+                    scale, offset = op[1], op[2]
+                    column_segments[-1][0] *= scale
+                    column_segments[-1][1] = column_segments[-1][1] * scale + offset
+                elif op[0] == "log1p":
+                    column_segments.append([1.0, 0.0])
+                else:
+                    raise ValueError(f"Unknown operation {op[0]}.")
+            segments.append(column_segments)
+
+        layers = []
+        depth = max((len(column_segments) for column_segments in segments), default=1)
+        for j in range(depth):
+            scale = np.array([s[j][0] if j < len(s) else 1.0 for s in segments], dtype=np.float64)
+            offset = np.array([s[j][1] if j < len(s) else 0.0 for s in segments], dtype=np.float64)
+            if not (np.all(scale == 1.0) and np.all(offset == 0.0)):
+                layers.append(("affine", scale, offset))
+            if j + 1 < depth:
+                layers.append(("log1p", np.array([len(s) > j + 1 for s in segments]), None))
+        return layers
+
+    @staticmethod
+    def _compile_encoder(stage, features, input_positions, output_positions, fill_values) -> tuple:
+        """
+        Precomputes the lookup of an encoding stage: for one-hot encoding a dict per feature from category to
+        output column, for hashing the first output column, bucket count and sign flag.
+        """
+        # Positions are resolved by name on the final layout, since later stages may drop columns before this block.
+        inputs = [(input_positions[feature], feature, fill_values.get(feature)) for feature in features]
+        if isinstance(stage, HashingEncoding):
+            offset = output_positions[stage.get_feature_names_out()[0]]
+            return ("hashing", inputs, (offset, stage.n_buckets, stage.signed))
+
+        first = 1 if stage.drop_first else 0
+        lookups = {}
+        for feature, categories in zip(stage.features, stage.categories_):
+            if feature not in features:
+                continue
+            # Missing values are looked up under None, since NaN keys never compare equal.
+            lookups[feature] = {
+                (None if _is_missing(category) else category.item() if isinstance(category, np.generic) else category):
+                    output_positions[f"{feature}_{category}"]
+                for category in categories[first:]
+            }
+        return ("onehot", inputs, lookups)
+
+    def transform(self, X) -> np.ndarray:
+        """
+        Transforms one row or a batch of rows given in input_columns order.
+
+        Parameters:
+        X (array-like): A row of shape (n_inputs,) or a batch of shape (n_rows, n_inputs). Missing values may be
+                        None or NaN.
+
+        Returns:
+        np.ndarray: float64 array of shape (n_outputs,) or (n_rows, n_outputs) in output_columns order.
+        """
+        X = np.asarray(X, dtype=object if self._encoders else np.float64)
+        single = X.ndim == 1
+        if single:
+            X = X[np.newaxis, :]
+
+        values = X[:, self._numeric_inputs].astype(np.float64)
+        missing = np.isnan(values)
+        if missing.any():
+            values = np.where(missing, self._numeric_fill, values)
+        for kind, a, b in self._layers:
+            if kind == "affine":
+                values *= a
+                values += b
+            else:
+                values[:, a] = np.log1p(values[:, a])
+
+        out = np.zeros((X.shape[0], self.n_outputs))
+        out[:, self._numeric_outputs] = values
+        for kind, inputs, lookup in self._encoders:
+            if kind == "onehot":
+                self._encode_onehot(X, out, inputs, lookup)
+            else:
+                self._encode_hashing(X, out, inputs, *lookup)
+        return out[0] if single else out
+
+    def transform_record(self, record: dict) -> np.ndarray:
+        """
+        Transforms a single row given as a {column: value} mapping. Absent columns count as missing.
+        """
+        return self.transform([record.get(column) for column in self.input_columns])
+
+    @staticmethod
+    def _encode_onehot(X, out, inputs, lookups):
+        for position, feature, fill in inputs:
+            lookup = lookups[feature]
+            for row, value in enumerate(X[:, position]):
+                if _is_missing(value):
+                    value = fill
+                column = lookup.get(None if _is_missing(value) else value)
+                if column is not None:
+                    out[row, column] = 1.0
+
+    @staticmethod
+    def _encode_hashing(X, out, inputs, offset, n_buckets, signed):
+        from sklearn.utils import murmurhash3_32
+
+        for position, feature, fill in inputs:
+            for row, value in enumerate(X[:, position]):
+                if _is_missing(value):
+                    if fill is None:
+                        continue
+                    value = fill
+                token_hash = murmurhash3_32(f"{feature}={value}", seed=0)
+                out[row, offset + abs(token_hash) % n_buckets] += 1.0 if token_hash >= 0 or not signed else -1.0
+
+    def check_parity(self, df: pd.DataFrame, engineer: FeatureEngineer,
+                     imputer: Optional[FillingMissingValuesStrategy] = None,
+                     rtol: float = 1e-9, atol: float = 1e-9) -> float:
+        """
+        Checks the compiled transform against the DataFrame path (imputer.transform then engineer.transform)
+        on the given rows, both as one batch and row by row.
+
+        Parameters:
+        df (pd.DataFrame): Rows to compare on, containing input_columns.
+        engineer (FeatureEngineer): The plan this transform was compiled from.
+        imputer (FillingMissingValuesStrategy): The imputer it was compiled with, if any.
+
+        Returns:
+        float: The largest absolute difference. Raises AssertionError on a mismatch.
+        """
+        frame = df[self.input_columns]
+        if imputer is not None:
+            frame = imputer.transform(frame)
+        expected_df = engineer.transform(frame)
+        if list(expected_df.columns) != self.output_columns:
+            raise AssertionError("Compiled output columns differ from the DataFrame path.")
+        expected = np.column_stack([
+            column.sparse.to_dense().to_numpy(dtype=np.float64) if isinstance(column.dtype, pd.SparseDtype)
+            else column.to_numpy(dtype=np.float64)
+            for _, column in expected_df.items()
+        ])
+
+        rows = df[self.input_columns].astype(object).where(df[self.input_columns].notna(), None).to_numpy()
+        batch = self.transform(rows)
+        single = np.vstack([self.transform(row) for row in rows])
+        for actual in (batch, single):
+            np.testing.assert_allclose(actual, expected, rtol=rtol, atol=atol, equal_nan=True)
+        return float(np.nanmax(np.abs(batch - expected), initial=0.0))
+
+
+# Example usage
+if __name__ == "__main__":
+    # Compile the plan saved by feature_engineering_step and serve single rows
+    # engineer = FeatureEngineer.load('feature_state.npz')
+    # compiled = CompiledFeatureTransform(engineer, input_columns=train_df.columns, imputer=fitted_imputer)
+    # compiled.check_parity(test_df, engineer, fitted_imputer)
+    # features = compiled.transform_record({'Gr Liv Area': 1710.0, 'Neighborhood': 'NAmes', ...})
+    pass
@@ -0,0 +1,132 @@
+import logging
+import sys
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+class DatasetSchema:
+    def __init__(self, name: str, categorical_columns: List[str], key_columns: Optional[Dict[str, int]] = None):
+        """
+        Initializes a declared dataset schema used to load data with compact dtypes.
+
+        Parameters:
+        name (str): Name of the dataset the schema describes.
+        categorical_columns (list): Columns loaded as pandas 'category' instead of Python strings.
+        key_columns (dict): Identifier columns mapped to their fixed width. They are kept as zero-padded
+                            strings instead of being parsed as numbers.
+
+        Every other column is treated as numeric and downcast to the narrowest width that keeps its values exact.
+        """
+        self.name = name
+        self.categorical_columns = list(categorical_columns)
+        self.key_columns = dict(key_columns or {})
+
+    def to_dict(self) -> dict:
+        """
+        Returns a plain description of the schema, used in cache keys.
+        """
+        return {
+            "name": self.name,
+            "categorical_columns": self.categorical_columns,
+            "key_columns": self.key_columns,
+        }
+
+    def read_dtypes(self) -> dict:
+        """
+        Returns the dtype mapping passed to pd.read_csv so categoricals and keys never go through inference.
+        """
+        dtypes = {column: "category" for column in self.categorical_columns}
+        dtypes.update({column: str for column in self.key_columns})
+        return dtypes
+
+    def apply(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
+        """
+        Casts the DataFrame to the schema's compact dtypes in place.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame, typically freshly parsed with read_dtypes().
+
+        Returns:
+        pd.DataFrame: The DataFrame with compact dtypes.
+        dict: Memory report comparing against the inferred object/64-bit representation.
+        """
+        baseline_bytes = 0
+        for column in df.columns:
+            baseline_bytes += _inferred_nbytes(df[column], is_key=column in self.key_columns)
+
+            if column in self.key_columns:
+                width = self.key_columns[column]
+                df[column] = df[column].astype(str).str.zfill(width).astype("string[pyarrow]")
+            elif column in self.categorical_columns:
+                if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype("category")
+            else:
+                df[column] = _downcast(df[column])
+
+        compact_bytes = int(df.memory_usage(deep=True, index=False).sum())
+        report = {
+            "schema": self.name,
+            "baseline_bytes": int(baseline_bytes),
+            "compact_bytes": compact_bytes,
+            "saved_bytes": int(baseline_bytes - compact_bytes),
+            "saved_ratio": float(1 - compact_bytes / baseline_bytes) if baseline_bytes else 0.0,
+        }
+        logging.info(
+            f"Applied schema '{self.name}': {report['baseline_bytes'] / 1e6:.2f} MB -> "
+            f"{report['compact_bytes'] / 1e6:.2f} MB ({report['saved_ratio']:.0%} saved)."
+        )
+        return df, report
+
+
+def _downcast(series: pd.Series) -> pd.Series:
+    """
+    Downcasts a numeric Series to the narrowest integer or float width that keeps every value exact.
+    """
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast="integer")
+    if pd.api.types.is_float_dtype(series.dtype) and series.dtype != np.float32:
+        values = series.to_numpy()
+        narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True):
+            return pd.Series(narrowed, index=series.index, name=series.name)
+    return series
+
+
+def _inferred_nbytes(series: pd.Series, is_key: bool) -> int:
+    """
+    Estimates the memory the column takes when pd.read_csv infers its dtype (int64/float64 or object strings),
+    without materializing that representation.
+    """
+    n_rows = len(series)
+    if is_key or pd.api.types.is_numeric_dtype(series.dtype):
+        return 8 * n_rows
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = series.value_counts(sort=False, dropna=False)
+        # One pointer per row plus one Python str object per row (missing values share a float NaN).
+        return 8 * n_rows + sum(
+            sys.getsizeof(value) * count for value, count in counts.items() if not pd.isna(value)
+        )
+    return int(series.memory_usage(deep=True, index=False))
+
+
+AMES_HOUSING_SCHEMA = DatasetSchema(
+    name="ames_housing",
+    categorical_columns=[
+        "MS Zoning", "Street", "Alley", "Lot Shape", "Land Contour", "Utilities", "Lot Config",
+        "Land Slope", "Neighborhood", "Condition 1", "Condition 2", "Bldg Type", "House Style",
+        "Roof Style", "Roof Matl", "Exterior 1st", "Exterior 2nd", "Mas Vnr Type", "Exter Qual",
+        "Exter Cond", "Foundation", "Bsmt Qual", "Bsmt Cond", "Bsmt Exposure", "BsmtFin Type 1",
+        "BsmtFin Type 2", "Heating", "Heating QC", "Central Air", "Electrical", "Kitchen Qual",
+        "Functional", "Fireplace Qu", "Garage Type", "Garage Finish", "Garage Qual", "Garage Cond",
+        "Paved Drive", "Pool QC", "Fence", "Misc Feature", "Sale Type", "Sale Condition",
+    ],
+    key_columns={"PID": 10},
+)
+
+# Schemas selectable by name from the pipeline steps
+DATASET_SCHEMAS = {
+    "ames": AMES_HOUSING_SCHEMA,
+}
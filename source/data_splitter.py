@@ -1,7 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterator, Tuple
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold, RepeatedKFold, ShuffleSplit
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -21,6 +23,42 @@ class DataSplitterStrategy(ABC):
         """
         pass
 
+    @abstractmethod
+    def split_indices(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Abstract method to return the positional row indices of the training and testing sets instead of copied frames.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+
+        Returns:
+        train_indices, test_indices: Integer arrays usable with df.iloc / np.take.
+        """
+        pass
+
+    def iter_splits(self, df: pd.DataFrame) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yields (train_indices, test_indices) one split at a time; a single split unless the strategy defines several.
+        """
+        yield self.split_indices(df)
+
+
+def take_split(df: pd.DataFrame, target_feature: str, train_indices: np.ndarray, test_indices: np.ndarray):
+    """
+    Materializes a split from positional indices, copying each row block once (no intermediate df.drop copy).
+
+    Returns:
+    X_train, X_test, y_train, y_test: The training and testing splits for features and target.
+    """
+    target_position = df.columns.get_loc(target_feature)
+    feature_positions = np.delete(np.arange(df.shape[1]), target_position)
+    return (
+        df.iloc[train_indices, feature_positions],
+        df.iloc[test_indices, feature_positions],
+        df.iloc[train_indices, target_position],
+        df.iloc[test_indices, target_position],
+    )
+
 class SimpleTrainTestSplitStrategy(DataSplitterStrategy):
     def __init__(self, test_size=0.2, random_state=42):
         """
@@ -33,6 +71,13 @@ class SimpleTrainTestSplitStrategy(DataSplitterStrategy):
         self.test_size = test_size
         self.random_state = random_state
 
+    def split_indices(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shuffles the row positions into training and testing indices, exactly as train_test_split would.
+        """
+        splitter = ShuffleSplit(n_splits=1, test_size=self.test_size, random_state=self.random_state)
+        return next(splitter.split(np.empty((len(df), 0))))
+
     def split_data(self, df: pd.DataFrame, target_feature:str):
         """
         Splits the data into training and testing sets using a simple train-test split.
@@ -45,12 +90,152 @@ class SimpleTrainTestSplitStrategy(DataSplitterStrategy):
         X_train, X_test, y_train, y_test: The training and testing splits for features and target.
         """
         logging.info("Performing simple train-test. split.")
-        X = df.drop(target_feature,axis=1)
-        y = df[target_feature]
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = take_split(df, target_feature, *self.split_indices(df))
         logging.info("Train-test split completed.")
         return X_train, X_test, y_train, y_test
+
+class KFoldSplitStrategy(DataSplitterStrategy):
+    def __init__(self, n_splits=5, n_repeats=1, shuffle=True, random_state=42):
+        """
+        Initializes the KFoldSplitStrategy for (repeated) K-fold cross-validation.
+
+        Parameters:
+        n_splits (int): Number of folds.
+        n_repeats (int): Number of times the K-fold split is repeated with a different shuffle.
+        shuffle (bool): Shuffle the rows before splitting them into folds (always done when n_repeats > 1).
+        random_state (int): The seed used by the random number generator.
+        """
+        self.n_splits = n_splits
+        self.n_repeats = n_repeats
+        self.shuffle = shuffle
+        self.random_state = random_state
+
+    def iter_splits(self, df: pd.DataFrame) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yields (train_indices, test_indices) for each fold, computed lazily, so only one fold's indices are
+        held at a time and no fold is ever materialized as a DataFrame copy.
+        """
+        if self.n_repeats > 1:
+            splitter = RepeatedKFold(n_splits=self.n_splits, n_repeats=self.n_repeats, random_state=self.random_state)
+        else:
+            splitter = KFold(n_splits=self.n_splits, shuffle=self.shuffle,
+                             random_state=self.random_state if self.shuffle else None)
+        yield from splitter.split(np.empty((len(df), 0)))
+
+    def split_indices(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the indices of the first fold.
+        """
+        return next(self.iter_splits(df))
+
+    def split_data(self, df: pd.DataFrame, target_feature: str):
+        """
+        Splits the data into the training and testing sets of the first fold.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        target_column (str): The name of the target column.
+
+        Returns:
+        X_train, X_test, y_train, y_test: The training and testing splits for features and target.
+        """
+        logging.info(f"Performing {self.n_splits}-fold split (first fold).")
+        return take_split(df, target_feature, *self.split_indices(df))
     
+class TemporalSplitStrategy(DataSplitterStrategy):
+    def __init__(self, year_column="Yr Sold", month_column="Mo Sold", window="expanding", test_months=6,
+                 train_months=None, step_months=None, min_train_months=12):
+        """
+        Initializes the TemporalSplitStrategy, which backtests on time windows instead of a random split:
+        each test window only contains sales made after every sale of its training window.
+
+        Parameters:
+        year_column (str): Column holding the year of the sale.
+        month_column (str): Column holding the month of the sale (1-12).
+        window (str): "expanding" trains on all the history before the test window, "rolling" on the
+                      train_months just before it.
+        test_months (int): Length of each test window in months.
+        train_months (int): Length of the rolling training window. Required with window="rolling".
+        step_months (int): Months between consecutive test windows. Defaults to test_months.
+        min_train_months (int): Months of history before the first test window.
+        """
+        if window not in ("expanding", "rolling"):
+            raise ValueError(f"Unsupported window type: {window}.")
+        if window == "rolling" and train_months is None:
+            raise ValueError("train_months is required for rolling windows.")
+        self.year_column = year_column
+        self.month_column = month_column
+        self.window = window
+        self.test_months = test_months
+        self.train_months = train_months
+        self.step_months = step_months or test_months
+        self.min_train_months = min_train_months
+
+    def _periods(self, df: pd.DataFrame) -> np.ndarray:
+        # Months since year 0, so consecutive months are consecutive integers across years.
+        return df[self.year_column].to_numpy(dtype=np.int64) * 12 + df[self.month_column].to_numpy(dtype=np.int64) - 1
+
+    def iter_windows(self, df: pd.DataFrame) -> Iterator[dict]:
+        """
+        Yields each window as a dict with its train/test positional indices and its period bounds ("YYYY-MM").
+
+        Rows are sorted by period once; every window is then two slices of that order found by binary search,
+        so generating a window costs O(window size), not a pass over the data.
+        """
+        periods = self._periods(df)
+        order = np.argsort(periods, kind="stable")
+        sorted_periods = periods[order]
+        first, last = sorted_periods[0], sorted_periods[-1]
+
+        def label(period):
+            return f"{period // 12:04d}-{period % 12 + 1:02d}"
+
+        test_start = first + self.min_train_months
+        while test_start <= last:
+            test_end = test_start + self.test_months
+            train_start = first if self.window == "expanding" else max(first, test_start - self.train_months)
+            train_lo, train_hi, test_hi = np.searchsorted(sorted_periods, [train_start, test_start, test_end])
+            if test_hi > train_hi:
+                yield {
+                    "train_indices": order[train_lo:train_hi],
+                    "test_indices": order[train_hi:test_hi],
+                    "train_start": label(train_start),
+                    "train_end": label(test_start - 1),
+                    "test_start": label(test_start),
+                    "test_end": label(test_end - 1),
+                }
+            test_start += self.step_months
+
+    def iter_splits(self, df: pd.DataFrame) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for window in self.iter_windows(df):
+            yield window["train_indices"], window["test_indices"]
+
+    def split_indices(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the most recent window: the last test_months as test set, the history before them as training set.
+        """
+        periods = self._periods(df)
+        test_start = periods.max() - self.test_months + 1
+        if self.window == "rolling":
+            train_mask = (periods < test_start) & (periods >= test_start - self.train_months)
+        else:
+            train_mask = periods < test_start
+        return np.flatnonzero(train_mask), np.flatnonzero(periods >= test_start)
+
+    def split_data(self, df: pd.DataFrame, target_feature: str):
+        """
+        Splits the data in time: the most recent test_months are the test set.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        target_column (str): The name of the target column.
+
+        Returns:
+        X_train, X_test, y_train, y_test: The training and testing splits for features and target.
+        """
+        logging.info(f"Performing temporal split on {self.year_column}/{self.month_column}.")
+        return take_split(df, target_feature, *self.split_indices(df))
+
 # Context Class for Data Splitting
 # --------------------------------
 class DataSplitter:
@@ -85,4 +270,26 @@ class DataSplitter:
         X_train, X_test, y_train, y_test: The training and testing splits for features and target.
         """
         logging.info("Splitting data using the selected strategy.")
-        return self._strategy.split_data(df, target_column)
\ No newline at end of file
+        return self._strategy.split_data(df, target_column)
+
+    def split_indices(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Executes the data splitting using the current strategy, returning positional row indices instead of copies.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+
+        Returns:
+        train_indices, test_indices: Integer arrays usable with df.iloc.
+        """
+        return self._strategy.split_indices(df)
+
+    def iter_splits(self, df: pd.DataFrame) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yields the (train_indices, test_indices) of every split of the current strategy, one at a time,
+        e.g. the folds of a KFoldSplitStrategy.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        """
+        return self._strategy.iter_splits(df)
\ No newline at end of file
@@ -0,0 +1,223 @@
+import logging
+import os
+from typing import Any, Optional, Tuple, Union
+import joblib
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder
+from source.feature_engineering import sparse_frame_to_csr
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+DesignMatrix = Union[np.ndarray, sp.spmatrix]
+
+
+def build_preprocessor(numerical_cols, categorical_cols, sparse_cols) -> ColumnTransformer:
+    """
+    Builds the training preprocessor: mean imputation of numerical columns, most-frequent imputation and one-hot
+    encoding of categorical columns, and sparse (already one-hot encoded) columns passed through as CSR.
+
+    Returns:
+    ColumnTransformer: The unfitted preprocessor.
+    """
+    numerical_transformer = SimpleImputer(strategy="mean")
+    categorical_transformer = Pipeline(
+        steps=[
+            ("imputer", SimpleImputer(strategy="most_frequent")),
+            ("onehot", OneHotEncoder(handle_unknown="ignore"))
+        ]
+    )
+    return ColumnTransformer(
+        transformers=[
+            ("num", numerical_transformer, numerical_cols),
+            ("cat", categorical_transformer, categorical_cols),
+            # Sparse one-hot columns go straight to CSR so the design matrix is never densified
+            ("sparse", FunctionTransformer(sparse_frame_to_csr, accept_sparse=True), sparse_cols),
+        ]
+    )
+
+
+# Feature Binner
+# --------------
+# Histogram gradient boosting only ever sees bin indices of its inputs. This transformer computes those bins itself,
+# with the same thresholds HistGradientBoostingRegressor would (midpoints between distinct values, or quantiles when
+# there are more than max_bins), and encodes categorical columns as ordinal codes for its native categorical
+# support. The output is a compact float32 matrix of small integers, one column per input column, which the booster
+# re-bins as the identity, so the trees are those it would grow on the raw values.
+class FeatureBinner(TransformerMixin, BaseEstimator):
+    def __init__(self, max_bins: int = 255, subsample: int = 200_000, random_state: int = 42):
+        """
+        Initializes the binner.
+
+        Parameters:
+        max_bins (int): Maximum number of bins (or categories) per column, at most 255.
+        subsample (int): Number of rows the quantile thresholds are computed on, for large data.
+        random_state (int): Seed of that subsample.
+        """
+        self.max_bins = max_bins
+        self.subsample = subsample
+        self.random_state = random_state
+
+    def fit(self, X, y=None) -> "FeatureBinner":
+        """
+        Computes the bin thresholds of numeric (and sparse) columns and the categories of object/category columns;
+        only the max_bins most frequent categories of a column are kept, the others are treated as missing.
+        """
+        X = pd.DataFrame(X) if not isinstance(X, pd.DataFrame) else X
+        if not 2 <= self.max_bins <= 255:
+            raise ValueError("max_bins must be between 2 and 255.")
+        rows = np.arange(len(X))
+        if self.subsample is not None and len(X) > self.subsample:
+            rows = np.random.default_rng(self.random_state).choice(len(X), self.subsample, replace=False)
+
+        self.feature_names_in_ = np.array(X.columns, dtype=object)
+        self.categorical_mask_ = np.array([
+            isinstance(dtype, pd.CategoricalDtype) or dtype == object for dtype in X.dtypes
+        ])
+        self.bins_ = []
+        for (_, column), categorical in zip(X.items(), self.categorical_mask_):
+            if categorical:
+                counts = column.value_counts()
+                self.bins_.append(pd.Index(sorted(counts.index[:self.max_bins])))
+                continue
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+            values = values[~np.isnan(values)]
+            distinct = np.unique(values)
+            if len(distinct) <= self.max_bins:
+                thresholds = (distinct[:-1] + distinct[1:]) * 0.5
+            else:
+                percentiles = np.linspace(0, 100, num=self.max_bins + 1)[1:-1]
+                thresholds = np.percentile(values, percentiles, method="midpoint")
+            self.bins_.append(thresholds)
+        return self
+
+    def transform(self, X) -> np.ndarray:
+        """
+        Maps every column to its bin index (numeric) or category code (categorical) as float32; missing values and
+        unknown categories become NaN, which the booster handles natively.
+        """
+        X = pd.DataFrame(X) if not isinstance(X, pd.DataFrame) else X
+        if list(X.columns) != list(self.feature_names_in_):
+            X = X[list(self.feature_names_in_)]
+        X_binned = np.empty((len(X), len(self.bins_)), dtype=np.float32)
+        for j, ((_, column), bins, categorical) in enumerate(zip(X.items(), self.bins_, self.categorical_mask_)):
+            if categorical:
+                codes = bins.get_indexer(column)
+                X_binned[:, j] = np.where(codes >= 0, codes, np.nan)
+            else:
+                values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+                X_binned[:, j] = np.where(np.isnan(values), np.nan, np.searchsorted(bins, values, side="left"))
+        return X_binned
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        return self.feature_names_in_.copy()
+
+
+def fit_pipeline_once(pipeline: Pipeline, X: pd.DataFrame, y: pd.Series) -> Tuple[Pipeline, DesignMatrix]:
+    """
+    Fits a preprocessor + model pipeline with a single pass of the preprocessor, like pipeline.fit, but also
+    returns the transformed design matrix instead of discarding it.
+
+    Parameters:
+    pipeline (Pipeline): A pipeline whose steps are a "preprocessor" followed by a "model".
+    X (pd.DataFrame): The training data features.
+    y (pd.Series): The training data labels/target.
+
+    Returns:
+    Pipeline: The fitted pipeline.
+    DesignMatrix: The training design matrix (dense or CSR) the model was fitted on.
+    """
+    X_design = pipeline.named_steps["preprocessor"].fit_transform(X, y)
+    pipeline.named_steps["model"].fit(X_design, y)
+    return pipeline, X_design
+
+
+# Design Matrix Cache
+# -------------------
+# Fitted preprocessors and their training matrices are stored on disk under a key derived from the unfitted
+# preprocessor's parameters and the content of the raw frame, so training again on the same rows (e.g. another
+# hyperparameter setting or a pipeline rerun) loads them instead of preprocessing again, and changed parameters or
+# data never reuse a stale matrix. A matrix transformed only once (e.g. the test set of one evaluation) is not worth
+# caching: hashing the frame and loading the matrix costs about as much as transforming it.
+class DesignMatrixCache:
+    def __init__(self, directory: str):
+        """
+        Initializes the cache.
+
+        Parameters:
+        directory (str): Directory holding the cached matrices, created on first write.
+        """
+        self.directory = directory
+
+    @staticmethod
+    def key(preprocessor, X: pd.DataFrame) -> str:
+        """
+        Returns the cache key of the preprocessor fitted on X and its matrix.
+        """
+        rows = pd.util.hash_pandas_object(X, index=True).to_numpy()
+        return joblib.hash((preprocessor, X.columns.tolist(), rows))
+
+    def _path(self, key: str, sparse: bool) -> str:
+        return os.path.join(self.directory, f"{key}.{'sparse.npz' if sparse else 'npy'}")
+
+    def get(self, key: str) -> Optional[DesignMatrix]:
+        """
+        Returns the cached matrix, or None when it is not cached.
+        """
+        if os.path.exists(self._path(key, sparse=True)):
+            return sp.load_npz(self._path(key, sparse=True)).tocsr()
+        if os.path.exists(self._path(key, sparse=False)):
+            return np.load(self._path(key, sparse=False))
+        return None
+
+    def put(self, key: str, X_design: DesignMatrix) -> str:
+        """
+        Stores the matrix and returns its path.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if sp.issparse(X_design):
+            path = self._path(key, sparse=True)
+            sp.save_npz(path, sp.csr_matrix(X_design), compressed=False)
+        else:
+            path = self._path(key, sparse=False)
+            np.save(path, np.asarray(X_design))
+        return path
+
+    def fit_transform(self, preprocessor, X: pd.DataFrame, y=None) -> Tuple[Any, DesignMatrix]:
+        """
+        Returns the preprocessor fitted on X and its transform of X. Both are cached under a key of the
+        preprocessor's parameters and X, so refitting on the same rows skips the preprocessing entirely.
+
+        Parameters:
+        preprocessor: The unfitted preprocessor.
+        X (pd.DataFrame): The training data.
+
+        Returns:
+        The fitted preprocessor (a copy loaded from the cache on a hit).
+        DesignMatrix: The transformed training matrix.
+        """
+        key = self.key(preprocessor, X)
+        preprocessor_path = os.path.join(self.directory, f"{key}.preprocessor.joblib")
+        X_design = self.get(key)
+        if X_design is not None and os.path.exists(preprocessor_path):
+            logging.info(f"Loaded the cached fitted preprocessor and design matrix {key}.")
+            return joblib.load(preprocessor_path), X_design
+        X_design = preprocessor.fit_transform(X, y)
+        self.put(key, X_design)
+        joblib.dump(preprocessor, preprocessor_path)
+        logging.info(f"Cached the fitted preprocessor and design matrix {key}.")
+        return preprocessor, X_design
+
+
+# Example usage
+if __name__ == "__main__":
+    # pipeline, X_train_design = fit_pipeline_once(pipeline, X_train, y_train)
+    # cache = DesignMatrixCache("design_matrices")
+    # binner, X_binned = cache.fit_transform(FeatureBinner(), X_train)
+    pass
@@ -1,33 +1,161 @@
+import json
 import logging
 from abc import ABC, abstractmethod
+from typing import Dict, List, Union
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, OneHotEncoder, MinMaxScaler
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 # Abstract Base Class for Feature Engineering Strategy
 # ----------------------------------------------------
 # This class defines a common interface for different feature engineering strategies.
-# Subclasses must implement the apply_transformation method.
+# Subclasses must implement the fit and transform methods; apply_transformation fits and transforms in one go.
 class FeatureEngineeringStrategy(ABC):
     @abstractmethod
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringStrategy":
+        """
+        Abstract method to learn the parameters of the transformation from the (training) DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to learn from.
+
+        Returns:
+        FeatureEngineeringStrategy: The fitted strategy.
+        """
+        pass
+
+    @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Abstract method to apply the fitted transformation to the DataFrame.
+
+        Features missing from the DataFrame (e.g. the target at serving time) are skipped.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: A dataframe with the applied transformations.
+        """
+        pass
+
     def apply_transformation(self, df: pd.DataFrame)->pd.DataFrame:
         """
-        Abstract method to apply feature engineering transformation to the DataFrame.
+        Fits the transformation on the DataFrame and applies it.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
 
         Returns:
         pd.DataFrame: A dataframe with the applied transformations.
-        """        
+        """
+        return self.fit(df).transform(df)
+
+    def apply_to_buffer(self, df: pd.DataFrame, fit: bool = True) -> pd.DataFrame:
+        """
+        Applies the transformation to a buffer owned by a FeatureEngineer plan, without a defensive copy.
+
+        Strategies that change the set of columns return the new frame.
+
+        Parameters:
+        df (pd.DataFrame): The plan's working buffer.
+        fit (bool): Fit the strategy on the buffer before transforming it.
+
+        Returns:
+        pd.DataFrame: The transformed buffer.
+        """
+        if fit:
+            self.fit(df)
+        return self.transform(df)
+
+    def get_params(self) -> dict:
+        """
+        Returns the constructor arguments of the strategy other than its features.
+        """
+        return {}
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the fitted parameters of the strategy as NumPy arrays.
+        """
+        return {}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Restores fitted parameters returned by get_state.
+        """
         pass
 
+# Column-wise Strategy Base
+# -------------------------
+# Column-wise strategies transform each of their features independently, so a FeatureEngineer plan can chain
+# several of them over one column array without building intermediate DataFrames.
+class ColumnwiseFeatureEngineeringStrategy(FeatureEngineeringStrategy):
+    def __init__(self, features):
+        """
+        Initializes the strategy with the specific features to transform.
+
+        Parameters:
+        features (list): The list of features to transform.
+        """
+        self.features = features
+        self._positions = {feature: i for i, feature in enumerate(features)}
+
+    def fit_column(self, feature: str, values: np.ndarray):
+        """
+        Learns the parameters of a single feature. Stateless transformations learn nothing.
+
+        Parameters:
+        feature (str): Name of the feature.
+        values (np.ndarray): float64 values of the feature.
+        """
+        pass
+
+    @abstractmethod
+    def transform_column(self, feature: str, values: np.ndarray) -> np.ndarray:
+        """
+        Abstract method to transform the values of a single feature with its fitted parameters.
+
+        Parameters:
+        feature (str): Name of the feature being transformed.
+        values (np.ndarray): float64 values of the feature; may be modified in place.
+
+        Returns:
+        np.ndarray: The transformed values.
+        """
+        pass
+
+    def column_ops(self, feature: str) -> list:
+        """
+        Describes the fitted transform of a single feature as primitive operations, used to compile a plan
+        into a NumPy-only transform: ("affine", scale, offset) for values * scale + offset, or ("log1p",).
+
+        Parameters:
+        feature (str): Name of the feature.
+
+        Returns:
+        list: The operations, applied in order.
+        """
+        raise TypeError(f"{type(self).__name__} cannot be compiled.")
+
+    def fit(self, df: pd.DataFrame) -> "ColumnwiseFeatureEngineeringStrategy":
+        for feature in self.features:
+            self.fit_column(feature, df[feature].to_numpy(dtype=np.float64))
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        # A shallow copy shares the untouched columns; only the transformed ones get new arrays.
+        df_transformed = df.copy(deep=False)
+        for feature in self.features:
+            if feature in df.columns:
+                df_transformed[feature] = self.transform_column(feature, df[feature].to_numpy(dtype=np.float64, copy=True))
+        return df_transformed
+
 # Concrete Strategy for Log Transformation
 # ----------------------------------------
 # This strategy applies a logarithmic transformation to skewed features to normalize the distribution.
-class LogTransformation(FeatureEngineeringStrategy):
+class LogTransformation(ColumnwiseFeatureEngineeringStrategy):
     def __init__(self, features):
         """
         Initializes the LogTransformation with the specific features to transform.
@@ -35,7 +163,13 @@ class LogTransformation(FeatureEngineeringStrategy):
         Parameters:
         features (list): The list of features to apply the log transformation to.
         """
-        self.features = features
+        super().__init__(features)
+
+    def transform_column(self, feature: str, values: np.ndarray) -> np.ndarray:
+        return np.log1p(values, out=values)
+
+    def column_ops(self, feature: str) -> list:
+        return [("log1p",)]
 
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -47,17 +181,15 @@ class LogTransformation(FeatureEngineeringStrategy):
         Returns:
         pd.DataFrame: The dataframe with log-transformed features.
         """
-        logging.info(f"Applying the lof transformation to features: {self.features}.")
-        df_transformed = df.copy()
-        for feature in self.features:
-            df_transformed[feature]=np.log1p(df[feature])
+        logging.info(f"Applying the log transformation to features: {self.features}.")
+        df_transformed = super().apply_transformation(df)
         logging.info("Log Transformation completed.")
         return df_transformed
 
 # Concrete Strategy for Standard Scaling
 # --------------------------------------
 # This strategy applies standard scaling (z-score normalization) to features, centering them around zero with unit variance.
-class StandardScaling(FeatureEngineeringStrategy):
+class StandardScaling(ColumnwiseFeatureEngineeringStrategy):
     def __init__(self, features):
         """
         Initializes the StandardScaling with the specific features to scale.
@@ -65,8 +197,33 @@ class StandardScaling(FeatureEngineeringStrategy):
         Parameters:
         features (list): The list of features to apply the standard scaling to.
         """
-        self.features = features
-        self.scaler = StandardScaler()
+        super().__init__(features)
+        self.mean_ = np.full(len(features), np.nan)
+        self.scale_ = np.ones(len(features))
+
+    def fit_column(self, feature: str, values: np.ndarray):
+        # Same conventions as sklearn's StandardScaler: population std, NaNs ignored, constant columns unscaled.
+        position = self._positions[feature]
+        scale = np.nanstd(values)
+        self.mean_[position] = np.nanmean(values)
+        self.scale_[position] = 1.0 if scale == 0 or np.isnan(scale) else scale
+
+    def transform_column(self, feature: str, values: np.ndarray) -> np.ndarray:
+        position = self._positions[feature]
+        values -= self.mean_[position]
+        values /= self.scale_[position]
+        return values
+
+    def column_ops(self, feature: str) -> list:
+        position = self._positions[feature]
+        return [("affine", 1.0 / self.scale_[position], -self.mean_[position] / self.scale_[position])]
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        return {"mean": self.mean_, "scale": self.scale_}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        self.mean_ = np.asarray(state["mean"], dtype=np.float64)
+        self.scale_ = np.asarray(state["scale"], dtype=np.float64)
 
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -78,25 +235,145 @@ class StandardScaling(FeatureEngineeringStrategy):
         Returns:
         pd.DataFrame: The dataframe with scaled features.
         """
-        llogging.info(f"Applying Standard Scaler Transformation to features: {self.features}.")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        logging.info(f"Applying Standard Scaler Transformation to features: {self.features}.")
+        df_transformed = super().apply_transformation(df)
         logging.info("Standard Scaler Transformation completed.")
         return df_transformed
-    
+
 # Concrete Strategy for One-Hot Encoding
 # --------------------------------------
 # This strategy applies one-hot encoding to categorical features, converting them into binary vectors.
+# The fitted vocabulary is kept as a hashed category -> column index, so encoding new rows is a lookup, not a refit,
+# and the output can be sparse so wide categoricals do not produce a huge, mostly-zero dense block.
 class OneHotEncoding(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, drop_first=True, sparse=False, missing_category=True):
         """
         Initializes the OneHotEncoding with the specific features to encode.
 
         Parameters:
         features (list): The list of categorical features to apply the one-hot encoding to.
+        drop_first (bool): Drop the column of each feature's first category, as OneHotEncoder(drop="first") does.
+        sparse (bool): Emit pandas sparse columns instead of dense ones.
+        missing_category (bool): Treat missing values seen in fit as a category of their own, sorted last and
+                                 named e.g. 'Alley_nan', as OneHotEncoder does (in Ames, NaN often means "none").
+                                 When False, missing values encode as all zeros.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        self.drop_first = drop_first
+        self.sparse = sparse
+        self.missing_category = missing_category
+        self.categories_ = None
+        self._category_index = None
+
+    def fit(self, df: pd.DataFrame) -> "OneHotEncoding":
+        """
+        Learns the sorted category vocabulary of each feature, followed by NaN when missing_category is set and
+        the feature has missing values.
+        """
+        self.categories_ = []
+        for feature in self.features:
+            column = df[feature]
+            categories = np.sort(np.asarray(column.dropna().unique()))
+            if self.missing_category and column.isna().any():
+                categories = np.append(categories.astype(object if categories.dtype.kind in "OUS" else np.float64),
+                                       np.nan)
+            self.categories_.append(categories)
+        self._build_index()
+        return self
+
+    def _build_index(self):
+        # pd.Index keeps a hash table of its values, built once and reused by every get_indexer call.
+        self._category_index = [pd.Index(categories) for categories in self.categories_]
+        # Position of the NaN category of each feature, or -1 when missing values encode as all zeros.
+        self._missing_position = [
+            len(categories) - 1 if len(categories) and pd.isna(categories[-1]) else -1
+            for categories in self.categories_
+        ]
+
+    def get_feature_names_out(self) -> List[str]:
+        """
+        Returns the names of the encoded columns, in output order.
+        """
+        first = 1 if self.drop_first else 0
+        return [
+            f"{feature}_{category}"
+            for feature, categories in zip(self.features, self.categories_)
+            for category in categories[first:]
+        ]
+
+    def encode(self, df: pd.DataFrame):
+        """
+        Encodes the features present in the DataFrame into a CSR matrix.
+
+        Unknown categories encode as all zeros, as do missing values unless they were fitted as a category.
+
+        Returns:
+        scipy.sparse.csr_matrix: The encoded block.
+        list: The names of its columns.
+        """
+        from scipy import sparse
+
+        if self.categories_ is None:
+            raise ValueError("OneHotEncoding must be fitted before transform.")
+
+        first = 1 if self.drop_first else 0
+        rows, columns, names = [], [], []
+        offset = 0
+        for feature, categories, index, missing_position in zip(self.features, self.categories_,
+                                                                 self._category_index, self._missing_position):
+            if feature not in df.columns:
+                continue
+            values = df[feature].to_numpy()
+            positions = index.get_indexer(values)
+            # None and NaN are both missing, but the index only matches NaN itself.
+            positions[pd.isna(values)] = missing_position
+            present = positions >= first
+            rows.append(np.flatnonzero(present))
+            columns.append(positions[present] - first + offset)
+            names.extend(f"{feature}_{category}" for category in categories[first:])
+            offset += len(categories) - first
+
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        columns = np.concatenate(columns) if columns else np.empty(0, dtype=np.int64)
+        matrix = sparse.csr_matrix((np.ones(len(rows)), (rows, columns)), shape=(len(df), offset))
+        return matrix, names
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces each feature with one 0/1 column per category of its vocabulary.
+
+        Unknown categories encode as all zeros, as do missing values unless they were fitted as a category.
+        """
+        matrix, names = self.encode(df)
+        if self.sparse:
+            encoded_df = pd.DataFrame.sparse.from_spmatrix(matrix, index=df.index, columns=names)
+        else:
+            encoded_df = pd.DataFrame(matrix.toarray(), index=df.index, columns=names)
+        features = [feature for feature in self.features if feature in df.columns]
+        return pd.concat([df.drop(columns=features), encoded_df], axis=1)
+
+    def get_params(self) -> dict:
+        return {"drop_first": self.drop_first, "sparse": self.sparse, "missing_category": self.missing_category}
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        # Object arrays would need pickle to be saved, so string vocabularies are stored as unicode arrays, without
+        # their NaN category (which would become the string 'nan'); a flag per feature records it instead.
+        state = {"has_missing": np.array([position >= 0 for position in self._missing_position])}
+        for i, (categories, position) in enumerate(zip(self.categories_, self._missing_position)):
+            known = categories[:position] if position >= 0 else categories
+            state[f"categories.{i}"] = known.astype(str) if known.dtype == object else known
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        has_missing = state.get("has_missing", np.zeros(len(self.features), dtype=bool))
+        self.categories_ = []
+        for i in range(len(self.features)):
+            categories = np.asarray(state[f"categories.{i}"])
+            if has_missing[i]:
+                categories = np.append(categories.astype(object if categories.dtype.kind in "OUS" else np.float64),
+                                       np.nan)
+            self.categories_.append(categories)
+        self._build_index()
 
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -109,20 +386,14 @@ class OneHotEncoding(FeatureEngineeringStrategy):
         pd.DataFrame: The dataframe with one-hot encoded features.
         """
         logging.info(f"Applying one-hot encoding to features: {self.features}")
-        df_transformed = df.copy()
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features),
-        )
-        df_transformed = df_transformed.drop(columns=self.features).reset_index(drop=True)
-        df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
+        df_transformed = super().apply_transformation(df)
         logging.info("One-hot encoding completed.")
         return df_transformed
 
 # Concrete Strategy for Min-Max Scaling
 # -------------------------------------
 # This strategy applies Min-Max scaling to features, scaling them to a specified range, typically [0, 1].
-class MinMaxScaling(FeatureEngineeringStrategy):
+class MinMaxScaling(ColumnwiseFeatureEngineeringStrategy):
     def __init__(self, features, feature_range=(0, 1)):
         """
         Initializes the MinMaxScaling with the specific features to scale and the target range.
@@ -131,8 +402,39 @@ class MinMaxScaling(FeatureEngineeringStrategy):
         features (list): The list of features to apply the Min-Max scaling to.
         feature_range (tuple): The target range for scaling, default is (0, 1).
         """
-        self.features = features
-        self.scaler = MinMaxScaler(feature_range=feature_range)
+        super().__init__(features)
+        self.feature_range = tuple(feature_range)
+        self.scale_ = np.ones(len(features))
+        self.min_ = np.zeros(len(features))
+
+    def fit_column(self, feature: str, values: np.ndarray):
+        # Same conventions as sklearn's MinMaxScaler: NaNs ignored, constant columns mapped to the range minimum.
+        position = self._positions[feature]
+        low, high = self.feature_range
+        data_min = np.nanmin(values)
+        data_range = np.nanmax(values) - data_min
+        self.scale_[position] = (high - low) / (data_range if data_range != 0 else 1.0)
+        self.min_[position] = low - data_min * self.scale_[position]
+
+    def transform_column(self, feature: str, values: np.ndarray) -> np.ndarray:
+        position = self._positions[feature]
+        values *= self.scale_[position]
+        values += self.min_[position]
+        return values
+
+    def column_ops(self, feature: str) -> list:
+        position = self._positions[feature]
+        return [("affine", self.scale_[position], self.min_[position])]
+
+    def get_params(self) -> dict:
+        return {"feature_range": list(self.feature_range)}
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        return {"scale": self.scale_, "min": self.min_}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        self.scale_ = np.asarray(state["scale"], dtype=np.float64)
+        self.min_ = np.asarray(state["min"], dtype=np.float64)
 
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -145,39 +447,198 @@ class MinMaxScaling(FeatureEngineeringStrategy):
         pd.DataFrame: The dataframe with Min-Max scaled features.
         """
         logging.info(
-            f"Applying Min-Max scaling to features: {self.features} with range {self.scaler.feature_range}"
+            f"Applying Min-Max scaling to features: {self.features} with range {self.feature_range}"
         )
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed = super().apply_transformation(df)
         logging.info("Min-Max scaling completed.")
         return df_transformed
-    
+
+# Concrete Strategy for Feature Hashing
+# -------------------------------------
+# This strategy maps "feature=value" tokens of categorical features into a fixed number of buckets with the hashing trick.
+# It keeps no vocabulary, so it needs no fitting, its width does not grow with the cardinality of the features and
+# categories never seen before are encoded like any other.
+class HashingEncoding(FeatureEngineeringStrategy):
+    def __init__(self, features, n_buckets=1024, signed=True, sparse=True, prefix="hashed"):
+        """
+        Initializes the HashingEncoding with the specific features to encode.
+
+        Parameters:
+        features (list): The list of categorical features to hash.
+        n_buckets (int): Number of output columns shared by all the features.
+        signed (bool): Give each token a +1/-1 sign from its hash so collisions tend to cancel out instead of adding up.
+        sparse (bool): Emit pandas sparse columns instead of dense ones.
+        prefix (str): Prefix of the output column names, f"{prefix}_{bucket}".
+        """
+        self.features = features
+        self.n_buckets = int(n_buckets)
+        self.signed = signed
+        self.sparse = sparse
+        self.prefix = prefix
+
+    def fit(self, df: pd.DataFrame) -> "HashingEncoding":
+        """
+        Nothing to learn: the encoding is fully defined by the hash function and n_buckets.
+        """
+        return self
+
+    def get_feature_names_out(self) -> List[str]:
+        """
+        Returns the names of the hashed columns, in output order.
+        """
+        return [f"{self.prefix}_{bucket}" for bucket in range(self.n_buckets)]
+
+    def encode(self, df: pd.DataFrame):
+        """
+        Hashes the features present in the DataFrame into a CSR matrix.
+
+        Buckets and signs follow sklearn's FeatureHasher (signed 32-bit MurmurHash3 with seed 0). Each distinct
+        value of a column is hashed once and broadcast to its rows. Missing values are skipped.
+
+        Returns:
+        scipy.sparse.csr_matrix: The encoded block.
+        """
+        from scipy import sparse
+        from sklearn.utils import murmurhash3_32
+
+        rows, columns, data = [], [], []
+        for feature in self.features:
+            if feature not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[feature], use_na_sentinel=True)
+            hashes = np.fromiter(
+                (murmurhash3_32(f"{feature}={value}", seed=0) for value in uniques),
+                dtype=np.int64, count=len(uniques),
+            )
+            present = codes >= 0
+            token_hashes = hashes[codes[present]]
+            rows.append(np.flatnonzero(present))
+            columns.append(np.abs(token_hashes) % self.n_buckets)
+            data.append(np.where(token_hashes >= 0, 1.0, -1.0) if self.signed else np.ones(len(token_hashes)))
+
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        columns = np.concatenate(columns) if columns else np.empty(0, dtype=np.int64)
+        data = np.concatenate(data) if data else np.empty(0)
+        # Duplicate (row, bucket) entries from collisions are summed by the conversion.
+        return sparse.coo_matrix((data, (rows, columns)), shape=(len(df), self.n_buckets)).tocsr()
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the features with the n_buckets hashed columns.
+        """
+        matrix = self.encode(df)
+        names = self.get_feature_names_out()
+        if self.sparse:
+            encoded_df = pd.DataFrame.sparse.from_spmatrix(matrix, index=df.index, columns=names)
+        else:
+            encoded_df = pd.DataFrame(matrix.toarray(), index=df.index, columns=names)
+        features = [feature for feature in self.features if feature in df.columns]
+        return pd.concat([df.drop(columns=features), encoded_df], axis=1)
+
+    def get_params(self) -> dict:
+        return {"n_buckets": self.n_buckets, "signed": self.signed, "sparse": self.sparse, "prefix": self.prefix}
+
+    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies feature hashing to the specified categorical features in the DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with the hashed features.
+        """
+        logging.info(f"Applying feature hashing to features: {self.features} with {self.n_buckets} buckets")
+        df_transformed = super().apply_transformation(df)
+        logging.info("Feature hashing completed.")
+        return df_transformed
+
+def sparse_frame_to_csr(X: pd.DataFrame):
+    """
+    Converts a DataFrame of pandas sparse columns (e.g. from OneHotEncoding(sparse=True) or HashingEncoding) to a CSR matrix
+    without densifying it. Used as a FunctionTransformer inside model pipelines.
+    """
+    return X.sparse.to_coo().tocsr()
+
+# Strategies that FeatureEngineer.load can rebuild from a saved plan
+FEATURE_ENGINEERING_STRATEGIES = {
+    strategy.__name__: strategy
+    for strategy in (LogTransformation, StandardScaling, MinMaxScaling, OneHotEncoding, HashingEncoding)
+}
+
 # Context Class for Feature Engineering
 # -------------------------------------
-# This class uses a FeatureEngineeringStrategy to apply transformations to a dataset.
+# This class uses one or an ordered list of FeatureEngineeringStrategy objects to apply transformations to a dataset.
+# The strategies are compiled into an execution plan: consecutive column-wise strategies are fused into one stage
+# that runs each touched column through its whole chain of transforms in a single pass, and strategies that change
+# the set of columns (e.g. one-hot encoding) run as their own stage on the same buffer.
 class FeatureEngineer:
-    def __init__(self, strategy: FeatureEngineeringStrategy):
+    def __init__(self, strategy: Union[FeatureEngineeringStrategy, List[FeatureEngineeringStrategy]],
+                 inplace: bool = False):
         """
-        Initializes the FeatureEngineer with a specific feature engineering strategy.
+        Initializes the FeatureEngineer with a specific feature engineering strategy or an ordered list of them.
 
         Parameters:
-        strategy (FeatureEngineeringStrategy): The strategy to be used for feature engineering.
+        strategy (FeatureEngineeringStrategy or list): The strategy, or strategies in order, to be used for feature engineering.
+        inplace (bool): Transform the input DataFrame's columns in place instead of a shallow copy of it.
         """
-        self._strategy = strategy
+        self.inplace = inplace
+        self.set_strategy(strategy)
 
-    def set_strategy(self, strategy: FeatureEngineeringStrategy):
+    def set_strategy(self, strategy: Union[FeatureEngineeringStrategy, List[FeatureEngineeringStrategy]]):
         """
-        Sets a new strategy for the FeatureEngineer.
+        Sets a new strategy, or ordered list of strategies, for the FeatureEngineer.
 
         Parameters:
-        strategy (FeatureEngineeringStrategy): The new strategy to be used for feature engineering.
+        strategy (FeatureEngineeringStrategy or list): The new strategy, or strategies in order, to be used for feature engineering.
         """
         logging.info("Switching feature engineering strategy.")
-        self._strategy = strategy
+        self._strategies = list(strategy) if isinstance(strategy, (list, tuple)) else [strategy]
+        self._plan = self._compile(self._strategies)
+
+    @staticmethod
+    def _compile(strategies: List[FeatureEngineeringStrategy]) -> list:
+        """
+        Compiles the strategies into stages: dicts mapping each column to its chain of column-wise strategies,
+        or single strategies that rebuild the frame.
+        """
+        plan = []
+        for strategy in strategies:
+            if isinstance(strategy, ColumnwiseFeatureEngineeringStrategy):
+                if not plan or not isinstance(plan[-1], dict):
+                    plan.append({})
+                for feature in strategy.features:
+                    plan[-1].setdefault(feature, []).append(strategy)
+            else:
+                plan.append(strategy)
+        return plan
+
+    def _run(self, df: pd.DataFrame, fit: bool) -> pd.DataFrame:
+        """
+        Executes the plan, fitting each strategy on the values it receives when fit is True.
+        """
+        # Without inplace a shallow copy is enough: only the columns a stage touches get new arrays.
+        buffer = df if self.inplace else df.copy(deep=False)
+        for stage in self._plan:
+            if isinstance(stage, dict):
+                for feature, chain in stage.items():
+                    if feature not in buffer.columns:
+                        if fit:
+                            raise KeyError(f"Feature '{feature}' not found in the DataFrame.")
+                        continue
+                    values = buffer[feature].to_numpy(dtype=np.float64, copy=True)
+                    for strategy in chain:
+                        if fit:
+                            strategy.fit_column(feature, values)
+                        values = strategy.transform_column(feature, values)
+                    buffer[feature] = values
+            else:
+                buffer = stage.apply_to_buffer(buffer, fit=fit)
+        return buffer
 
     def apply_feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Executes the feature engineering transformation using the current strategy.
+        Fits the feature engineering plan on the DataFrame and applies it.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -185,8 +646,81 @@ class FeatureEngineer:
         Returns:
         pd.DataFrame: The dataframe with applied feature engineering transformations.
         """
-        logging.info("Applying feature engineering strategy.")
-        return self._strategy.apply_transformation(df)
+        logging.info(f"Applying feature engineering plan of {len(self._strategies)} strategies in {len(self._plan)} stages.")
+        buffer = self._run(df, fit=True)
+        logging.info("Feature engineering plan completed.")
+        return buffer
+
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineer":
+        """
+        Fits every strategy of the plan on the (training) DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        FeatureEngineer: The fitted FeatureEngineer.
+        """
+        logging.info(f"Fitting feature engineering plan of {len(self._strategies)} strategies.")
+        # Fitting never modifies the caller's DataFrame, even with inplace.
+        self._run(df.copy(deep=False), fit=True)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted plan without refitting, e.g. to test data or serving requests.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with applied feature engineering transformations.
+        """
+        return self._run(df, fit=False)
+
+    def save(self, path: str):
+        """
+        Saves the fitted plan as a NumPy .npz archive: the strategies' parameters as arrays, category
+        vocabularies as unicode arrays and the plan itself as a JSON string. No pickling is involved.
+
+        Parameters:
+        path (str): Destination file.
+        """
+        spec = []
+        arrays = {}
+        for i, strategy in enumerate(self._strategies):
+            spec.append({
+                "strategy": type(strategy).__name__,
+                "features": list(strategy.features),
+                "params": strategy.get_params(),
+            })
+            arrays.update({f"{i}.{key}": value for key, value in strategy.get_state().items()})
+        with open(path, "wb") as f:
+            np.savez(f, __plan__=np.array(json.dumps(spec)), **arrays)
+
+    @classmethod
+    def load(cls, path: str, inplace: bool = False) -> "FeatureEngineer":
+        """
+        Loads a fitted plan saved with save().
+
+        Parameters:
+        path (str): File written by save().
+        inplace (bool): Transform the input DataFrame's columns in place.
+
+        Returns:
+        FeatureEngineer: The fitted FeatureEngineer, ready to transform.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            spec = json.loads(str(archive["__plan__"]))
+            strategies = []
+            for i, entry in enumerate(spec):
+                strategy = FEATURE_ENGINEERING_STRATEGIES[entry["strategy"]](entry["features"], **entry["params"])
+                prefix = f"{i}."
+                strategy.set_state({
+                    key[len(prefix):]: archive[key] for key in archive.files if key.startswith(prefix)
+                })
+                strategies.append(strategy)
+        return cls(strategies, inplace=inplace)
 
 # Example usage
 if __name__ == "__main__":
@@ -209,4 +743,17 @@ if __name__ == "__main__":
     # onehot_encoder = FeatureEngineer(OneHotEncoding(features=['Neighborhood']))
     # df_onehot_encoded = onehot_encoder.apply_feature_engineering(df)
 
-    pass
\ No newline at end of file
+    # Feature Hashing Example (fixed width, no vocabulary)
+    # hasher = FeatureEngineer(HashingEncoding(features=['Neighborhood', 'Exterior 1st'], n_buckets=64))
+    # df_hashed = hasher.apply_feature_engineering(df)
+
+    # Chained Plan Example (log then standard scaling in one pass over each column)
+    # feature_plan = FeatureEngineer([LogTransformation(['Gr Liv Area']), StandardScaling(['Gr Liv Area', 'Lot Area'])])
+    # df_engineered = feature_plan.apply_feature_engineering(df)
+
+    # Fit on training data, save, and apply the saved parameters at inference
+    # feature_plan.fit(train_df).save('feature_state.npz')
+    # serving_plan = FeatureEngineer.load('feature_state.npz')
+    # df_request = serving_plan.transform(request_df)
+
+    pass
@@ -1,9 +1,33 @@
 from abc import ABC, abstractmethod
+import json
 import logging
+from typing import Callable, Iterable, Iterator
+import numpy as np
 import pandas as pd
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def can_hold(dtype, value) -> bool:
+    """
+    Returns whether a column of the given dtype can be filled with value without raising or changing its dtype
+    (categorical columns are extended with the value in FillingMissingValuesStrategy.transform).
+    """
+    if isinstance(dtype, pd.CategoricalDtype) or dtype == object:
+        return True
+    if isinstance(dtype, pd.StringDtype):
+        return isinstance(value, str)
+    if pd.api.types.is_bool_dtype(dtype):
+        return isinstance(value, (bool, np.bool_))
+    if isinstance(value, (bool, np.bool_, str)) or not isinstance(value, (int, float, np.number)):
+        return False
+    if pd.api.types.is_integer_dtype(dtype):
+        info = np.iinfo(dtype.numpy_dtype if hasattr(dtype, "numpy_dtype") else dtype)
+        return float(value).is_integer() and info.min <= value <= info.max
+    return pd.api.types.is_float_dtype(dtype)
+
+
 class MissingValueHandlingStrategy(ABC):
     @abstractmethod
     def handle(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -18,6 +42,30 @@ class MissingValueHandlingStrategy(ABC):
         """
         pass
 
+    def fit(self, df: pd.DataFrame) -> "MissingValueHandlingStrategy":
+        """
+        Learns whatever the strategy needs from the (training) DataFrame. Stateless strategies learn nothing.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to learn from.
+
+        Returns:
+        MissingValueHandlingStrategy: The fitted strategy.
+        """
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Handles missing values using what was learned in fit.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values handled.
+        """
+        return self.handle(df)
+
 class DropMissingValuesStrategy(MissingValueHandlingStrategy):
     def __init__(self, axis=0, thresh=0):
         """
@@ -52,42 +100,541 @@ class FillingMissingValuesStrategy(MissingValueHandlingStrategy):
 
         Parameters:
         method (str): The method to fill missing values ('mean', 'median', 'mode', or 'constant').
-        fill_value (any): The constant value to fill missing values when method='constant'.
+        fill_value (any): The constant value to fill missing values when method='constant', or a {column: value}
+                          mapping. A single value only fills the columns whose dtype can hold it.
         """
         self.method = method
         self.fill_value = fill_value
-    def handle(self, df):
+        self.fill_values_ = None
+
+    def fit(self, df: pd.DataFrame) -> "FillingMissingValuesStrategy":
         """
-        Fills missing values using the specified method or constant value.
+        Computes the fill value of every column in one vectorized pass over the DataFrame.
 
         Parameters:
-        df (pd.DataFrame): The input DataFrame containing missing values.
+        df (pd.DataFrame): The (training) DataFrame the statistics are computed on.
 
         Returns:
-        pd.DataFrame: The DataFrame with missing values filled.
+        FillingMissingValuesStrategy: The fitted strategy.
         """
-        df_cleaned = df.copy()
         if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].mean())
+            statistics = df.select_dtypes(include="number").mean()
 
         elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].median())
+            statistics = df.select_dtypes(include="number").median()
 
         elif self.method == "mode":
-            for column in df.columns:
-                df_cleaned[column].fillna(df_cleaned[column].mode().iloc[0], inplace=True)
-        
+            statistics = df.mode(dropna=True).iloc[0]
+
         elif self.method == "constant":
-            df_cleaned.fillna(self.fill_value)
-        
+            if isinstance(self.fill_value, dict):
+                invalid = [
+                    column for column, value in self.fill_value.items()
+                    if column in df.columns and not can_hold(df[column].dtype, value)
+                ]
+                if invalid:
+                    raise ValueError(f"Fill values do not fit the dtype of columns {invalid}.")
+                fill_values = {column: value for column, value in self.fill_value.items() if column in df.columns}
+            else:
+                fill_values = {
+                    column: self.fill_value for column, dtype in df.dtypes.items() if can_hold(dtype, self.fill_value)
+                }
+                skipped = [column for column in df.columns if column not in fill_values]
+                if skipped:
+                    logging.info(f"Constant {self.fill_value!r} does not fit the dtype of {skipped}; left unfilled.")
+            statistics = pd.Series(fill_values, dtype=object)
+
         else:
             logging.warning(f"Unknown method {self.method}. No missing values handled.")
-        
+            statistics = pd.Series(dtype=object)
+
+        self.fill_values_ = {
+            column: value.item() if isinstance(value, np.generic) else value
+            for column, value in statistics.items() if not pd.isna(value)
+        }
+        logging.info(f"Computed '{self.method}' fill values for {len(self.fill_values_)} columns.")
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values with the fill values computed in fit, without recomputing any statistics.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values filled.
+        """
+        if self.fill_values_ is None:
+            raise ValueError("FillingMissingValuesStrategy must be fitted before transform.")
+
+        fill_values = {column: value for column, value in self.fill_values_.items() if column in df.columns}
+        # A categorical column can only be filled with one of its categories.
+        extended = {
+            column: df[column].cat.add_categories([value]) for column, value in fill_values.items()
+            if isinstance(df[column].dtype, pd.CategoricalDtype) and value not in df[column].cat.categories
+        }
+        if extended:
+            df = df.assign(**extended)
+
+        df_cleaned = df.fillna(fill_values)
         logging.info("Missing values filled.")
         return df_cleaned
+
+    def handle(self, df):
+        """
+        Fills missing values using the specified method or constant value, computed on the given DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values filled.
+        """
+        return self.fit(df).transform(df)
+
+    def save(self, path: str):
+        """
+        Saves the fitted fill values as a small JSON artifact.
+
+        Parameters:
+        path (str): Destination file.
+        """
+        if self.fill_values_ is None:
+            raise ValueError("FillingMissingValuesStrategy must be fitted before it is saved.")
+        with open(path, "w") as f:
+            json.dump({
+                "strategy": type(self).__name__,
+                "method": self.method,
+                "fill_value": self.fill_value,
+                "fill_values": self.fill_values_,
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "FillingMissingValuesStrategy":
+        """
+        Loads a fitted strategy saved with save().
+
+        Parameters:
+        path (str): File written by save().
+
+        Returns:
+        FillingMissingValuesStrategy: The fitted strategy, ready to transform.
+        """
+        with open(path) as f:
+            state = json.load(f)
+        strategy = cls(method=state["method"], fill_value=state["fill_value"])
+        strategy.fill_values_ = state["fill_values"]
+        return strategy
     
+class RunningMoments:
+    def __init__(self, n_columns: int):
+        """
+        Initializes mergeable per-column count, mean and sum of squared deviations (Welford/Chan).
+
+        Parameters:
+        n_columns (int): Number of columns tracked.
+        """
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+
+    def update(self, values: np.ndarray):
+        """
+        Folds a 2D block of values (rows x columns, NaN for missing) into the running statistics.
+        """
+        count = np.sum(~np.isnan(values), axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, np.nansum(values, axis=0) / np.maximum(count, 1), 0.0)
+        m2 = np.nansum((values - mean) ** 2, axis=0)
+        self._merge(count, mean, m2)
+
+    def merge(self, other: "RunningMoments"):
+        """
+        Merges the statistics of another RunningMoments, e.g. computed on another shard.
+        """
+        self._merge(other.count, other.mean, other.m2)
+
+    def _merge(self, count, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(total > 0, count / np.maximum(total, 1), 0.0)
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * weight
+        self.count = total
+
+    def variance(self) -> np.ndarray:
+        """
+        Returns the sample variance of each column.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+
+
+class QuantileSketch:
+    def __init__(self, k: int = 256, seed: int = 42):
+        """
+        Initializes a mergeable KLL-style quantile sketch.
+
+        Values are kept in levels; level h holds values of weight 2**h and a level that grows past k is sorted
+        and every other value (random offset) is promoted to the next level. Memory is O(k log(n / k)).
+
+        Parameters:
+        k (int): Capacity of each level; larger values give more accurate quantiles.
+        seed (int): Seed for the random offsets used when compacting.
+        """
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """
+        Adds a 1D array of non-missing values to the sketch.
+        """
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compact()
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Merges another sketch into this one.
+        """
+        for height, level in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[height] = np.concatenate([self.levels[height], level])
+        self._compact()
+
+    def _compact(self):
+        height = 0
+        while height < len(self.levels):
+            level = self.levels[height]
+            if len(level) > self.k:
+                level = np.sort(level)
+                # An odd value out stays on this level so the total weight is preserved exactly.
+                leftover, level = level[: len(level) % 2], level[len(level) % 2:]
+                promoted = level[self._rng.integers(2)::2]
+                self.levels[height] = leftover
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+            height += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the approximate q-quantile of the values seen, or NaN if none were seen.
+        """
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return np.nan
+        weights = np.concatenate([np.full(len(level), 2.0 ** height) for height, level in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        return float(values[order][np.searchsorted(cumulative, q * cumulative[-1])])
+
+
+class HeavyHitters:
+    def __init__(self, capacity: int = 64):
+        """
+        Initializes a mergeable Misra-Gries heavy-hitters summary.
+
+        At most `capacity` counters are kept; any value occurring more than n / (capacity + 1) times is guaranteed
+        to be tracked, so the most frequent value is found whenever it is a heavy hitter.
+
+        Parameters:
+        capacity (int): Maximum number of counters kept.
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+
+    def update(self, series: pd.Series):
+        """
+        Counts the non-missing values of a chunk and folds them into the summary.
+        """
+        counts = series.value_counts(dropna=True)
+        self._merge(counts[counts > 0])
+
+    def merge(self, other: "HeavyHitters"):
+        """
+        Merges another summary into this one.
+        """
+        self._merge(other.counts)
+
+    def _merge(self, counts: pd.Series):
+        merged = self.counts.add(counts.astype("int64"), fill_value=0).astype("int64")
+        if len(merged) > self.capacity:
+            # Subtract the (capacity + 1)-th largest count and drop the counters that reach zero.
+            threshold = merged.nlargest(self.capacity + 1).iloc[-1]
+            merged = merged - threshold
+            merged = merged[merged > 0]
+        self.counts = merged
+
+    def most_frequent(self):
+        """
+        Returns the most frequent value seen, or NaN if none were seen.
+        """
+        if len(self.counts) == 0:
+            return np.nan
+        return self.counts.idxmax()
+
+
+class StreamingFillingMissingValuesStrategy(FillingMissingValuesStrategy):
+    def __init__(self, method="mean", fill_value=None, sketch_size: int = 256, heavy_hitters: int = 64):
+        """
+        Initializes a FillingMissingValuesStrategy whose statistics are computed in one streaming pass over chunks,
+        so memory stays flat regardless of the dataset size.
+
+        Means come from running (Welford) moments, medians from a mergeable quantile sketch and modes from a
+        bounded Misra-Gries heavy-hitters summary. Fitted fill values are applied and saved like the in-memory
+        strategy.
+
+        Parameters:
+        method (str): The method to fill missing values ('mean', 'median', 'mode', or 'constant').
+        fill_value (any): The constant value to fill missing values when method='constant', or a {column: value}
+                          mapping. A single value only fills the columns whose dtype can hold it.
+        sketch_size (int): Level capacity of the quantile sketch used for medians.
+        heavy_hitters (int): Number of counters kept per column for modes.
+        """
+        super().__init__(method=method, fill_value=fill_value)
+        self.sketch_size = sketch_size
+        self.heavy_hitters = heavy_hitters
+
+    def fit(self, df: pd.DataFrame) -> "StreamingFillingMissingValuesStrategy":
+        return self.fit_chunks([df])
+
+    def fit_chunks(self, chunks: Iterable[pd.DataFrame]) -> "StreamingFillingMissingValuesStrategy":
+        """
+        Computes the fill value of every column in a single pass over the chunks.
+
+        Parameters:
+        chunks (Iterable[pd.DataFrame]): Chunks of the (training) dataset, all with the same columns.
+
+        Returns:
+        StreamingFillingMissingValuesStrategy: The fitted strategy.
+        """
+        if self.method not in ("mean", "median", "mode"):
+            # Constant fills need no statistics beyond the column names.
+            first = next(iter(chunks))
+            return super().fit(first.iloc[:0])
+
+        columns = None
+        n_rows = 0
+        for chunk in chunks:
+            if columns is None:
+                columns = (
+                    list(chunk.columns) if self.method == "mode"
+                    else list(chunk.select_dtypes(include="number").columns)
+                )
+                moments = RunningMoments(len(columns))
+                sketches = {column: QuantileSketch(self.sketch_size) for column in columns}
+                counters = {column: HeavyHitters(self.heavy_hitters) for column in columns}
+
+            if self.method == "mean":
+                moments.update(chunk[columns].to_numpy(dtype=np.float64, na_value=np.nan))
+            elif self.method == "median":
+                for column in columns:
+                    values = chunk[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                    sketches[column].update(values[~np.isnan(values)])
+            else:
+                for column in columns:
+                    counters[column].update(chunk[column])
+            n_rows += len(chunk)
+
+        if columns is None:
+            raise ValueError("No chunks to fit the missing value statistics on.")
+
+        if self.method == "mean":
+            statistics = dict(zip(columns, np.where(moments.count > 0, moments.mean, np.nan)))
+        elif self.method == "median":
+            statistics = {column: sketch.quantile(0.5) for column, sketch in sketches.items()}
+        else:
+            statistics = {column: counter.most_frequent() for column, counter in counters.items()}
+
+        self.fill_values_ = {
+            column: value.item() if isinstance(value, np.generic) else value
+            for column, value in statistics.items() if not pd.isna(value)
+        }
+        logging.info(f"Computed streaming '{self.method}' fill values for {len(self.fill_values_)} columns over {n_rows} rows.")
+        return self
+
+    def transform_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Fills the missing values of each chunk with the fitted fill values.
+
+        Parameters:
+        chunks (Iterable[pd.DataFrame]): Chunks of the dataset to fill.
+
+        Returns:
+        Iterator[pd.DataFrame]: The filled chunks.
+        """
+        for chunk in chunks:
+            yield self.transform(chunk)
+
+class GroupedFillingMissingValuesStrategy(MissingValueHandlingStrategy):
+    def __init__(self, group_by="Neighborhood", method="mean", columns=None, min_group_size=5):
+        """
+        Initializes the GroupedFillingMissingValuesStrategy, which fills numeric columns with per-group statistics.
+
+        Parameters:
+        group_by (str): Column whose values define the groups, e.g. 'Neighborhood' or 'MS SubClass'.
+        method (str): The statistic used per group ('mean' or 'median').
+        columns (list): Columns to fill. Defaults to every numeric column except group_by.
+        min_group_size (int): Groups with fewer non-missing values than this fall back to the global statistic.
+        """
+        self.group_by = group_by
+        self.method = method
+        self.columns = columns
+        self.min_group_size = min_group_size
+        self.groups_ = None
+        self.table_ = None
+
+    def fit(self, df: pd.DataFrame) -> "GroupedFillingMissingValuesStrategy":
+        """
+        Builds the index of per-group statistics in one groupby pass.
+
+        The fitted table has one row per group plus a last row holding the global statistic, and small groups
+        already hold the global value, so transform is a single positional lookup per column.
+
+        Parameters:
+        df (pd.DataFrame): The (training) DataFrame the statistics are computed on.
+
+        Returns:
+        GroupedFillingMissingValuesStrategy: The fitted strategy.
+        """
+        if self.method not in ("mean", "median"):
+            raise ValueError(f"Unsupported grouped fill method {self.method}.")
+
+        columns = self.columns
+        if columns is None:
+            columns = [column for column in df.select_dtypes(include="number").columns if column != self.group_by]
+
+        grouped = df.groupby(self.group_by, observed=True, sort=True)[columns]
+        group_values = grouped.agg(self.method)
+        group_counts = grouped.count()
+        global_values = df[columns].agg(self.method)
+
+        # Small groups fall back to the global statistic.
+        group_values = group_values.where(group_counts >= self.min_group_size)
+        group_values = group_values.fillna(global_values)
+
+        self.groups_ = pd.Index(group_values.index)
+        self.table_ = {
+            column: np.append(group_values[column].to_numpy(dtype=np.float64), global_values[column])
+            for column in columns if not pd.isna(global_values[column])
+        }
+        logging.info(
+            f"Computed '{self.method}' fill values of {len(self.table_)} columns for {len(self.groups_)} "
+            f"'{self.group_by}' groups."
+        )
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values from the fitted group statistics with one vectorized lookup per column.
+
+        Unseen or missing groups get the global statistic.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values filled.
+        """
+        if self.table_ is None:
+            raise ValueError("GroupedFillingMissingValuesStrategy must be fitted before transform.")
+
+        # -1 for unseen groups selects the last entry of each table, the global statistic.
+        positions = self.groups_.get_indexer(df[self.group_by])
+
+        df_cleaned = df.copy()
+        for column, table in self.table_.items():
+            if column not in df_cleaned.columns:
+                continue
+            values = df_cleaned[column].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            missing = np.isnan(values)
+            if missing.any():
+                values[missing] = table[positions[missing]]
+                # Keep narrowed float widths, e.g. float32 from the ingestion schema.
+                dtype = df_cleaned[column].dtype
+                df_cleaned[column] = values.astype(dtype) if pd.api.types.is_float_dtype(dtype) else values
+        logging.info(f"Missing values filled by '{self.group_by}' group.")
+        return df_cleaned
+
+    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values with per-group statistics computed on the given DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values filled.
+        """
+        return self.fit(df).transform(df)
+
+    def save(self, path: str):
+        """
+        Saves the fitted group statistics index as a small JSON artifact.
+
+        Parameters:
+        path (str): Destination file.
+        """
+        if self.table_ is None:
+            raise ValueError("GroupedFillingMissingValuesStrategy must be fitted before it is saved.")
+        state = {
+            "strategy": type(self).__name__,
+            "group_by": self.group_by,
+            "method": self.method,
+            "min_group_size": self.min_group_size,
+            "groups": [group.item() if isinstance(group, np.generic) else group for group in self.groups_],
+            "table": {column: table.tolist() for column, table in self.table_.items()},
+        }
+        with open(path, "w") as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, path: str) -> "GroupedFillingMissingValuesStrategy":
+        """
+        Loads a fitted strategy saved with save().
+
+        Parameters:
+        path (str): File written by save().
+
+        Returns:
+        GroupedFillingMissingValuesStrategy: The fitted strategy, ready to transform.
+        """
+        with open(path) as f:
+            state = json.load(f)
+        strategy = cls(
+            group_by=state["group_by"], method=state["method"], columns=list(state["table"]),
+            min_group_size=state["min_group_size"],
+        )
+        strategy.groups_ = pd.Index(state["groups"])
+        strategy.table_ = {column: np.asarray(table, dtype=np.float64) for column, table in state["table"].items()}
+        return strategy
+
+
+def load_missing_value_strategy(path: str) -> MissingValueHandlingStrategy:
+    """
+    Loads a fitted missing value strategy from the artifact written by its save() method.
+
+    Parameters:
+    path (str): File written by save().
+
+    Returns:
+    MissingValueHandlingStrategy: The fitted strategy, ready to transform.
+    """
+    with open(path) as f:
+        name = json.load(f).get("strategy", "FillingMissingValuesStrategy")
+    strategies = {
+        "FillingMissingValuesStrategy": FillingMissingValuesStrategy,
+        "StreamingFillingMissingValuesStrategy": StreamingFillingMissingValuesStrategy,
+        "GroupedFillingMissingValuesStrategy": GroupedFillingMissingValuesStrategy,
+    }
+    if name not in strategies:
+        raise ValueError(f"Unknown missing value strategy in {path}: {name}")
+    return strategies[name].load(path)
+
 class MissingValueHandler:
     def __init__(self, strategy: MissingValueHandlingStrategy):
         """
@@ -120,6 +667,50 @@ class MissingValueHandler:
         """
         logging.info("Applying Missing Value Strategy.")
         return self._strategy.handle(df)
+
+    def handle_chunks(self, chunk_source: Callable[[], Iterable[pd.DataFrame]]) -> Iterator[pd.DataFrame]:
+        """
+        Handles missing values out of core: a first pass over the chunks fits the strategy, a second pass fills them.
+
+        Parameters:
+        chunk_source (Callable): Returns a fresh iterator over the dataset chunks each time it is called,
+                                 e.g. lambda: ZipDataIngestor(chunksize=100_000).iter_chunks(path).
+
+        Returns:
+        Iterator[pd.DataFrame]: The chunks with missing values handled.
+        """
+        logging.info("Applying Missing Value Strategy in chunks.")
+        if hasattr(self._strategy, "fit_chunks"):
+            self._strategy.fit_chunks(chunk_source())
+        for chunk in chunk_source():
+            yield self._strategy.transform(chunk)
+
+    def fit(self, df: pd.DataFrame) -> "MissingValueHandler":
+        """
+        Fits the current strategy on the (training) DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to learn from.
+
+        Returns:
+        MissingValueHandler: The handler with a fitted strategy.
+        """
+        logging.info("Fitting Missing Value Strategy.")
+        self._strategy.fit(df)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted strategy to new data, e.g. the test split or a serving request.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values handled.
+        """
+        logging.info("Applying fitted Missing Value Strategy.")
+        return self._strategy.transform(df)
     
 # Example usage
 if __name__ == "__main__":
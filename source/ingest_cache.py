@@ -0,0 +1,205 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+CACHE_SUFFIX = ".arrow"
+DIGEST_INDEX = "digests.json"
+
+
+def _require_pyarrow():
+    """Imports pyarrow lazily so the rest of the ingestion code works without it."""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError("The columnar ingestion cache requires pyarrow (pip install pyarrow).") from e
+    return pa
+
+
+def atomic_write(path: str, data: bytes):
+    """Writes through a temporary file in the same directory so concurrent runs never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def write_arrow(path: str, df: pd.DataFrame):
+    """
+    Writes the DataFrame to an Arrow IPC file, keeping its pandas dtypes in the schema metadata.
+    """
+    pa = _require_pyarrow()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    atomic_write(path, sink.getvalue().to_pybytes())
+
+
+def read_arrow(path: str) -> pd.DataFrame:
+    """
+    Reads an Arrow IPC file into a DataFrame through a memory map.
+    """
+    pa = _require_pyarrow()
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+class ColumnarCache:
+    def __init__(self, cache_dir: str = "ingest_cache", max_bytes: Optional[int] = None,
+                 max_age_seconds: Optional[float] = None):
+        """
+        Initializes a content-addressed cache of ingested DataFrames stored as Arrow IPC files.
+
+        Parameters:
+        cache_dir (str): Directory holding the cached files.
+        max_bytes (int): Evict least recently used entries once the cache grows past this size. None disables it.
+        max_age_seconds (float): Evict entries not used for this many seconds. None disables it.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def file_digest(self, file_path: str) -> str:
+        """
+        Returns the sha256 of the file content.
+
+        The digest is memoized against the file's size and modification time so an
+        unchanged archive is not re-hashed on every run. Directories and os.pathsep-separated
+        lists of paths hash the names and digests of the files they contain.
+        """
+        if os.pathsep in file_path or os.path.isdir(file_path):
+            sha = hashlib.sha256()
+            for entry in file_path.split(os.pathsep):
+                if not os.path.isdir(entry):
+                    sha.update(f"{entry}:{self.file_digest(entry)}".encode())
+                    continue
+                for root, dirs, files in os.walk(entry):
+                    dirs.sort()
+                    for name in sorted(files):
+                        path = os.path.join(root, name)
+                        sha.update(f"{os.path.relpath(path, entry)}:{self.file_digest(path)}".encode())
+            return sha.hexdigest()
+
+        stat = os.stat(file_path)
+        index_path = os.path.join(self.cache_dir, DIGEST_INDEX)
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            index = {}
+
+        abs_path = os.path.abspath(file_path)
+        entry = index.get(abs_path)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        sha = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+
+        index[abs_path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        atomic_write(index_path, json.dumps(index).encode())
+        return digest
+
+    def key(self, file_path: str, options: dict) -> str:
+        """
+        Builds the cache key from the source content and the options that shape the parsed frame.
+
+        Parameters:
+        file_path (str): Path to the source file.
+        options (dict): Ingestor options that change the resulting DataFrame.
+
+        Returns:
+        str: The cache key.
+        """
+        payload = self.file_digest(file_path) + json.dumps(options, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached DataFrame for the key by memory-mapping its Arrow file, or None on a miss.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        df = read_arrow(path)
+        # Refresh the access time used by the LRU eviction.
+        os.utime(path)
+        logging.info(f"Loaded ingested data from cache: {path}")
+        return df
+
+    def store(self, key: str, df: pd.DataFrame):
+        """
+        Writes the DataFrame to the cache as an Arrow IPC file and applies the eviction policy.
+        """
+        write_arrow(self._path(key), df)
+        logging.info(f"Stored ingested data in cache: {self._path(key)}")
+        self.evict(keep=key)
+
+    def invalidate(self, key: str):
+        """
+        Removes a single entry from the cache.
+        """
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+            logging.info(f"Invalidated cache entry: {path}")
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_SUFFIX) or name == DIGEST_INDEX:
+                os.remove(os.path.join(self.cache_dir, name))
+        logging.info(f"Cleared ingestion cache: {self.cache_dir}")
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Evicts entries older than max_age_seconds, then least recently used entries until
+        the cache fits in max_bytes.
+
+        Parameters:
+        keep (str): Key that must survive eviction, usually the entry just written.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_SUFFIX) and name != (keep or "") + CACHE_SUFFIX:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        if keep is not None and os.path.exists(self._path(keep)):
+            total += os.path.getsize(self._path(keep))
+
+        for mtime, size, name in entries:
+            expired = self.max_age_seconds is not None and now - mtime > self.max_age_seconds
+            oversized = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or oversized):
+                continue
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
+            logging.info(f"Evicted cache entry: {name}")
@@ -1,56 +1,437 @@
+import json
+import logging
 import os
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 import pandas as pd
+from pandas.api.types import union_categoricals
+from source.data_schema import DatasetSchema
+from source.ingest_cache import ColumnarCache, atomic_write, read_arrow, write_arrow
 
 class DataIngestor(ABC):
     @abstractmethod
-    def ingest(self, file_path: str) -> pd.DataFrame:
+    def ingest(self, file_path: str, schema: Optional[DatasetSchema] = None) -> pd.DataFrame:
         """
         Abstract method for data ingestion.
 
+        Parameters:
+        file_path (str): Path to the source to ingest.
+        schema (DatasetSchema): Optional declared schema used to load compact dtypes.
         """
         pass
 
+    def cache_options(self) -> dict:
+        """
+        Returns the options that change the ingested DataFrame, used to build cache keys.
+        """
+        return {"ingestor": type(self).__name__}
+
 class ZipDataIngestor(DataIngestor):
-    def ingest(self, file_path: str) -> pd.DataFrame:
+    def __init__(self, member: Optional[str] = None, chunksize: Optional[int] = None, stream: bool = True):
+        """
+        Initializes the ZipDataIngestor.
+
+        Parameters:
+        member (str): Name of the .csv member inside the archive. Required when the archive holds more than one .csv file.
+        chunksize (int): Number of rows parsed per chunk when streaming. None reads the member in one go.
+        stream (bool): Read the member straight out of the archive. False extracts to 'extracted_data' first (legacy behaviour).
+        """
+        self.member = member
+        self.chunksize = chunksize
+        self.stream = stream
+        self.memory_report = None
+
+    def cache_options(self) -> dict:
+        """
+        Returns the options that change the ingested DataFrame, used to build cache keys.
+        """
+        return {**super().cache_options(), "member": self.member}
+
+    def _resolve_member(self, zip_file: zipfile.ZipFile) -> str:
+        """
+        Returns the name of the .csv member to read from the archive.
+        """
+        # Skip directories and the resource forks macOS adds to archives.
+        csv_members = [
+            name for name in zip_file.namelist()
+            if name.endswith(".csv") and not name.startswith("__MACOSX/")
+        ]
+        if self.member is not None:
+            if self.member not in csv_members:
+                raise FileNotFoundError(f"Member '{self.member}' not found in the archive. Available: {csv_members}")
+            return self.member
+
+        # Checking whether it contains a csv or not and if it is then not more than one.
+        if len(csv_members) == 0:
+            raise FileNotFoundError("No .csv file found in the zip archive.")
+        if len(csv_members) > 1:
+            raise ValueError(f"It contains more than 1 .csv file, so specify one with member=: {csv_members}")
+        return csv_members[0]
+
+    def iter_chunks(self, file_path: str, schema: Optional[DatasetSchema] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yields the .csv member of the zip file as DataFrame chunks without extracting it to disk.
+
+        Parameters:
+        file_path (str): Path to the zip file.
+        schema (DatasetSchema): Optional schema whose categorical and key dtypes are used while parsing.
+
+        Returns:
+        Iterator[pd.DataFrame]: Chunks of at most `chunksize` rows (a single chunk when chunksize is None).
+        """
+        if not file_path.endswith('.zip'):
+            raise ValueError("Given file is not a zip file.")
+
+        with zipfile.ZipFile(file_path, 'r') as zip_file:
+            member = self._resolve_member(zip_file)
+            dtype = schema.read_dtypes() if schema is not None else None
+            with zip_file.open(member) as csv_file:
+                if self.chunksize is None:
+                    yield pd.read_csv(csv_file, dtype=dtype)
+                else:
+                    with pd.read_csv(csv_file, dtype=dtype, chunksize=self.chunksize) as reader:
+                        yield from reader
+
+    def ingest(self, file_path: str, schema: Optional[DatasetSchema] = None) -> pd.DataFrame:
         """
         Ingesting data if it is given as zip file.
         """
         # Check the file path is of zip file.
         if not file_path.endswith('.zip'):
             raise ValueError("Given file is not a zip file.")
-        
+
+        if not self.stream:
+            df = self._ingest_extracted(file_path, schema)
+        else:
+            df = concat_chunks(list(self.iter_chunks(file_path, schema)))
+
+        if schema is not None:
+            df, self.memory_report = schema.apply(df)
+        return df
+
+    def _ingest_extracted(self, file_path: str, schema: Optional[DatasetSchema] = None) -> pd.DataFrame:
+        """
+        Extracts the zip file to 'extracted_data' and reads the csv from there.
+        """
         # Extracting the zip file using zipfile module.
         with zipfile.ZipFile(file_path, 'r') as zip_file:
-            zip_file.extractall('extracted_data')
-        
-        exrtacted_files = os.listdir('extracted_data')        # List of all files contained in extracted_data directory.
-        csv_files = [f for f in exrtacted_files if f.endswith(".csv")] # List of csv file extracted_data contains.
+            member = self._resolve_member(zip_file)
+            zip_file.extract(member, 'extracted_data')
 
-        # Checking whether it contains a csv or not and if it is then not more than one.
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No .csv file found in the extracted data.")
-        if len(csv_files) > 1:
-            raise ValueError("It contains more than 1 .csv file, so specify one")
-        
         # Getting the csv file path and import it as DataFrame.
-        csv_file_path = os.path.join('extracted_data',csv_files[0])
-        df = pd.read_csv(csv_file_path)
+        csv_file_path = os.path.join('extracted_data', member)
+        df = pd.read_csv(csv_file_path, dtype=schema.read_dtypes() if schema is not None else None)
         return df
     
+def _read_source(path: str, member: Optional[str], schema: Optional[DatasetSchema]) -> pd.DataFrame:
+    """
+    Parses one .csv file, or one .csv member of a zip archive. Runs in a worker process.
+    """
+    dtype = schema.read_dtypes() if schema is not None else None
+    if member is None:
+        return pd.read_csv(path, dtype=dtype)
+    with zipfile.ZipFile(path, 'r') as zip_file, zip_file.open(member) as csv_file:
+        return pd.read_csv(csv_file, dtype=dtype)
+
+
+class MultiFileDataIngestor(DataIngestor):
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initializes the MultiFileDataIngestor.
+
+        Parameters:
+        max_workers (int): Number of worker processes parsing files. Defaults to the number of CPUs.
+        """
+        self.max_workers = max_workers
+        self.memory_report = None
+
+    def list_sources(self, file_path: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        Lists every .csv source under the given path.
+
+        Parameters:
+        file_path (str): A directory (searched recursively), or several .zip/.csv paths separated by os.pathsep.
+
+        Returns:
+        list: (path, member) pairs, where member is the .csv inside a zip archive or None for plain .csv files.
+        """
+        paths = []
+        for entry in file_path.split(os.pathsep):
+            if os.path.isdir(entry):
+                for root, dirs, files in os.walk(entry):
+                    dirs.sort()
+                    paths.extend(os.path.join(root, name) for name in sorted(files))
+            else:
+                paths.append(entry)
+
+        sources = []
+        for path in paths:
+            if path.endswith(".zip"):
+                with zipfile.ZipFile(path, 'r') as zip_file:
+                    sources.extend(
+                        (path, name) for name in sorted(zip_file.namelist())
+                        if name.endswith(".csv") and not name.startswith("__MACOSX/")
+                    )
+            elif path.endswith(".csv"):
+                sources.append((path, None))
+
+        if len(sources) == 0:
+            raise FileNotFoundError(f"No .csv file found in: {file_path}")
+        return sources
+
+    def ingest(self, file_path: str, schema: Optional[DatasetSchema] = None) -> pd.DataFrame:
+        """
+        Parses every .csv source in a process pool and concatenates them into one DataFrame.
+        """
+        sources = self.list_sources(file_path)
+        logging.info(f"Ingesting {len(sources)} csv sources.")
+
+        if len(sources) == 1:
+            frames = [_read_source(*sources[0], schema)]
+        else:
+            max_workers = min(self.max_workers or os.cpu_count() or 1, len(sources))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(executor.map(_read_source, *zip(*sources), [schema] * len(sources)))
+
+        check_schema_consistency(frames, [f"{path}:{member}" if member else path for path, member in sources])
+        df = concat_chunks(frames)
+        del frames
+
+        # Downcast once over the whole dataset so every file ends up with the same widths.
+        if schema is not None:
+            df, self.memory_report = schema.apply(df)
+        return df
+
+
+def check_schema_consistency(frames: List[pd.DataFrame], names: List[str]):
+    """
+    Raises a ValueError if the frames do not share the same columns with compatible dtypes.
+
+    Integer and float columns are compatible, since a file with missing values parses an integer column as float.
+    """
+    def kind(dtype):
+        if isinstance(dtype, pd.CategoricalDtype):
+            return "category"
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            return "number"
+        return str(dtype)
+
+    reference_columns = list(frames[0].columns)
+    reference_kinds = [kind(dtype) for dtype in frames[0].dtypes]
+    for frame, name in zip(frames[1:], names[1:]):
+        if list(frame.columns) != reference_columns:
+            missing = set(reference_columns) - set(frame.columns)
+            extra = set(frame.columns) - set(reference_columns)
+            raise ValueError(
+                f"Columns of {name} do not match {names[0]}. Missing: {sorted(missing)}, extra: {sorted(extra)}, "
+                "or the column order differs."
+            )
+        mismatched = [
+            column for column, expected, dtype in zip(reference_columns, reference_kinds, frame.dtypes)
+            if kind(dtype) != expected
+        ]
+        if mismatched:
+            raise ValueError(f"Column types of {name} do not match {names[0]}: {mismatched}")
+
+
+class CachedDataIngestor(DataIngestor):
+    def __init__(self, ingestor: DataIngestor, cache: ColumnarCache, refresh: bool = False):
+        """
+        Wraps a DataIngestor with a content-addressed columnar cache.
+
+        Parameters:
+        ingestor (DataIngestor): The ingestor used on a cache miss.
+        cache (ColumnarCache): The cache holding typed Arrow copies of previously ingested sources.
+        refresh (bool): Ignore and overwrite any cached copy of the source.
+        """
+        self.ingestor = ingestor
+        self.cache = cache
+        self.refresh = refresh
+
+    def cache_options(self) -> dict:
+        return self.ingestor.cache_options()
+
+    def ingest(self, file_path: str, schema: Optional[DatasetSchema] = None) -> pd.DataFrame:
+        """
+        Returns the cached copy of the source if its content is unchanged, otherwise ingests and caches it.
+        """
+        options = self.cache_options()
+        options["schema"] = schema.to_dict() if schema is not None else None
+        key = self.cache.key(file_path, options)
+        if self.refresh:
+            self.cache.invalidate(key)
+        else:
+            df = self.cache.load(key)
+            if df is not None:
+                # Arrow hands string columns back as python-backed strings; re-applying the schema is a cheap no-op otherwise.
+                return schema.apply(df)[0] if schema is not None else df
+
+        df = self.ingestor.ingest(file_path, schema)
+        self.cache.store(key, df)
+        return df
+
+def concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates parsed chunks, unifying categorical columns so they stay 'category' instead of
+    falling back to object when chunks saw different categories.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+
+    for column, dtype in chunks[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = union_categoricals([chunk[column] for chunk in chunks], ignore_order=True).categories
+            categories = categories.sort_values()
+            for chunk in chunks:
+                chunk[column] = chunk[column].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True)
+
+class IncrementalDataIngestor(DataIngestor):
+    WATERMARK_FILE = "watermark.json"
+
+    def __init__(self, ingestor: DataIngestor, state_dir: str,
+                 watermark_columns: Tuple[str, ...] = ("Yr Sold", "Mo Sold", "Order")):
+        """
+        Wraps a DataIngestor so each run only keeps the rows past the watermark stored by the previous run.
+
+        The ingested history is stored in state_dir as one Arrow partition per run; new rows are appended as a
+        new partition and the watermark advances to the largest key seen. The watermark file is also the manifest
+        of the committed partitions and is replaced atomically after the partition is written, so a run that
+        crashes in between leaves an uncommitted partition that is never read and is overwritten by the next run.
+
+        Parameters:
+        ingestor (DataIngestor): The ingestor reading the source.
+        state_dir (str): Directory holding the stored partitions and the watermark.
+        watermark_columns (tuple): Columns compared lexicographically to order the rows.
+        """
+        self.ingestor = ingestor
+        self.state_dir = state_dir
+        self.watermark_columns = list(watermark_columns)
+        self.new_partition = None
+        os.makedirs(state_dir, exist_ok=True)
+
+    def read_watermark(self) -> Optional[dict]:
+        """
+        Returns the stored watermark state, or None before the first run.
+        """
+        try:
+            with open(os.path.join(self.state_dir, self.WATERMARK_FILE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _partition_path(self, partition: int) -> str:
+        return os.path.join(self.state_dir, f"partition-{partition:05d}.arrow")
+
+    @staticmethod
+    def committed_partitions(state: Optional[dict]) -> List[int]:
+        """
+        Returns the numbers of the partitions recorded in the watermark state, in order.
+        """
+        if state is None:
+            return []
+        # States written before the manifest was kept committed partitions 0..partition.
+        return list(state.get("partitions", range(state["partition"] + 1)))
+
+    def _new_rows(self, file_path: str, schema: Optional[DatasetSchema], watermark: Optional[list]) -> pd.DataFrame:
+        """
+        Reads the source and keeps the rows past the watermark, chunk by chunk when the ingestor can stream.
+        """
+        if hasattr(self.ingestor, "iter_chunks"):
+            chunks = self.ingestor.iter_chunks(file_path, schema)
+        else:
+            chunks = [self.ingestor.ingest(file_path, schema)]
+
+        new_chunks = [
+            chunk if watermark is None else chunk[_after_watermark(chunk, self.watermark_columns, watermark)]
+            for chunk in chunks
+        ]
+        df = concat_chunks(new_chunks).reset_index(drop=True)
+        if schema is not None:
+            df, _ = schema.apply(df)
+        return df
+
+    def ingest(self, file_path: str, schema: Optional[DatasetSchema] = None) -> pd.DataFrame:
+        """
+        Appends the rows past the watermark to the stored history and returns the full dataset.
+
+        Information about the appended partition is kept in self.new_partition: its number, the row offset
+        where it starts in the returned DataFrame, its row count and the new watermark.
+        """
+        state = self.read_watermark()
+        watermark = state["watermark"] if state is not None else None
+        partitions = self.committed_partitions(state)
+        partition = partitions[-1] + 1 if partitions else 0
+
+        new_rows = self._new_rows(file_path, schema, watermark)
+        logging.info(f"Found {len(new_rows)} rows past the watermark {watermark}.")
+
+        if len(new_rows) > 0:
+            write_arrow(self._partition_path(partition), new_rows)
+            keys = new_rows[self.watermark_columns].sort_values(self.watermark_columns).iloc[-1]
+            watermark = [int(value) for value in keys]
+            partitions.append(partition)
+            state = {"partition": partition, "partitions": partitions, "watermark": watermark,
+                     "watermark_columns": self.watermark_columns}
+            # Committing the partition and advancing the watermark is this single atomic replace.
+            atomic_write(os.path.join(self.state_dir, self.WATERMARK_FILE), json.dumps(state).encode())
+        else:
+            partition = None
+
+        history = [read_arrow(self._partition_path(number)) for number in partitions]
+        if schema is not None:
+            history = [schema.apply(frame)[0] for frame in history]
+        df = concat_chunks(history) if history else new_rows
+
+        self.new_partition = {
+            "partition": partition,
+            "start_row": len(df) - len(new_rows),
+            "new_rows": len(new_rows),
+            "watermark": dict(zip(self.watermark_columns, watermark)) if watermark is not None else None,
+        }
+        return df
+
+
+def _after_watermark(df: pd.DataFrame, columns: List[str], watermark: list) -> pd.Series:
+    """
+    Returns a boolean mask of the rows whose key columns compare lexicographically greater than the watermark.
+    """
+    mask = pd.Series(False, index=df.index)
+    # Build (c0 > w0) | ((c0 == w0) & ((c1 > w1) | ...)) from the last column backwards.
+    for column, value in reversed(list(zip(columns, watermark))):
+        mask = (df[column] > value) | ((df[column] == value) & mask)
+    return mask
+
 # Implement a Factory to create DataIngestors
 class DataIngestorFactory:
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
-        """Returns the appropriate DataIngestor based on file extension."""
+    def get_data_ingestor(file_extension: str, cache_dir: Optional[str] = None, refresh_cache: bool = False,
+                          max_cache_bytes: Optional[int] = None, max_cache_age: Optional[float] = None,
+                          incremental_state_dir: Optional[str] = None, **kwargs) -> DataIngestor:
+        """
+        Returns the appropriate DataIngestor based on file extension, cached when cache_dir is given and
+        incremental (watermarked) when incremental_state_dir is given.
+        """
         if file_extension == ".zip":
-            return ZipDataIngestor()
+            ingestor = ZipDataIngestor(**kwargs)
+        elif file_extension == "":
+            # Directories and lists of archives/csv files have no single extension.
+            ingestor = MultiFileDataIngestor(**kwargs)
         else:
             raise ValueError(f"No ingestor available for file extension: {file_extension}")
+
+        if incremental_state_dir is not None:
+            # Only the new rows are parsed out of the source, so the whole-source cache does not apply.
+            return IncrementalDataIngestor(ingestor, incremental_state_dir)
+        if cache_dir is None:
+            return ingestor
+        cache = ColumnarCache(cache_dir, max_bytes=max_cache_bytes, max_age_seconds=max_cache_age)
+        return CachedDataIngestor(ingestor, cache, refresh=refresh_cache)
         
 if __name__=="__main__":
     # Data_Ingestor_Factory = DataIngestorFactory()
-    # DataIngestor_type = Data_Ingestor_Factory.get_data_ingestor('.zip')
+    # DataIngestor_type = Data_Ingestor_Factory.get_data_ingestor('.zip', cache_dir='ingest_cache')
     # df = DataIngestor_type.ingest('/Users/himanshu/dev/study_p/mlops-price-predictor/data/archive.zip')
-    pass
\ No newline at end of file
+    pass
@@ -0,0 +1,301 @@
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+FORMAT_VERSION = 1
+
+
+def _is_missing(value) -> bool:
+    # None or NaN, without going through pandas.
+    return value is None or value != value
+
+
+def _plain(value):
+    # NumPy scalars to Python scalars, so categories survive JSON and compare equal to request values.
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# Linear Predictor
+# ----------------
+# A fitted Pipeline(ColumnTransformer -> linear model) from model_building_step is an affine function of its raw
+# inputs: mean-imputed numeric columns times folded coefficients, one coefficient per category of each one-hot
+# encoded column, and the sparse columns times theirs. export_linear_pipeline compiles it into those constants
+# (a JSON file); LinearPredictor evaluates them with NumPy alone, so serving needs neither pandas nor sklearn.
+class LinearPredictor:
+    def __init__(self, intercept: float, numeric_columns: List[str], numeric_fill: Sequence[float],
+                 numeric_coef: Sequence[float], categorical_columns: List[str],
+                 category_weights: List[Dict], missing_weights: Sequence[float]):
+        """
+        Initializes the predictor from compiled constants (see export_linear_pipeline).
+
+        Parameters:
+        intercept (float): The intercept, with every scaler folded in.
+        numeric_columns (list): Numeric (and sparse) input columns.
+        numeric_fill (list): The value imputed for a missing numeric input.
+        numeric_coef (list): The coefficient of each numeric input.
+        categorical_columns (list): One-hot encoded input columns.
+        category_weights (list): Per categorical column, a {category: coefficient} mapping. Unknown categories
+                                 contribute nothing, as with OneHotEncoder(handle_unknown="ignore").
+        missing_weights (list): Per categorical column, the contribution of a missing value (that of its imputed
+                                most frequent category).
+        """
+        self.intercept = float(intercept)
+        self.numeric_columns = list(numeric_columns)
+        self.numeric_fill = np.asarray(numeric_fill, dtype=np.float64)
+        self.numeric_coef = np.asarray(numeric_coef, dtype=np.float64)
+        self.categorical_columns = list(categorical_columns)
+        self.category_weights = category_weights
+        self.missing_weights = [float(weight) for weight in missing_weights]
+        self.input_columns = self.numeric_columns + self.categorical_columns
+        self._positions = {}
+
+    def save(self, path: str):
+        """
+        Saves the compiled constants as JSON. Categories are stored as [category, coefficient] pairs so that
+        non-string categories keep their type.
+        """
+        state = {
+            "format_version": FORMAT_VERSION,
+            "intercept": self.intercept,
+            "numeric_columns": self.numeric_columns,
+            "numeric_fill": self.numeric_fill.tolist(),
+            "numeric_coef": self.numeric_coef.tolist(),
+            "categorical_columns": self.categorical_columns,
+            "category_weights": [[[category, weight] for category, weight in weights.items()]
+                                 for weights in self.category_weights],
+            "missing_weights": self.missing_weights,
+        }
+        with open(path, "w") as f:
+            json.dump(state, f)
+        logging.info(f"Saved the linear predictor to {path}.")
+
+    @classmethod
+    def load(cls, path: str) -> "LinearPredictor":
+        """
+        Loads a predictor saved by save / export_linear_pipeline.
+        """
+        with open(path) as f:
+            state = json.load(f)
+        if state.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported linear predictor format {state.get('format_version')}.")
+        return cls(
+            state["intercept"], state["numeric_columns"], state["numeric_fill"], state["numeric_coef"],
+            state["categorical_columns"],
+            [{category: weight for category, weight in pairs} for pairs in state["category_weights"]],
+            state["missing_weights"],
+        )
+
+    def _column_positions(self, columns: Sequence[str]) -> tuple:
+        # The positions of the numeric and categorical inputs in a request's column order, computed once per order.
+        key = tuple(columns)
+        if key not in self._positions:
+            index = {column: i for i, column in enumerate(key)}
+            missing = [column for column in self.input_columns if column not in index]
+            if missing:
+                raise ValueError(f"Missing input columns: {missing}")
+            self._positions[key] = (
+                np.array([index[column] for column in self.numeric_columns], dtype=np.intp),
+                [index[column] for column in self.categorical_columns],
+            )
+        return self._positions[key]
+
+    def predict(self, X, columns: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Predicts a batch of rows.
+
+        Parameters:
+        X (array-like): Rows of shape (n_rows, n_columns). Missing values may be None or NaN.
+        columns (list): The column order of X. Defaults to input_columns.
+
+        Returns:
+        np.ndarray: The predictions, shape (n_rows,).
+        """
+        numeric_positions, categorical_positions = self._column_positions(columns or self.input_columns)
+        X = np.asarray(X, dtype=object if self.categorical_columns else np.float64)
+        if X.ndim != 2:
+            raise ValueError("X must be two-dimensional; use predict_record for a single row.")
+
+        values = X[:, numeric_positions].astype(np.float64)
+        missing = np.isnan(values)
+        if missing.any():
+            values = np.where(missing, self.numeric_fill, values)
+        predictions = values @ self.numeric_coef + self.intercept
+
+        for position, weights, missing_weight in zip(categorical_positions, self.category_weights,
+                                                     self.missing_weights):
+            predictions += [
+                missing_weight if _is_missing(value) else weights.get(value, 0.0) for value in X[:, position]
+            ]
+        return predictions
+
+    def predict_record(self, record: dict) -> float:
+        """
+        Predicts a single row given as a {column: value} mapping, in plain Python. Absent columns count as missing.
+        """
+        prediction = self.intercept
+        for column, fill, coef in zip(self.numeric_columns, self.numeric_fill, self.numeric_coef):
+            value = record.get(column)
+            prediction += (fill if _is_missing(value) else value) * coef
+        for column, weights, missing_weight in zip(self.categorical_columns, self.category_weights,
+                                                   self.missing_weights):
+            value = record.get(column)
+            prediction += missing_weight if _is_missing(value) else weights.get(value, 0.0)
+        return float(prediction)
+
+    def check_parity(self, pipeline, df, rtol: float = 1e-9, atol: float = 1e-9) -> float:
+        """
+        Checks the predictor against pipeline.predict on the given rows, both as one batch and row by row.
+
+        Parameters:
+        pipeline (Pipeline): The pipeline this predictor was exported from.
+        df (pd.DataFrame): Rows to compare on, containing input_columns.
+
+        Returns:
+        float: The largest absolute difference. Raises AssertionError on a mismatch.
+        """
+        expected = np.asarray(pipeline.predict(df), dtype=np.float64)
+        frame = df[self.input_columns]
+        rows = frame.astype(object).where(frame.notna(), None).to_numpy()
+        batch = self.predict(rows)
+        single = np.array([self.predict_record(dict(zip(self.input_columns, row))) for row in rows])
+        for actual in (batch, single):
+            np.testing.assert_allclose(actual, expected, rtol=rtol, atol=atol)
+        return float(np.max(np.abs(batch - expected), initial=0.0))
+
+    def benchmark(self, pipeline, df, n_rows: int = 200) -> dict:
+        """
+        Times single-row predictions of the predictor and of pipeline.predict on the first n_rows rows of df.
+
+        Returns:
+        dict: Median microseconds per row of the pipeline, of predict on a one-row batch and of predict_record.
+        """
+        frame = df[self.input_columns].head(n_rows)
+        records = [
+            {column: _plain(value) for column, value in row.items()}
+            for row in frame.astype(object).where(frame.notna(), None).to_dict("records")
+        ]
+
+        def median_us(function, items) -> float:
+            timings = []
+            for item in items:
+                start = time.perf_counter()
+                function(item)
+                timings.append(time.perf_counter() - start)
+            return float(np.median(timings)) * 1e6
+
+        return {
+            "pipeline_us": median_us(pipeline.predict, [frame.iloc[[i]] for i in range(len(frame))]),
+            "predict_us": median_us(self.predict, [[list(record.values())] for record in records]),
+            "predict_record_us": median_us(self.predict_record, records),
+        }
+
+
+def _fold_model(model, n_features: int) -> tuple:
+    """
+    Reduces a fitted linear model, or a Pipeline of StandardScaler / nan_to_num steps ending in one, to the
+    coefficients and intercept of a single affine function of its input.
+    """
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+    steps = [step for _, step in model.steps] if isinstance(model, Pipeline) else [model]
+    estimator = steps[-1]
+    if not hasattr(estimator, "coef_") or np.size(estimator.coef_) != n_features:
+        raise ValueError(f"{type(estimator).__name__} is not a single-output linear model and cannot be exported.")
+    coef = np.ravel(estimator.coef_).astype(np.float64)
+    intercept = float(np.ravel(estimator.intercept_)[0])
+
+    # Fold the preceding steps, last first: w . ((x - mean) / scale) + b = (w / scale) . x + b - (w / scale) . mean
+    for step in reversed(steps[:-1]):
+        if isinstance(step, StandardScaler):
+            if step.with_std:
+                coef = coef / step.scale_
+            if step.with_mean:
+                intercept -= float(coef @ step.mean_)
+        elif isinstance(step, FunctionTransformer) and step.func is np.nan_to_num:
+            # Inputs are imputed by the preprocessor, so nothing is left for nan_to_num to replace.
+            continue
+        else:
+            raise ValueError(f"{type(step).__name__} cannot be folded into a linear predictor.")
+    return coef, intercept
+
+
+def export_linear_pipeline(pipeline, path: Optional[str] = None) -> LinearPredictor:
+    """
+    Compiles a fitted pipeline from model_building_step into a LinearPredictor.
+
+    Parameters:
+    pipeline (Pipeline): Pipeline([("preprocessor", ColumnTransformer), ("model", linear model)]), where the model
+                         may itself be a pipeline of StandardScaler steps ending in a linear model (e.g. the result
+                         of ModelBuilder.search when a linear candidate wins).
+    path (str): Optional JSON file the predictor is saved to.
+
+    Returns:
+    LinearPredictor: The compiled predictor.
+    """
+    from sklearn.impute import SimpleImputer
+
+    preprocessor = pipeline.named_steps["preprocessor"]
+    n_features = sum(piece.stop - piece.start for piece in preprocessor.output_indices_.values())
+    coef, intercept = _fold_model(pipeline.named_steps["model"], n_features)
+
+    numeric_columns, numeric_fill, numeric_coef = [], [], []
+    categorical_columns, category_weights, missing_weights = [], [], []
+    for name, transformer, columns in preprocessor.transformers_:
+        if name == "remainder" or len(columns) == 0:
+            continue
+        block = coef[preprocessor.output_indices_[name]]
+        if name == "num":
+            if not isinstance(transformer, SimpleImputer) or transformer.strategy != "mean":
+                raise ValueError("Numeric columns must be mean-imputed.")
+            # Columns that were empty at fit time are dropped by the imputer; their value is ignored.
+            kept = set(transformer.get_feature_names_out(columns))
+            weights = iter(block)
+            for column, fill in zip(columns, transformer.statistics_):
+                numeric_columns.append(column)
+                numeric_fill.append(fill if column in kept else 0.0)
+                numeric_coef.append(next(weights) if column in kept else 0.0)
+        elif name == "cat":
+            imputer, encoder = transformer.named_steps["imputer"], transformer.named_steps["onehot"]
+            if encoder.drop_idx_ is not None or encoder.handle_unknown != "ignore":
+                raise ValueError("Categorical columns must be one-hot encoded with drop=None, handle_unknown='ignore'.")
+            fills = dict(zip(columns, imputer.statistics_))
+            start = 0
+            for column, categories in zip(imputer.get_feature_names_out(columns), encoder.categories_):
+                weights = {_plain(category): float(weight)
+                           for category, weight in zip(categories, block[start:start + len(categories)])}
+                start += len(categories)
+                categorical_columns.append(column)
+                category_weights.append(weights)
+                missing_weights.append(weights.get(_plain(fills[column]), 0.0))
+        elif name == "sparse":
+            # Already one-hot encoded columns pass through unchanged.
+            numeric_columns.extend(columns)
+            numeric_fill.extend([0.0] * len(columns))
+            numeric_coef.extend(block)
+        else:
+            raise ValueError(f"Unknown preprocessor block '{name}'.")
+
+    predictor = LinearPredictor(intercept, numeric_columns, numeric_fill, numeric_coef,
+                                categorical_columns, category_weights, missing_weights)
+    logging.info(f"Exported a linear predictor over {len(numeric_columns)} numeric and "
+                 f"{len(categorical_columns)} categorical columns.")
+    if path is not None:
+        predictor.save(path)
+    return predictor
+
+
+# Example usage
+if __name__ == "__main__":
+    # predictor = export_linear_pipeline(trained_pipeline, 'linear_predictor.json')
+    # predictor.check_parity(trained_pipeline, X_test)
+    # print(predictor.benchmark(trained_pipeline, X_test))
+    # At serving time, without sklearn:
+    # predictor = LinearPredictor.load('linear_predictor.json')
+    # price = predictor.predict_record({'Gr Liv Area': 1710.0, 'Neighborhood': 'NAmes', ...})
+    pass
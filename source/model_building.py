@@ -1,12 +1,24 @@
+import copy
+import hashlib
 import logging 
+import math
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.base import RegressorMixin
-from sklearn.linear_model import LinearRegression
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge, SGDRegressor
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import ParameterGrid
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -47,22 +59,585 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
             raise TypeError("y_train must be a pandas Series.")
         
         logging.info("Initializing Linear Regression model with scaling.")
+        pipeline = self.build_pipeline()
 
-        # Creating a pipeline with standard scaling and linear regression
-        pipeline = Pipeline(
+        logging.info("Training Linear Regression model.")
+        pipeline.fit(X_train, y_train)
+
+        logging.info("Model training completed.")
+        return pipeline
+
+    def build_pipeline(self) -> Pipeline:
+        """
+        Returns the unfitted pipeline: standard scaling and linear regression.
+        """
+        return Pipeline(
             [
                 ("scaler", StandardScaler()),
                 ("model", LinearRegression())
             ]
         )
 
-        logging.info("Training Linear Regression model.")
-        pipeline.fit(X_train, y_train)
+# Base class for strategies that only differ by the estimator they build
+class PipelineModelBuildingStrategy(ModelBuildingStrategy):
+    def __init__(self, **params):
+        """
+        Initializes the strategy with the hyperparameters of its estimator.
+
+        Parameters:
+        **params: Keyword arguments passed to the estimator.
+        """
+        self.params = params
+
+    # Whether the estimator fits sparse matrices; ModelBuilder.search densifies the input of the others.
+    accepts_sparse = True
+
+    @abstractmethod
+    def build_pipeline(self) -> Pipeline:
+        """
+        Abstract method returning the unfitted pipeline of the strategy.
+        """
+        pass
+
+    def build_and_train_model(self, X_train, y_train) -> Pipeline:
+        """
+        Builds and trains the strategy's pipeline.
+
+        Parameters:
+        X_train (pd.DataFrame or np.ndarray): The training data features.
+        y_train (pd.Series or np.ndarray): The training data labels/target.
 
+        Returns:
+        Pipeline: The trained pipeline.
+        """
+        logging.info(f"Training {type(self).__name__} with {self.params}.")
+        pipeline = self.build_pipeline().fit(X_train, y_train)
         logging.info("Model training completed.")
         return pipeline
-    
-    # Context Class for Model Building
+
+class RidgeRegressionStrategy(PipelineModelBuildingStrategy):
+    def build_pipeline(self) -> Pipeline:
+        return Pipeline([("scaler", StandardScaler()), ("model", Ridge(**self.params))])
+
+class LassoRegressionStrategy(PipelineModelBuildingStrategy):
+    def build_pipeline(self) -> Pipeline:
+        return Pipeline([("scaler", StandardScaler()), ("model", Lasso(**{"max_iter": 5000, **self.params}))])
+
+class ElasticNetRegressionStrategy(PipelineModelBuildingStrategy):
+    def build_pipeline(self) -> Pipeline:
+        return Pipeline([("scaler", StandardScaler()), ("model", ElasticNet(**{"max_iter": 5000, **self.params}))])
+
+class HistGradientBoostingStrategy(PipelineModelBuildingStrategy):
+    accepts_sparse = False
+
+    def build_pipeline(self) -> Pipeline:
+        # Trees need no scaling.
+        return Pipeline([("model", HistGradientBoostingRegressor(**{"random_state": 42, **self.params}))])
+
+# Binned Histogram Gradient Boosting Strategy
+# -------------------------------------------
+# This strategy trains histogram gradient boosting on the raw training frame: categorical columns are used natively
+# (ordinal codes flagged in categorical_features) instead of one-hot encoded, and every column is pre-binned into
+# a float32 matrix by FeatureBinner. With a cache directory the fitted binner and the binned matrix are reused
+# when the same rows are trained on again (e.g. another hyperparameter setting or a pipeline rerun).
+class BinnedHistGradientBoostingStrategy(PipelineModelBuildingStrategy):
+    def __init__(self, n_threads: Optional[int] = None, cache_dir: Optional[str] = None, max_bins: int = 255,
+                 **params):
+        """
+        Initializes the strategy.
+
+        Parameters:
+        n_threads (int): OpenMP threads used to train the booster. Defaults to every core.
+        cache_dir (str): Optional directory of a DesignMatrixCache holding binned training matrices.
+        max_bins (int): Maximum number of bins (or categories) per column, at most 255.
+        **params: Keyword arguments passed to HistGradientBoostingRegressor.
+        """
+        super().__init__(**params)
+        self.n_threads = n_threads
+        self.cache_dir = cache_dir
+        self.max_bins = max_bins
+
+    def build_pipeline(self) -> Pipeline:
+        from source.design_matrix import FeatureBinner
+
+        return Pipeline([
+            ("preprocessor", FeatureBinner(max_bins=self.max_bins)),
+            ("model", HistGradientBoostingRegressor(**{"random_state": 42, **self.params, "max_bins": self.max_bins})),
+        ])
+
+    def build_and_train_model(self, X_train, y_train) -> Pipeline:
+        """
+        Bins the training data (or loads it from the cache) and trains the booster with n_threads threads.
+
+        Parameters:
+        X_train (pd.DataFrame or np.ndarray): The training data features; object and category columns are
+                                              treated as categorical. Missing values are allowed.
+        y_train (pd.Series or np.ndarray): The training data labels/target.
+
+        Returns:
+        Pipeline: The "preprocessor" (FeatureBinner) and "model" (HistGradientBoostingRegressor) pipeline, which
+                  predicts on raw frames. The binner and the booster are fitted separately, so mlflow.sklearn.autolog
+                  only sees the bare booster: log this pipeline as the model (as train_pipeline does) instead.
+        """
+        from threadpoolctl import threadpool_limits
+        from source.design_matrix import DesignMatrixCache
+
+        pipeline = self.build_pipeline()
+        binner = pipeline.named_steps["preprocessor"]
+        if self.cache_dir is not None:
+            binner, X_binned = DesignMatrixCache(self.cache_dir).fit_transform(binner, pd.DataFrame(X_train))
+            pipeline.steps[0] = ("preprocessor", binner)
+        else:
+            X_binned = binner.fit_transform(X_train)
+
+        model = pipeline.named_steps["model"]
+        model.set_params(categorical_features=binner.categorical_mask_ if binner.categorical_mask_.any() else None)
+        logging.info(f"Training {type(self).__name__} on {X_binned.shape[0]} rows x {X_binned.shape[1]} binned "
+                     f"columns ({int(binner.categorical_mask_.sum())} categorical) with {self.params}.")
+        with threadpool_limits(limits=self.n_threads, user_api="openmp"):
+            model.fit(X_binned, y_train)
+        logging.info("Model training completed.")
+        return pipeline
+
+# Out-of-core Strategy
+# --------------------
+# This strategy trains a linear model with SGDRegressor.partial_fit over chunks of data (e.g. from
+# ZipDataIngestor.iter_chunks), so the training set never has to fit in memory. It only trains on numeric columns:
+# categorical columns are not encoded and are left out (with a warning), so encode them beforehand, e.g. with
+# HashingEncoding, which needs no fitting and can be applied chunk by chunk, if they should be used.
+class IncrementalSGDRegressionStrategy(ModelBuildingStrategy):
+    TARGET = "__target__"
+
+    def __init__(self, features: Optional[List[str]] = None, imputer=None, n_epochs: int = 5,
+                 chunk_size: int = 50_000, warm_start_model: Optional[Pipeline] = None, random_state: int = 42,
+                 **sgd_params):
+        """
+        Initializes the incremental strategy.
+
+        Parameters:
+        features (list): The numeric features to train on. Defaults to every numeric column of the first chunk;
+                         non-numeric columns are ignored and logged.
+        imputer (MissingValueHandlingStrategy): Optional fitted imputation (e.g. StreamingFillingMissingValuesStrategy
+                                                fitted with fit_chunks) applied to each chunk. Values still missing
+                                                after scaling are set to 0, i.e. the running mean.
+        n_epochs (int): Passes over the chunks.
+        chunk_size (int): Rows per chunk when training on an in-memory DataFrame.
+        warm_start_model (Pipeline): A previously trained model whose coefficients training continues from: either
+                                     a scaler/model pipeline of this strategy, whose scaling is reused as is, or
+                                     a preprocessor/linear model pipeline of model_building_step (e.g. the
+                                     deployed one), whose numeric coefficients are mapped to the features by name
+                                     (see _deployed_coefficients).
+        random_state (int): Seed of the SGD and of the shuffling of each chunk.
+        **sgd_params: Keyword arguments passed to SGDRegressor.
+        """
+        self.features = features
+        self.imputer = imputer
+        self.n_epochs = n_epochs
+        self.chunk_size = chunk_size
+        self.warm_start_model = warm_start_model
+        self.random_state = random_state
+        self.sgd_params = sgd_params
+
+    def _deployed_coefficients(self) -> Tuple[List[str], np.ndarray, float]:
+        """
+        Reads the coefficients of a preprocessor/linear model pipeline on the original feature scale.
+
+        Only numeric columns are trained on, so the one-hot coefficients of categorical columns are dropped: each
+        categorical column contributes its value at the imputed (most frequent) category through the intercept.
+
+        Returns:
+        list: The features (by default the model's numeric columns).
+        np.ndarray: The coefficient of each feature; 0 for features the model does not use.
+        float: The intercept.
+        """
+        from source.linear_predictor import export_linear_pipeline
+
+        # Raises a ValueError for models that are not linear.
+        predictor = export_linear_pipeline(self.warm_start_model)
+        features = self.features or predictor.numeric_columns
+        weights = dict(zip(predictor.numeric_columns, predictor.numeric_coef))
+        coef = np.array([weights.get(feature, 0.0) for feature in features], dtype=np.float64)
+        intercept = predictor.intercept + sum(predictor.missing_weights)
+        if predictor.categorical_columns:
+            logging.warning(f"Warm start drops the one-hot coefficients of {predictor.categorical_columns}; their "
+                            f"most frequent categories are folded into the intercept.")
+        return features, coef, intercept
+
+    def _initial_state(self) -> Tuple[Optional[StandardScaler], SGDRegressor, Optional[List[str]],
+                                      Optional[Tuple[np.ndarray, float]]]:
+        model = SGDRegressor(random_state=self.random_state, **self.sgd_params)
+        if self.warm_start_model is None:
+            return None, model, self.features, None
+
+        steps = getattr(self.warm_start_model, "named_steps", {})
+        if "preprocessor" in steps:
+            # The scaling is fitted as without a warm start; the coefficients are rescaled to it afterwards.
+            features, coef, intercept = self._deployed_coefficients()
+            logging.info(f"Warm-starting from the coefficients of the deployed {type(steps['model']).__name__}.")
+            return None, model, features, (coef, intercept)
+        if "scaler" not in steps or "model" not in steps:
+            raise ValueError("warm_start_model must be a scaler/model pipeline of this strategy or a "
+                             "preprocessor/model pipeline of model_building_step.")
+
+        scaler = copy.deepcopy(steps["scaler"])
+        previous = self.warm_start_model.named_steps["model"]
+        if isinstance(previous, SGDRegressor):
+            # Keeps the learning-rate schedule where it stopped as well.
+            model = copy.deepcopy(previous)
+        else:
+            # Any linear model: partial_fit continues from coefficients that are already set.
+            model.coef_ = np.asarray(previous.coef_, dtype=np.float64).ravel().copy()
+            model.intercept_ = np.atleast_1d(np.asarray(previous.intercept_, dtype=np.float64)).copy()
+        features = list(getattr(scaler, "feature_names_in_", self.features or []))
+        logging.info(f"Warm-starting from the coefficients of {type(previous).__name__}.")
+        return scaler, model, features, None
+
+    def _prepare(self, chunk: pd.DataFrame, target_column: str, features: List[str]):
+        if self.imputer is not None:
+            chunk = self.imputer.transform(chunk)
+        chunk = chunk[chunk[target_column].notna()]
+        return chunk[features], chunk[target_column].to_numpy(dtype=np.float64)
+
+    def train_on_chunks(self, chunk_source: Callable[[], Iterable[pd.DataFrame]], target_column: str) -> Pipeline:
+        """
+        Trains on chunks with bounded memory: one chunk is held at a time.
+
+        Without a warm start, a first pass fits the feature scaling with StandardScaler.partial_fit; the scaling
+        is then fixed and every epoch applies it to each chunk before SGDRegressor.partial_fit.
+
+        Parameters:
+        chunk_source (callable): Returns a fresh iterator of DataFrame chunks (features and target) on each call.
+        target_column (str): The name of the target column.
+
+        Returns:
+        Pipeline: The trained scaler/fill/model pipeline.
+        """
+        scaler, model, features, unscaled = self._initial_state()
+        if scaler is None:
+            scaler = StandardScaler()
+            for chunk in chunk_source():
+                if features is None:
+                    features = chunk.select_dtypes(include="number").columns.drop(target_column, errors="ignore").tolist()
+                scaler.partial_fit(self._prepare(chunk, target_column, features)[0])
+            logging.info(f"Fitted feature scaling on {int(scaler.n_samples_seen_.max())} rows.")
+        if unscaled is not None:
+            # w . x + b = (w * scale) . ((x - mean) / scale) + b + w . mean
+            coef, intercept = unscaled
+            model.coef_ = coef * scaler.scale_
+            model.intercept_ = np.array([intercept + coef @ scaler.mean_])
+
+        rng = np.random.default_rng(self.random_state)
+        for epoch in range(self.n_epochs):
+            n_rows = 0
+            for chunk in chunk_source():
+                if epoch == 0 and n_rows == 0:
+                    ignored = chunk.columns.difference([*features, target_column], sort=False)
+                    if len(ignored):
+                        logging.warning(f"Ignoring {len(ignored)} columns that are not numeric features: "
+                                        f"{ignored.tolist()}. Encode them (e.g. HashingEncoding) to train on them.")
+                X, y = self._prepare(chunk, target_column, features)
+                # SGD needs shuffled rows; chunks are shuffled internally, in file order between each other.
+                order = rng.permutation(len(y))
+                model.partial_fit(np.nan_to_num(scaler.transform(X))[order], y[order])
+                n_rows += len(y)
+            logging.info(f"Epoch {epoch + 1}/{self.n_epochs} completed on {n_rows} rows.")
+
+        return Pipeline([
+            ("scaler", scaler),
+            ("fill", FunctionTransformer(np.nan_to_num)),
+            ("model", model),
+        ])
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Trains on an in-memory DataFrame, in chunks of chunk_size rows.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: The trained scaler/fill/model pipeline.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        frame = X_train.copy(deep=False)
+        frame[self.TARGET] = np.asarray(y_train)
+
+        def chunks():
+            for start in range(0, len(frame), self.chunk_size):
+                yield frame.iloc[start:start + self.chunk_size]
+
+        return self.train_on_chunks(chunks, self.TARGET)
+
+# Sufficient Statistics
+# ---------------------
+# A linear fit only depends on the count, the means and the centered cross-products of the data, which can be
+# computed per shard and merged exactly. The statistics are centered per shard and merged with the parallel
+# (Chan et al.) update instead of summing raw X^T X, which loses precision on large, uncentered values.
+class LinearSufficientStatistics:
+    def __init__(self, n_features: int):
+        self.n = 0
+        self.mean_x = np.zeros(n_features)
+        self.mean_y = 0.0
+        self.cxx = np.zeros((n_features, n_features))
+        self.cxy = np.zeros(n_features)
+        self.cyy = 0.0
+        # Fingerprints of the training batches merged into the statistics
+        self.batches = []
+
+    @classmethod
+    def from_data(cls, X: np.ndarray, y: np.ndarray) -> "LinearSufficientStatistics":
+        stats = cls(X.shape[1])
+        stats.n = len(y)
+        if stats.n:
+            stats.mean_x = X.mean(axis=0)
+            stats.mean_y = float(y.mean())
+            Xc = X - stats.mean_x
+            yc = y - stats.mean_y
+            stats.cxx = Xc.T @ Xc
+            stats.cxy = Xc.T @ yc
+            stats.cyy = float(yc @ yc)
+        return stats
+
+    def merge(self, other: "LinearSufficientStatistics") -> "LinearSufficientStatistics":
+        n = self.n + other.n
+        batches = self.batches + other.batches
+        if other.n == 0:
+            self.batches = batches
+            return self
+        if self.n == 0:
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            self.batches = batches
+            return self
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.cxx += other.cxx + weight * np.outer(dx, dx)
+        self.cxy += other.cxy + weight * dx * dy
+        self.cyy += other.cyy + weight * dy * dy
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.n = n
+        self.batches = batches
+        return self
+
+    def save(self, path: str, feature_names: List[str]):
+        with open(path, "wb") as f:
+            np.savez(f, n=self.n, mean_x=self.mean_x, mean_y=self.mean_y, cxx=self.cxx, cxy=self.cxy,
+                     cyy=self.cyy, feature_names=np.array(feature_names, dtype=str),
+                     batches=np.array(self.batches, dtype=str))
+
+    @classmethod
+    def load(cls, path: str) -> Tuple["LinearSufficientStatistics", List[str]]:
+        with np.load(path, allow_pickle=False) as archive:
+            stats = cls(len(archive["mean_x"]))
+            stats.n = int(archive["n"])
+            stats.mean_x = archive["mean_x"].astype(np.float64)
+            stats.mean_y = float(archive["mean_y"])
+            stats.cxx = archive["cxx"].astype(np.float64)
+            stats.cxy = archive["cxy"].astype(np.float64)
+            stats.cyy = float(archive["cyy"])
+            # Statistics saved before batches were fingerprinted have none.
+            stats.batches = archive["batches"].tolist() if "batches" in archive.files else []
+            return stats, archive["feature_names"].tolist()
+
+
+# Data shared read-only by the statistics workers, set once per process by _init_statistics_worker
+_STATISTICS_DATA = {}
+
+
+def batch_fingerprint(X: pd.DataFrame, y: np.ndarray) -> str:
+    """
+    Hashes the rows and target of a training batch (not their index, so a reloaded batch hashes the same).
+    """
+    digest = hashlib.sha256(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _init_statistics_worker(X: np.ndarray, y: np.ndarray):
+    _STATISTICS_DATA.update(X=X, y=y)
+
+
+def _shard_statistics(start: int, stop: int) -> LinearSufficientStatistics:
+    return LinearSufficientStatistics.from_data(_STATISTICS_DATA["X"][start:stop], _STATISTICS_DATA["y"][start:stop])
+
+
+class SufficientStatisticsLinearRegressionStrategy(ModelBuildingStrategy):
+    def __init__(self, alpha: float = 0.0, stats_path: Optional[str] = None, max_workers: Optional[int] = None,
+                 min_shard_rows: int = 50_000):
+        """
+        Initializes the strategy, which fits a linear regression on standardized features (the same model as
+        LinearRegressionStrategy, or RidgeRegressionStrategy when alpha > 0) from merged sufficient statistics.
+
+        Parameters:
+        alpha (float): Ridge penalty on the standardized coefficients. 0 is ordinary least squares.
+        stats_path (str): .npz file of accumulated statistics. When it exists, the statistics of the new rows are
+                          merged into it instead of refitting from scratch; the merged statistics are saved back.
+                          A batch already merged (e.g. a retried run) is not counted twice.
+        max_workers (int): Number of worker processes computing shard statistics. Defaults to the number of CPUs.
+        min_shard_rows (int): Minimum rows per shard; smaller data is processed in a single shard, in process.
+        """
+        self.alpha = alpha
+        self.stats_path = stats_path
+        self.max_workers = max_workers
+        self.min_shard_rows = min_shard_rows
+
+    def compute_statistics(self, X: np.ndarray, y: np.ndarray) -> LinearSufficientStatistics:
+        """
+        Computes the statistics of the rows, one shard per worker process, and merges them.
+        """
+        n_shards = max(1, min(self.max_workers or os.cpu_count() or 1, len(y) // self.min_shard_rows))
+        if n_shards == 1:
+            return LinearSufficientStatistics.from_data(X, y)
+
+        bounds = np.linspace(0, len(y), n_shards + 1, dtype=int)
+        with ProcessPoolExecutor(max_workers=n_shards, initializer=_init_statistics_worker,
+                                 initargs=(X, y)) as executor:
+            shards = list(executor.map(_shard_statistics, bounds[:-1], bounds[1:]))
+        stats = shards[0]
+        for shard in shards[1:]:
+            stats.merge(shard)
+        return stats
+
+    def solve(self, stats: LinearSufficientStatistics) -> Tuple[np.ndarray, float]:
+        """
+        Solves the (ridge) normal equations on standardized features with a Cholesky factorization, falling back
+        to a minimum-norm least-squares solve when they are singular (collinear features).
+
+        Returns:
+        np.ndarray: The coefficients on the original feature scale.
+        float: The intercept.
+        """
+        from scipy.linalg import LinAlgError, cho_factor, cho_solve, pinvh
+
+        # Population standard deviations, constant features left unscaled (as StandardScaler).
+        scale = np.sqrt(np.diag(stats.cxx) / stats.n)
+        scale[scale == 0] = 1.0
+        gram = stats.cxx / np.outer(scale, scale) + self.alpha * np.eye(len(scale))
+        rhs = stats.cxy / scale
+        try:
+            factor, lower = cho_factor(gram)
+            # Cholesky can succeed on a numerically singular matrix through rounding; reject it when the
+            # factor's diagonal spread shows the features are (near) collinear.
+            diagonal = np.abs(np.diag(factor))
+            if diagonal.min() <= diagonal.max() * np.sqrt(len(scale) * np.finfo(np.float64).eps):
+                raise LinAlgError("ill-conditioned normal equations")
+            coef_scaled = cho_solve((factor, lower), rhs)
+        except LinAlgError:
+            logging.info("Normal equations are singular; solving with the minimum-norm pseudo-inverse.")
+            coef_scaled = pinvh(gram) @ rhs
+        coef = coef_scaled / scale
+        return coef, float(stats.mean_y - stats.mean_x @ coef)
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Fits the linear regression from the sufficient statistics of the (new) training rows.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features (numeric, without missing values).
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: A pipeline holding the fitted LinearRegression.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        X = X_train.to_numpy(dtype=np.float64)
+        y = np.asarray(y_train, dtype=np.float64)
+        if np.isnan(X).any() or np.isnan(y).any():
+            raise ValueError("Sufficient statistics require data without missing values.")
+
+        feature_names = X_train.columns.tolist()
+        fingerprint = batch_fingerprint(X_train, y)
+        previous = None
+        if self.stats_path is not None and os.path.exists(self.stats_path):
+            previous, previous_names = LinearSufficientStatistics.load(self.stats_path)
+            if previous_names != feature_names:
+                raise ValueError("The saved statistics were computed on different features.")
+
+        if previous is not None and fingerprint in previous.batches:
+            logging.warning(f"These {len(y)} rows were already merged into the saved statistics; "
+                            f"solving from the saved statistics without adding them again.")
+            stats = previous
+        else:
+            stats = self.compute_statistics(X, y)
+            stats.batches = [fingerprint]
+            if previous is not None:
+                logging.info(f"Adding {stats.n} new rows to {previous.n} rows of saved statistics.")
+                stats = previous.merge(stats)
+            if self.stats_path is not None:
+                stats.save(self.stats_path, feature_names)
+
+        coef, intercept = self.solve(stats)
+        model = LinearRegression()
+        model.coef_ = coef
+        model.intercept_ = intercept
+        model.n_features_in_ = len(feature_names)
+        model.feature_names_in_ = np.array(feature_names, dtype=object)
+        logging.info(f"Solved linear regression from the statistics of {stats.n} rows.")
+        return Pipeline([("model", model)])
+
+# Candidates tried by ModelBuilder.search when none are given: strategy and hyperparameter grid
+DEFAULT_SEARCH_SPACE = [
+    (RidgeRegressionStrategy, {"alpha": [0.1, 1.0, 10.0, 100.0]}),
+    (LassoRegressionStrategy, {"alpha": [10.0, 100.0, 1000.0]}),
+    (ElasticNetRegressionStrategy, {"alpha": [0.01, 0.1, 1.0], "l1_ratio": [0.2, 0.5, 0.8]}),
+    (HistGradientBoostingStrategy, {"learning_rate": [0.05, 0.1], "max_leaf_nodes": [15, 31]}),
+]
+
+def densify(X):
+    """Returns a sparse matrix as a dense array; dense input is returned unchanged."""
+    return X.toarray() if sparse.issparse(X) else X
+
+
+def _candidate_pipeline(strategy: PipelineModelBuildingStrategy, sparse_input: bool) -> Pipeline:
+    """
+    Returns the unfitted pipeline of a search candidate for the given input. On a sparse matrix, linear models keep
+    it sparse and are scaled without centering (their intercept absorbs the means, so the fit is the same); the
+    other estimators get a leading step densifying it.
+    """
+    pipeline = strategy.build_pipeline()
+    if not sparse_input:
+        return pipeline
+    if not strategy.accepts_sparse:
+        return Pipeline([("densify", FunctionTransformer(densify, accept_sparse=True)), *pipeline.steps])
+    if "scaler" in pipeline.named_steps:
+        pipeline.set_params(scaler__with_mean=False)
+    return pipeline
+
+
+# Matrices shared read-only by the search workers, set once per process by _init_search_worker
+_SEARCH_DATA = {}
+
+
+def _init_search_worker(X_fit, y_fit, X_val, y_val, order):
+    """Receives the preprocessed matrices once per worker process, so tasks only ship a strategy and a size."""
+    _SEARCH_DATA.update(X_fit=X_fit, y_fit=y_fit, X_val=X_val, y_val=y_val, order=order)
+
+
+def _evaluate_candidate(candidate_id: int, strategy: PipelineModelBuildingStrategy, n_samples: int) -> dict:
+    """Trains a candidate on the first n_samples rows of a fixed shuffle and scores it on the validation rows."""
+    rows = _SEARCH_DATA["order"][:n_samples]
+    start = time.perf_counter()
+    try:
+        pipeline = _candidate_pipeline(strategy, sparse.issparse(_SEARCH_DATA["X_fit"]))
+        pipeline.fit(_SEARCH_DATA["X_fit"][rows], _SEARCH_DATA["y_fit"][rows])
+        y_pred = pipeline.predict(_SEARCH_DATA["X_val"])
+    except Exception as e:
+        return {"candidate": candidate_id, "n_samples": n_samples, "status": f"failed: {e}",
+                "fit_seconds": time.perf_counter() - start}
+    return {
+        "candidate": candidate_id,
+        "n_samples": n_samples,
+        "status": "ok",
+        "rmse": float(np.sqrt(mean_squared_error(_SEARCH_DATA["y_val"], y_pred))),
+        "r2": float(r2_score(_SEARCH_DATA["y_val"], y_pred)),
+        "fit_seconds": time.perf_counter() - start,
+    }
+
+# Context Class for Model Building
 class ModelBuilder:
     def __init__(self, strategy: ModelBuildingStrategy):
         """
@@ -95,4 +670,128 @@ class ModelBuilder:
         RegressorMixin: A trained scikit-learn model instance.
         """
         logging.info("Building and training the model using the selected strategy.")
-        return self._strategy.build_and_train_model(X_train, y_train)
\ No newline at end of file
+        return self._strategy.build_and_train_model(X_train, y_train)
+
+    def build_model_from_chunks(self, chunk_source: Callable[[], Iterable[pd.DataFrame]],
+                                target_column: str) -> Pipeline:
+        """
+        Executes out-of-core training with the current strategy, which must support train_on_chunks.
+
+        Parameters:
+        chunk_source (callable): Returns a fresh iterator of DataFrame chunks (features and target) on each call.
+        target_column (str): The name of the target column.
+
+        Returns:
+        Pipeline: The trained pipeline.
+        """
+        if not hasattr(self._strategy, "train_on_chunks"):
+            raise TypeError(f"{type(self._strategy).__name__} cannot train on chunks.")
+        logging.info("Building and training the model over chunks using the selected strategy.")
+        return self._strategy.train_on_chunks(chunk_source, target_column)
+
+    def search(self, X_train, y_train, candidates: Optional[List[Tuple[type, Dict[str, list]]]] = None,
+               validation_size: float = 0.2, eta: int = 3, min_samples: int = 200,
+               time_budget: Optional[float] = None, max_workers: Optional[int] = None,
+               random_state: int = 42) -> Tuple[Pipeline, pd.DataFrame]:
+        """
+        Searches several strategies and hyperparameter grids with successive halving, in a process pool.
+
+        Every candidate is first trained on a small sample of the training rows and scored on a held-out
+        validation set; only the best 1/eta of them are trained again on eta times more rows, until the last
+        rung uses every training row. Hopeless candidates are thus dropped after a cheap fit. The preprocessed
+        matrix is sent to each worker once; tasks only carry the strategy and a sample size. A sparse matrix stays
+        sparse for the linear candidates and is only densified by the candidates that need it.
+
+        Parameters:
+        X_train (pd.DataFrame, np.ndarray or sparse matrix): The preprocessed training features (numeric).
+        y_train (pd.Series or np.ndarray): The training data labels/target.
+        candidates (list): (strategy class, parameter grid) pairs. Defaults to DEFAULT_SEARCH_SPACE.
+        validation_size (float): Share of the rows held out to rank candidates.
+        eta (int): Halving rate: 1/eta of the candidates survive each rung, with eta times more rows.
+        min_samples (int): Minimum number of rows of the first rung.
+        time_budget (float): Seconds after which no new rung starts and unfinished candidates are stopped; the best
+                             candidate among those evaluated in time is kept.
+        max_workers (int): Number of worker processes. Defaults to the number of CPUs.
+        random_state (int): Seed of the validation split and the samples.
+
+        Returns:
+        Pipeline: The best candidate, refitted on every row.
+        pd.DataFrame: The leaderboard, one row per candidate at the last rung it reached, best first.
+        """
+        from source.data_splitter import SimpleTrainTestSplitStrategy
+
+        if sparse.issparse(X_train):
+            X = sparse.csr_matrix(X_train, dtype=np.float64)
+        else:
+            X = np.asarray(X_train, dtype=np.float64)
+        y = np.asarray(y_train, dtype=np.float64)
+        fit_rows, val_rows = SimpleTrainTestSplitStrategy(validation_size, random_state).split_indices(y)
+        X_fit, y_fit, X_val, y_val = X[fit_rows], y[fit_rows], X[val_rows], y[val_rows]
+        order = np.random.default_rng(random_state).permutation(len(fit_rows))
+
+        strategies = [
+            strategy_class(**params)
+            for strategy_class, grid in (candidates or DEFAULT_SEARCH_SPACE)
+            for params in ParameterGrid(grid)
+        ]
+        n_rungs = max(1, math.ceil(math.log(len(strategies), eta)))
+        sizes = [max(min(min_samples, len(fit_rows)), len(fit_rows) // eta ** (n_rungs - 1 - rung)) for rung in range(n_rungs)]
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+
+        logging.info(f"Searching {len(strategies)} candidates over {n_rungs} rungs of {sizes} rows.")
+        latest = {}
+        survivors = list(range(len(strategies)))
+        # A multiprocessing pool rather than a ProcessPoolExecutor: when the budget runs out, its workers can be
+        # terminated in the middle of a fit instead of being waited for.
+        pool = multiprocessing.Pool(
+            processes=min(max_workers or os.cpu_count() or 1, len(strategies)),
+            initializer=_init_search_worker, initargs=(X_fit, y_fit, X_val, y_val, order),
+        )
+        finished = False
+        try:
+            for rung, n_samples in enumerate(sizes):
+                tasks = [
+                    pool.apply_async(_evaluate_candidate, (candidate, strategies[candidate], n_samples))
+                    for candidate in survivors
+                ]
+                for task in tasks:
+                    task.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+                # Only the candidates that finished in time are ranked; the others are stopped below.
+                results = [task.get() for task in tasks if task.ready()]
+                if len(results) < len(tasks):
+                    logging.warning(f"Time budget exhausted during rung {rung}: "
+                                    f"{len(tasks) - len(results)} of {len(tasks)} candidates stopped.")
+                for result in results:
+                    latest[result["candidate"]] = {**result, "rung": rung}
+
+                ranked = sorted((r for r in results if r["status"] == "ok"), key=lambda r: r["rmse"])
+                survivors = [r["candidate"] for r in ranked[:max(1, math.ceil(len(ranked) / eta))]]
+                if len(results) < len(tasks) or len(survivors) <= 1 and rung < n_rungs - 1:
+                    break
+            finished = all(task.ready() for task in tasks)
+        finally:
+            # Candidates still running when the budget ran out (or the search failed) are killed, not waited for.
+            if finished:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+
+        leaderboard = pd.DataFrame([
+            {
+                "strategy": type(strategies[candidate]).__name__,
+                "params": strategies[candidate].params,
+                **{key: value for key, value in result.items() if key != "candidate"},
+            }
+            for candidate, result in latest.items()
+        ])
+        if leaderboard.empty or not (leaderboard["status"] == "ok").any():
+            raise RuntimeError("No candidate could be evaluated within the time budget.")
+        leaderboard = leaderboard.sort_values(["rung", "rmse"], ascending=[False, True], na_position="last")
+        leaderboard = leaderboard.reset_index(drop=True)
+
+        best = strategies[next(candidate for candidate, result in sorted(
+            latest.items(), key=lambda item: (-item[1]["rung"], item[1].get("rmse", np.inf))
+        ) if result["status"] == "ok")]
+        logging.info(f"Best candidate: {type(best).__name__} {best.params}. Refitting on every row.")
+        return _candidate_pipeline(best, sparse.issparse(X)).fit(X, y), leaderboard
@@ -0,0 +1,113 @@
+import logging
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+
+from source.design_matrix import build_preprocessor, fit_pipeline_once
+from source.model_building import BinnedHistGradientBoostingStrategy, LinearRegressionStrategy, ModelBuilder
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def split_feature_columns(X: pd.DataFrame) -> Tuple[pd.Index, pd.Index, pd.Index]:
+    """
+    Identifies the numerical, categorical and sparse (already one-hot encoded) columns of the features.
+    """
+    categorical_cols = X.select_dtypes(include=["object", "category"]).columns
+    sparse_cols = X.columns[[isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes]]
+    numerical_cols = X.select_dtypes(include="number").columns.difference(sparse_cols, sort=False)
+    return numerical_cols, categorical_cols, sparse_cols
+
+
+def expected_columns(pipeline: Pipeline) -> List[str]:
+    """
+    Returns the columns the model of a trained pipeline sees, from its fitted preprocessor.
+    """
+    preprocessor = pipeline.named_steps["preprocessor"]
+    if not isinstance(preprocessor, ColumnTransformer):
+        return list(preprocessor.get_feature_names_out())
+    columns = []
+    for name, transformer, transformer_columns in preprocessor.transformers_:
+        if name == "cat" and len(transformer_columns):
+            columns += list(transformer.named_steps["onehot"].get_feature_names_out(transformer_columns))
+        elif name in ("num", "sparse"):
+            columns += list(transformer_columns)
+    return columns
+
+
+def train_pipeline(X_train: pd.DataFrame, y_train: pd.Series, model_type: str = "linear", search: bool = False,
+                   search_time_budget: Optional[float] = None, design_matrix_dir: Optional[str] = None,
+                   n_threads: Optional[int] = None, autolog: bool = False) -> Tuple[Pipeline, Optional[pd.DataFrame]]:
+    """
+    Trains the preprocessor + model pipeline of model_building_step.
+
+    The preprocessor and the model are fitted separately (the design matrix is computed once and, for a search,
+    shared by every candidate), so none of the fits is the pipeline itself. With autolog, mlflow.sklearn.autolog
+    therefore only records the parameters and metrics of the fits, and the trained pipeline is logged explicitly as
+    the run's "model": the artifact that is deployed and served raw records.
+
+    Parameters:
+    X_train (pd.DataFrame): The training data features.
+    y_train (pd.Series): The training data labels/target.
+    model_type (str): "linear", or "hist_gradient_boosting" for histogram gradient boosting on binned features
+                      with native categorical support. Ignored when search is set.
+    search (bool): Search ridge, lasso, elastic net and histogram gradient boosting grids (ModelBuilder.search)
+                   and keep the best.
+    search_time_budget (float): Seconds the search may take.
+    design_matrix_dir (str): Directory of a DesignMatrixCache for the binned gradient boosting matrices.
+    n_threads (int): Threads used to train histogram gradient boosting. Defaults to every core.
+    autolog (bool): Log the fits and the trained pipeline to the active MLflow run.
+
+    Returns:
+    Pipeline: The trained pipeline: a "preprocessor" and a "model" step.
+    pd.DataFrame: The search leaderboard, or None without a search.
+    """
+    if autolog:
+        import mlflow
+
+        mlflow.sklearn.autolog(log_models=False)
+
+    numerical_cols, categorical_cols, sparse_cols = split_feature_columns(X_train)
+    logging.info(f"Categorical columns: {categorical_cols.tolist()}")
+    logging.info(f"Numerical columns: {numerical_cols.tolist()}")
+    logging.info(f"Sparse columns: {len(sparse_cols)}")
+    preprocessor = build_preprocessor(numerical_cols, categorical_cols, sparse_cols)
+
+    leaderboard = None
+    if search:
+        # The matrix is preprocessed once and shared by every candidate; a sparse matrix stays sparse for the
+        # linear candidates and is only densified inside the tree candidates.
+        X_preprocessed = preprocessor.fit_transform(X_train)
+        if autolog:
+            # The candidate and halving fits (also in the forked workers) are not the run's model; the leaderboard
+            # records them instead.
+            mlflow.sklearn.autolog(disable=True)
+        try:
+            best_model, leaderboard = ModelBuilder(LinearRegressionStrategy()).search(
+                X_preprocessed, y_train, time_budget=search_time_budget
+            )
+        finally:
+            if autolog:
+                mlflow.sklearn.autolog(log_models=False)
+        pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", best_model)])
+    elif model_type == "hist_gradient_boosting":
+        # The binned matrix and fitted binner are cached by the strategy itself in design_matrix_dir.
+        logging.info("Building and training the histogram gradient boosting model.")
+        strategy = BinnedHistGradientBoostingStrategy(n_threads=n_threads, cache_dir=design_matrix_dir)
+        pipeline = ModelBuilder(strategy).build_model(X_train, y_train)
+    elif model_type == "linear":
+        logging.info("Building and training the Linear Regression model.")
+        pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+        pipeline, _ = fit_pipeline_once(pipeline, X_train, y_train)
+    else:
+        raise ValueError(f"Unsupported model type {model_type}.")
+    logging.info("Model training completed.")
+    logging.info(f"Model expects the following columns: {expected_columns(pipeline)}")
+
+    if autolog:
+        mlflow.sklearn.log_model(pipeline, "model")
+    return pipeline, leaderboard
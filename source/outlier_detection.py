@@ -1,13 +1,107 @@
+import json
 import logging
-from typing import List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
 from abc import ABC, abstractmethod
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def numeric_block(data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """
+    Returns the data as one 2-D float NumPy block. float32 is kept when every column fits in it,
+    so compact (downcast) frames are not widened to float64.
+    """
+    if isinstance(data, np.ndarray):
+        return data if data.dtype.kind == "f" else data.astype(np.float64)
+    dtype = np.result_type(np.float32, *data.dtypes)
+    return data.to_numpy(dtype=dtype if dtype.kind == "f" else np.float64)
+
+
+def bounds_in_dtype(dtype, low: float, high: float) -> Tuple[Optional[object], Optional[object]]:
+    """
+    Casts float capping bounds to a column's dtype; infinite bounds become None (unbounded).
+    Integer bounds are rounded inwards and limited to the dtype's range, so clipping never overflows.
+    """
+    kind = getattr(dtype, "numpy_dtype", dtype).kind
+    if kind in "iu":
+        info = np.iinfo(getattr(dtype, "numpy_dtype", dtype))
+        lower = None if not np.isfinite(low) or low <= info.min else int(min(np.ceil(low), info.max))
+        upper = None if not np.isfinite(high) or high >= info.max else int(max(np.floor(high), info.min))
+        return lower, upper
+    scalar = getattr(dtype, "numpy_dtype", dtype).type if kind == "f" else float
+    return (scalar(low) if np.isfinite(low) else None), (scalar(high) if np.isfinite(high) else None)
+
+
+def bounds_row_mask(values: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """
+    Flags the rows with at least one value outside its column's [low, high] bounds. Missing values are never outliers.
+
+    The mask is accumulated column by column, so the only temporaries are a few arrays of one column's length.
+
+    Returns:
+    np.ndarray: Boolean array with one entry per row.
+    """
+    mask = np.zeros(values.shape[0], dtype=bool)
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        mask |= column < low[j]
+        mask |= column > high[j]
+    return mask
+
+
+def boxplot_summary(df: pd.DataFrame, features: list) -> dict:
+    """
+    Computes the statistics a boxplot shows for each feature, with all quartiles in one quantile call.
+
+    Parameters:
+    df (pd.DataFrame): The dataframe containing the features.
+    features (list): The numeric features to summarize.
+
+    Returns:
+    dict: Per feature: count, q1, median, q3, the whisker ends (most extreme values within 1.5 IQR of the
+          quartiles) and the number of values outside them.
+    """
+    values = numeric_block(df[features])
+    q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+    IQR = q3 - q1
+    summary = {}
+    for j, feature in enumerate(features):
+        column = values[:, j]
+        column = column[~np.isnan(column)]
+        inside = column[(column >= q1[j] - 1.5 * IQR[j]) & (column <= q3[j] + 1.5 * IQR[j])]
+        summary[feature] = {
+            "count": int(len(column)),
+            "q1": float(q1[j]),
+            "median": float(median[j]),
+            "q3": float(q3[j]),
+            "whisker_low": float(inside.min()) if len(inside) else None,
+            "whisker_high": float(inside.max()) if len(inside) else None,
+            "n_outliers": int(len(column) - len(inside)),
+        }
+    return summary
+
+
+def _render_boxplot(feature: str, values: np.ndarray, path: str, dpi: int) -> str:
+    """
+    Draws one boxplot to a file. Runs in a worker process; the Figure is created without pyplot, so no GUI
+    backend or global figure state is involved.
+    """
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.boxplot(x=pd.Series(values, name=feature), ax=ax)
+    ax.set_title(f"Boxplot of {feature}")
+    fig.savefig(path, dpi=dpi)
+    return path
+
+
 class OutlierDetectionStrategy(ABC):
     @abstractmethod
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -22,30 +116,209 @@ class OutlierDetectionStrategy(ABC):
         """
         pass
 
+    @abstractmethod
+    def compute_bounds(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Abstract method to compute the per-column bounds outside which a value is an outlier.
+
+        Parameters:
+        values (np.ndarray): 2-D float block, one column per feature.
+
+        Returns:
+        np.ndarray: Lower bound of each column.
+        np.ndarray: Upper bound of each column.
+        """
+        pass
+
+    def outlier_row_mask(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Flags the rows containing at least one outlier without building a boolean DataFrame.
+
+        Parameters:
+        data (pd.DataFrame or np.ndarray): Numeric features, as a DataFrame or a float32/float64 block.
+
+        Returns:
+        np.ndarray: Boolean array with one entry per row.
+        """
+        values = numeric_block(data)
+        low, high = self.compute_bounds(values)
+        return bounds_row_mask(values, low, high)
+
 class ZScoreOutlierDetection(OutlierDetectionStrategy):
     def __init__(self, threshold=3):
         self.threshold = threshold
 
+    def compute_bounds(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # |x - mean| / std > threshold  <=>  x outside mean -/+ threshold * std (sample std, as pandas).
+        mean = np.nanmean(values, axis=0)
+        spread = self.threshold * np.nanstd(values, axis=0, ddof=1)
+        return mean - spread, mean + spread
+
     def detect_outliers(self, df):
         logging.info("Detecting outliers using Z-score method.")
-        z_scores = np.abs((df - df.mean())/df.std())
-        outliers = z_scores > self.threshold
+        values = numeric_block(df)
+        low, high = self.compute_bounds(values)
+        outliers = pd.DataFrame((values < low) | (values > high), index=df.index, columns=df.columns)
         logging.info(f"Outliers detected with Z-score threshold: {self.threshold}.")
         return outliers
 
 class IQROutliersDetection(OutlierDetectionStrategy):
+    def compute_bounds(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Both quartiles of every column in a single call, i.e. one partial sort per column.
+        quantile = np.nanquantile if np.isnan(values).any() else np.quantile
+        q1, q3 = quantile(values, [0.25, 0.75], axis=0)
+        IQR = q3 - q1
+        return q1 - 1.5 * IQR, q3 + 1.5 * IQR
+
     def detect_outliers(self, df: pd.DataFrame):
         logging.info("Detecting outliers using IQR method.")
-        q1 = df.quantile(0.25)
-        q3 = df.quantile(0.75)
-        IQR = q3 - q1
-        outliers = (df < (q1 - 1.5 * IQR)) | (df > (q3 + 1.5 * IQR))
+        values = numeric_block(df)
+        low, high = self.compute_bounds(values)
+        outliers = pd.DataFrame((values < low) | (values > high), index=df.index, columns=df.columns)
         logging.info("Outliers detected using the IQR method.")
         return outliers
-    
+
+class IsolationForestOutlierDetection(OutlierDetectionStrategy):
+    def __init__(self, features=None, n_estimators=100, max_samples=256, contamination="auto",
+                 fit_sample_size=100_000, batch_size=16_384, n_jobs=-1, random_state=42):
+        """
+        Initializes the multivariate outlier detection with an isolation forest, which flags rows whose
+        combination of values is unusual (e.g. a huge Gr Liv Area on a tiny Lot Area) even when every value is
+        plausible on its own.
+
+        Parameters:
+        features (list): The features looked at jointly. None uses every column of the fitted DataFrame.
+        n_estimators (int): Number of trees.
+        max_samples (int or float): Rows drawn to grow each tree.
+        contamination ("auto" or float): Expected share of outliers, which sets the score threshold.
+        fit_sample_size (int): Fit on a random sample of at most this many rows. None fits on every row.
+        batch_size (int): Rows scored per batch; batches are scored in parallel.
+        n_jobs (int): Cores used to fit the trees and score the batches. -1 uses all of them.
+        random_state (int): Seed of the sampling and the trees.
+        """
+        self.features = features
+        self.n_estimators = n_estimators
+        self.max_samples = max_samples
+        self.contamination = contamination
+        self.fit_sample_size = fit_sample_size
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.columns_ = None
+        self.fill_values_ = None
+        self.forest_ = None
+
+    def fit(self, df: pd.DataFrame) -> "IsolationForestOutlierDetection":
+        """
+        Fits the forest on the features of the DataFrame (or a sample of its rows).
+
+        Parameters:
+        df (pd.DataFrame): The (training) numeric DataFrame.
+
+        Returns:
+        IsolationForestOutlierDetection: The fitted strategy.
+        """
+        from sklearn.ensemble import IsolationForest
+
+        self.columns_ = list(self.features) if self.features is not None else list(df.columns)
+        values = numeric_block(df[self.columns_])
+        if self.fit_sample_size is not None and len(values) > self.fit_sample_size:
+            rng = np.random.default_rng(self.random_state)
+            values = values[np.sort(rng.choice(len(values), self.fit_sample_size, replace=False))]
+
+        # The forest does not take missing values; they are replaced by the column medians.
+        self.fill_values_ = np.nan_to_num(np.nanmedian(values, axis=0))
+        self.forest_ = IsolationForest(
+            n_estimators=self.n_estimators, max_samples=self.max_samples, contamination=self.contamination,
+            n_jobs=self.n_jobs, random_state=self.random_state,
+        ).fit(self._fill(values))
+        logging.info(f"Fitted isolation forest on {len(values)} rows and {len(self.columns_)} columns.")
+        return self
+
+    def _fill(self, values: np.ndarray) -> np.ndarray:
+        missing = np.isnan(values)
+        return np.where(missing, self.fill_values_, values) if missing.any() else values
+
+    def score(self, values: np.ndarray) -> np.ndarray:
+        """
+        Scores a float block whose columns are in the fitted order; below zero means outlier.
+
+        Large blocks are split into batches scored in parallel threads (tree traversal releases the GIL),
+        which bounds the memory of the per-tree intermediates.
+
+        Parameters:
+        values (np.ndarray): Rows of shape (n_rows, n_columns), or a single row of shape (n_columns,).
+
+        Returns:
+        np.ndarray: The score of each row.
+        """
+        from joblib import Parallel, delayed
+
+        if self.forest_ is None:
+            raise ValueError("IsolationForestOutlierDetection must be fitted before scoring.")
+        values = self._fill(np.atleast_2d(values).astype(np.float32, copy=False))
+        if len(values) <= self.batch_size:
+            return self.forest_.decision_function(values)
+        batches = [values[start:start + self.batch_size] for start in range(0, len(values), self.batch_size)]
+        scores = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(self.forest_.decision_function)(batch) for batch in batches
+        )
+        return np.concatenate(scores)
+
+    def is_outlier(self, values: np.ndarray) -> np.ndarray:
+        """
+        Flags rows (e.g. serving requests) given as a float block in the fitted column order.
+        """
+        return self.score(values) < 0
+
+    def compute_bounds(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # A row is an outlier because of its combination of values, so there are no per-column bounds to cap to.
+        raise ValueError("IsolationForestOutlierDetection flags whole rows and cannot cap; use method='remove'.")
+
+    def outlier_row_mask(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        if self.forest_ is None:
+            self.fit(data)
+        if isinstance(data, pd.DataFrame):
+            data = data[self.columns_]
+        return self.is_outlier(numeric_block(data))
+
+    def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
+        logging.info("Detecting outliers using an isolation forest.")
+        mask = self.outlier_row_mask(df)
+        # A whole row is an outlier, so every one of its cells is flagged.
+        outliers = pd.DataFrame(np.repeat(mask[:, np.newaxis], df.shape[1], axis=1), index=df.index, columns=df.columns)
+        logging.info(f"Isolation forest flagged {int(mask.sum())} rows.")
+        return outliers
+
+    def save(self, path: str):
+        """
+        Saves the fitted strategy with joblib, for flagging suspicious requests at serving time.
+        """
+        import joblib
+
+        if self.forest_ is None:
+            raise ValueError("IsolationForestOutlierDetection must be fitted before it is saved.")
+        joblib.dump(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IsolationForestOutlierDetection":
+        """
+        Loads a strategy saved with save().
+        """
+        import joblib
+
+        return joblib.load(path)
+
+# Strategies that OutlierDetector.load can rebuild from saved bounds
+OUTLIER_DETECTION_STRATEGIES = {
+    strategy.__name__: strategy for strategy in (ZScoreOutlierDetection, IQROutliersDetection)
+}
+
 class OutlierDetector:
     def __init__(self, strategy: OutlierDetectionStrategy):
         self.strategy = strategy
+        self.bounds_ = None
+        self._bounds_arrays = {}
 
     def set_strategy(self, strategy: OutlierDetectionStrategy):
         logging.info("Switching outlier detection strategy.")
@@ -54,21 +327,164 @@ class OutlierDetector:
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Executing outlier detection strategy.")
         return self.strategy.detect_outliers(df)
-    
+
+    def outlier_row_mask(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info("Executing outlier detection strategy.")
+        return self.strategy.outlier_row_mask(df)
+
+    def fit(self, df: pd.DataFrame) -> "OutlierDetector":
+        """
+        Computes the capping bounds of every column once, with the strategy's rule (z-score or IQR).
+
+        Parameters:
+        df (pd.DataFrame): The (training) numeric DataFrame.
+
+        Returns:
+        OutlierDetector: The fitted detector.
+        """
+        low, high = self.strategy.compute_bounds(numeric_block(df))
+        # Columns without finite bounds (e.g. all missing) are left unbounded.
+        self.bounds_ = {
+            column: [float(l) if np.isfinite(l) else None, float(h) if np.isfinite(h) else None]
+            for column, l, h in zip(df.columns, low, high)
+        }
+        self._bounds_arrays = {}
+        logging.info(f"Computed capping bounds for {len(self.bounds_)} columns.")
+        return self
+
+    def bounds_for(self, columns: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the lower and upper bounds aligned with the given columns; columns without bounds are unbounded.
+        The arrays are cached per column order, so repeated requests do no lookups.
+        """
+        if self.bounds_ is None:
+            raise ValueError("OutlierDetector must be fitted before capping.")
+        key = tuple(columns)
+        if key not in self._bounds_arrays:
+            low = np.full(len(key), -np.inf)
+            high = np.full(len(key), np.inf)
+            for i, column in enumerate(key):
+                l, h = self.bounds_.get(column, (None, None))
+                low[i] = -np.inf if l is None else l
+                high[i] = np.inf if h is None else h
+            self._bounds_arrays[key] = (low, high)
+        return self._bounds_arrays[key]
+
+    def cap_array(self, values: np.ndarray, columns: Sequence[str]) -> np.ndarray:
+        """
+        Clips a float block (one row or a batch, columns in the given order) to the fitted bounds in place.
+        Meant for the serving path. Missing values are left missing.
+        """
+        low, high = self.bounds_for(columns)
+        return np.clip(values, low, high, out=values)
+
+    def cap(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clips (winsorizes) the columns with fitted bounds, without recomputing them.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to cap.
+
+        Returns:
+        pd.DataFrame: The same DataFrame, capped in place; every column keeps its dtype.
+        """
+        if self.bounds_ is None:
+            raise ValueError("OutlierDetector must be fitted before capping.")
+        columns = [column for column in df.columns if column in self.bounds_]
+        low, high = self.bounds_for(columns)
+        # One column at a time, with the bounds cast to the column's dtype, so compact int8/int16/float32 columns
+        # are not widened to float64 and no copy of the whole frame is made.
+        for column, l, h in zip(columns, low, high):
+            lower, upper = bounds_in_dtype(df[column].dtype, l, h)
+            if lower is not None or upper is not None:
+                df[column] = df[column].clip(lower, upper)
+        return df
+
+    def save(self, path: str):
+        """
+        Saves the strategy and the fitted bounds as JSON.
+
+        Parameters:
+        path (str): Destination file.
+        """
+        if self.bounds_ is None:
+            raise ValueError("OutlierDetector must be fitted before it is saved.")
+        with open(path, "w") as f:
+            json.dump({
+                "strategy": type(self.strategy).__name__,
+                "params": vars(self.strategy),
+                "bounds": self.bounds_,
+            }, f)
+        logging.info(f"Saved outlier capping bounds to {path}.")
+
+    @classmethod
+    def load(cls, path: str) -> "OutlierDetector":
+        """
+        Loads a detector saved with save(), ready to cap.
+
+        Parameters:
+        path (str): File written by save().
+
+        Returns:
+        OutlierDetector: The fitted detector.
+        """
+        with open(path) as f:
+            state = json.load(f)
+        detector = cls(OUTLIER_DETECTION_STRATEGIES[state["strategy"]](**state["params"]))
+        detector.bounds_ = state["bounds"]
+        return detector
+
     def handle_outliers(self, df:pd.DataFrame, method="remove", **kwargs) -> pd.DataFrame:
-        outliers = self.detect_outliers(df)
         if method =="remove":
             logging.info("Removing outliers from the dataset.")
-            df_cleaned = df[(~outliers).all(axis=1)]
+            df_cleaned = df[~self.outlier_row_mask(df)]
         elif method =="cap":
             logging.info("Capping outliers from the dataset.")
+            df_cleaned = self.fit(df).cap(df)
         else:
             logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
             return df
         logging.info("Outlier handling completed.")
         return df_cleaned
 
-    def visualize_outliers(self, df: pd.DataFrame, features: list) -> List[plt.Figure]:
+    def render_outlier_plots(self, df: pd.DataFrame, features: list, output_dir: str = "outlier_plots",
+                             fmt: str = "png", dpi: int = 80, max_workers: Optional[int] = None) -> List[str]:
+        """
+        Renders one boxplot per feature to image files in a process pool, instead of returning live figures.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing the features.
+        features (list): The features to plot.
+        output_dir (str): Directory the images are written to.
+        fmt (str): Image format, "png" or "svg".
+        dpi (int): Resolution of PNG images.
+        max_workers (int): Number of rendering processes. Defaults to the number of CPUs.
+
+        Returns:
+        list: Paths of the written images, in feature order.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = [
+            os.path.join(output_dir, "boxplot_" + "".join(c if c.isalnum() else "_" for c in feature) + f".{fmt}")
+            for feature in features
+        ]
+        if not features:
+            return paths
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(features))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Only each feature's values are sent to the workers, not the whole frame.
+            paths = list(executor.map(
+                _render_boxplot, features, [df[feature].to_numpy() for feature in features], paths,
+                [dpi] * len(features),
+            ))
+        logging.info(f"Rendered {len(paths)} outlier plots to {output_dir}.")
+        return paths
+
+    def visualize_outliers(self, df: pd.DataFrame, features: list) -> list:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         figures = []
         for feature in features:
             fig, ax = plt.subplots(figsize=(10, 6))
@@ -77,4 +493,4 @@ class OutlierDetector:
             figures.append(fig)
             plt.close(fig)  # Optional: prevent inline display
         logging.info("Outlier visualization completed.")
-        return figures
\ No newline at end of file
+        return figures
@@ -0,0 +1,32 @@
+import logging
+from typing import Annotated, Optional
+from zenml import step
+import pandas as pd
+from source.backtest import BacktestRunner
+from source.data_splitter import TemporalSplitStrategy
+from source.model_building import LinearRegressionStrategy
+
+
+@step(enable_cache=False)
+def backtest_step(df: pd.DataFrame, target_column: str = "SalePrice", window: str = "expanding",
+                  test_months: int = 6, train_months: Optional[int] = None, min_train_months: int = 12,
+                  max_workers: Optional[int] = None) -> Annotated[dict, "Backtest_report"]:
+    """
+    Backtests the linear regression model on time windows keyed on Yr Sold/Mo Sold, training and evaluating
+    the windows in parallel worker processes.
+
+    The numeric columns of df are used as features, so missing values must be handled upstream.
+
+    Returns:
+    dict: Per-window metrics with their mean, standard deviation and pooled values.
+    """
+    if df is None or target_column not in df.columns:
+        raise ValueError(f"Input df must contain the target column '{target_column}'.")
+
+    splitter = TemporalSplitStrategy(window=window, test_months=test_months, train_months=train_months,
+                                     min_train_months=min_train_months)
+    report = BacktestRunner(LinearRegressionStrategy(), splitter, max_workers=max_workers).run(
+        df.select_dtypes(include="number"), target_column
+    )
+    logging.info(f"Backtest mean metrics over {report['n_windows']} windows: {report['mean']}")
+    return report
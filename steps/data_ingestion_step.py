@@ -1,17 +1,40 @@
+import os
 from source.ingest_data import DataIngestorFactory
+from source.data_schema import DATASET_SCHEMAS
 from zenml import step
-from typing import Annotated
+from typing import Annotated, Optional
 import pandas as pd
 
 @step
-def data_ingestion_step(file_path: str) -> Annotated[pd.DataFrame, "DataFrame"]:
-    """Ingest data from a ZIP file using the appropriate DataIngestor."""
+def data_ingestion_step(file_path: str, member: Optional[str] = None,
+                        schema: Optional[str] = "ames",
+                        chunksize: Optional[int] = None,
+                        max_workers: Optional[int] = None,
+                        cache_dir: Optional[str] = "ingest_cache",
+                        refresh_cache: bool = False,
+                        max_cache_bytes: Optional[int] = 2 * 1024**3,
+                        max_cache_age: Optional[float] = 30 * 24 * 3600) -> Annotated[pd.DataFrame, "DataFrame"]:
+    """Ingest data from a ZIP file, a directory or several archives using the appropriate DataIngestor."""
     # Determine the file extension.
-    file_extension = ".zip" # Since we're dealing with ZIP files, this is hardcoded
+    if file_path.endswith(".zip") and os.pathsep not in file_path:
+        file_extension = ".zip"
+        ingestor_options = {"member": member, "chunksize": chunksize}
+    else:
+        # A directory, or several archives/csv files separated by os.pathsep, parsed in parallel
+        file_extension = ""
+        ingestor_options = {"max_workers": max_workers}
 
-    # Get the appropriate DataIngestor
-    data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension)
+    # Get the appropriate DataIngestor, streaming the csv member straight out of the archive.
+    # Unchanged archives are served from the columnar cache instead of being re-parsed (cache_dir=None disables it).
+    data_ingestor = DataIngestorFactory.get_data_ingestor(
+        file_extension,
+        cache_dir=cache_dir,
+        refresh_cache=refresh_cache,
+        max_cache_bytes=max_cache_bytes,
+        max_cache_age=max_cache_age,
+        **ingestor_options,
+    )
 
-    # Ingest the data and load it into a DataFrame
-    df = data_ingestor.ingest(file_path)
-    return df
\ No newline at end of file
+    # Ingest the data and load it into a DataFrame, with the compact dtypes of the declared schema (schema=None infers them)
+    df = data_ingestor.ingest(file_path, schema=DATASET_SCHEMAS[schema] if schema is not None else None)
+    return df
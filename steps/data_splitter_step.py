@@ -1,12 +1,22 @@
 import logging
 from zenml import step
-from typing import Tuple, Annotated
+from typing import Tuple, Annotated, Optional
 import pandas as pd
-from source.data_splitter import DataSplitter, SimpleTrainTestSplitStrategy
+from source.data_splitter import DataSplitter, SimpleTrainTestSplitStrategy, KFoldSplitStrategy, TemporalSplitStrategy
 
 @step
 def data_splitter_step(df:pd.DataFrame,target_column: str,
-                       strategy:str="train_test"
+                       strategy:str="train_test",
+                       test_size: float = 0.2,
+                       random_state: int = 42,
+                       n_splits: int = 5,
+                       year_column: str = "Yr Sold",
+                       month_column: str = "Mo Sold",
+                       window: str = "expanding",
+                       test_months: int = 6,
+                       train_months: Optional[int] = None,
+                       step_months: Optional[int] = None,
+                       min_train_months: int = 12,
                        )-> Tuple[
                            Annotated[pd.DataFrame, "X_train"],
                            Annotated[pd.DataFrame, "X_test"],
@@ -16,7 +26,16 @@ def data_splitter_step(df:pd.DataFrame,target_column: str,
     if (df is None) or (target_column is None):
         raise FileNotFoundError("Dataframe not found.")
     if strategy=="train_test":
-        splitter = DataSplitter(SimpleTrainTestSplitStrategy())
+        splitter = DataSplitter(SimpleTrainTestSplitStrategy(test_size=test_size, random_state=random_state))
+    elif strategy=="kfold":
+        # The step outputs a single split, the first fold; iterate DataSplitter.iter_splits for cross-validation.
+        splitter = DataSplitter(KFoldSplitStrategy(n_splits=n_splits, random_state=random_state))
+    elif strategy=="temporal":
+        # The most recent test_months of sales are the test set.
+        splitter = DataSplitter(TemporalSplitStrategy(
+            year_column=year_column, month_column=month_column, window=window, test_months=test_months,
+            train_months=train_months, step_months=step_months, min_train_months=min_train_months,
+        ))
     else:
         raise ValueError(f"Unsupported data split strategy:{strategy}.")
     X_train, X_test, y_train, y_test = splitter.split(df,target_column)
@@ -1,25 +1,58 @@
 from zenml import step
 import pandas as pd
-from typing import Annotated
-from source.feature_engineering import FeatureEngineer, LogTransformation, MinMaxScaling, StandardScaling, OneHotEncoding
+from typing import Annotated, List, Optional
+from source.feature_engineering import FeatureEngineer, FeatureEngineeringStrategy, LogTransformation, MinMaxScaling, StandardScaling, OneHotEncoding, HashingEncoding
 
-@step
-def feature_engineering_step(df: pd.DataFrame, features: list = None, strategy: str ="log" 
-                             ) -> Annotated[pd.DataFrame, "Transformed_dataframe"]:
-    """Performs feature engineering using FeatureEngineer and selected strategy."""
-    
-    if features is None:
-        features = []
+
+def _build_strategy(strategy: str, features: list, sparse: bool = False,
+                    n_buckets: int = 1024) -> FeatureEngineeringStrategy:
+    """Returns the FeatureEngineeringStrategy registered under the given name."""
     if strategy == "log":
-        engineer = FeatureEngineer(LogTransformation(features))
+        return LogTransformation(features)
     elif strategy == "standard_scaling":
-        engineer = FeatureEngineer(StandardScaling(features))
+        return StandardScaling(features)
     elif strategy == "minmax_scaling":
-        engineer = FeatureEngineer(MinMaxScaling(features))
+        return MinMaxScaling(features)
     elif strategy == "onehot_encoding":
-        engineer = FeatureEngineer(OneHotEncoding(features))
+        return OneHotEncoding(features, sparse=sparse)
+    elif strategy == "hashing":
+        return HashingEncoding(features, n_buckets=n_buckets)
     else:
         raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
+
+
+@step
+def feature_engineering_step(df: pd.DataFrame, features: list = None, strategy: str ="log",
+                             plan: Optional[List[list]] = None, inplace: bool = False,
+                             fit: bool = True, state_path: Optional[str] = None,
+                             sparse: bool = False, n_buckets: int = 1024,
+                             ) -> Annotated[pd.DataFrame, "Transformed_dataframe"]:
+    """
+    Performs feature engineering using FeatureEngineer and selected strategy.
+
+    plan chains several strategies into one execution plan, e.g.
+    [["log", ["Gr Liv Area", "SalePrice"]], ["standard_scaling", ["Gr Liv Area"]]]; it takes precedence over
+    strategy/features.
+
+    With fit=True the fitted parameters are saved to state_path when given; with fit=False the plan saved at
+    state_path is applied without refitting, e.g. to test or batch-scoring data.
+
+    sparse makes one-hot encoding emit pandas sparse columns, which the model building step keeps sparse.
+    "hashing" hashes high-cardinality categoricals into n_buckets sparse columns without storing a vocabulary.
+    """
+    if not fit:
+        if state_path is None:
+            raise ValueError("state_path is required to apply a saved feature engineering plan.")
+        return FeatureEngineer.load(state_path, inplace=inplace).transform(df)
+
+    if features is None:
+        features = []
+    if plan is not None:
+        engineer = FeatureEngineer([_build_strategy(name, plan_features, sparse, n_buckets) for name, plan_features in plan], inplace=inplace)
+    else:
+        engineer = FeatureEngineer(_build_strategy(strategy, features, sparse, n_buckets), inplace=inplace)
     
     transformed_df = engineer.apply_feature_engineering(df)
-    return transformed_df
\ No newline at end of file
+    if state_path is not None:
+        engineer.save(state_path)
+    return transformed_df
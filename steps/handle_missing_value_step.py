@@ -1,17 +1,37 @@
 import pandas as pd
-from source.handle_missing_values import DropMissingValuesStrategy, FillingMissingValuesStrategy,MissingValueHandler
+from source.handle_missing_values import (DropMissingValuesStrategy, FillingMissingValuesStrategy,
+                                          GroupedFillingMissingValuesStrategy, MissingValueHandler,
+                                          load_missing_value_strategy)
 from zenml import step
-from typing import Annotated
+from typing import Annotated, Optional
 
 @step
-def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> Annotated[pd.DataFrame, "Cleaned_Dataframe"]:
-    """Handles missing values using MissingValueHandler and the specified strategy."""
+def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean", fit: bool = True,
+                               state_path: Optional[str] = None,
+                               group_by: str = "Neighborhood") -> Annotated[pd.DataFrame, "Cleaned_Dataframe"]:
+    """
+    Handles missing values using MissingValueHandler and the specified strategy.
+
+    With fit=True the fill statistics are computed on df (and saved to state_path when given); with fit=False the
+    statistics saved at state_path are applied as-is, e.g. to test or batch-scoring data.
+    """
+    if not fit:
+        if state_path is None:
+            raise ValueError("state_path is required to apply saved missing value statistics.")
+        handler = MissingValueHandler(load_missing_value_strategy(state_path))
+        return handler.transform(df)
+
     if strategy == "drop":
-        handler = MissingValueHandler(DropMissingValuesStrategy(axis=0))
+        missing_value_strategy = DropMissingValuesStrategy(axis=0)
     elif strategy in ["mean", "median", "mode", "constant"]:
-        handler = MissingValueHandler(FillingMissingValuesStrategy(method=strategy))
+        missing_value_strategy = FillingMissingValuesStrategy(method=strategy)
+    elif strategy in ["group_mean", "group_median"]:
+        missing_value_strategy = GroupedFillingMissingValuesStrategy(group_by=group_by, method=strategy[len("group_"):])
     else:
         raise ValueError(f"Unsupported missing value handling strategy {strategy}.")
     
+    handler = MissingValueHandler(missing_value_strategy)
     cleaned_df = handler.handler(df)
-    return cleaned_df
\ No newline at end of file
+    if state_path is not None and hasattr(missing_value_strategy, "save"):
+        missing_value_strategy.save(state_path)
+    return cleaned_df
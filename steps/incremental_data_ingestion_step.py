@@ -0,0 +1,33 @@
+import os
+from source.ingest_data import DataIngestorFactory
+from source.data_schema import DATASET_SCHEMAS
+from zenml import step
+from typing import Annotated, Optional, Tuple
+import pandas as pd
+
+@step(enable_cache=False)
+def incremental_data_ingestion_step(file_path: str, state_dir: str = "ingest_state",
+                                    schema: Optional[str] = "ames",
+                                    chunksize: Optional[int] = 50_000,
+                                    max_workers: Optional[int] = None,
+                                    ) -> Tuple[Annotated[pd.DataFrame, "DataFrame"], Annotated[dict, "New_partition"]]:
+    """
+    Ingests only the rows past the watermark of the previous run and appends them to the stored history.
+
+    Returns the full dataset together with a description of the new partition (its number, the row offset where
+    it starts, its row count and the new watermark), so downstream steps can limit their work to the new rows.
+    """
+    # Determine the file extension.
+    if file_path.endswith(".zip") and os.pathsep not in file_path:
+        file_extension = ".zip"
+        ingestor_options = {"chunksize": chunksize}
+    else:
+        # A directory, or several archives/csv files separated by os.pathsep, parsed in parallel
+        file_extension = ""
+        ingestor_options = {"max_workers": max_workers}
+
+    data_ingestor = DataIngestorFactory.get_data_ingestor(
+        file_extension, incremental_state_dir=state_dir, **ingestor_options
+    )
+    df = data_ingestor.ingest(file_path, schema=DATASET_SCHEMAS[schema] if schema is not None else None)
+    return df, data_ingestor.new_partition
@@ -0,0 +1,49 @@
+import logging
+from typing import Annotated, List, Optional
+import joblib
+from sklearn.pipeline import Pipeline
+from zenml import step, ArtifactConfig
+from source.data_schema import DATASET_SCHEMAS
+from source.handle_missing_values import StreamingFillingMissingValuesStrategy
+from source.ingest_data import ZipDataIngestor
+from source.model_building import IncrementalSGDRegressionStrategy, ModelBuilder
+
+
+@step(enable_cache=False)
+def incremental_model_building_step(
+    file_path: str,
+    target_column: str = "SalePrice",
+    features: Optional[List[str]] = None,
+    member: Optional[str] = None,
+    schema: Optional[str] = "ames",
+    chunksize: int = 50_000,
+    n_epochs: int = 5,
+    warm_start_model_path: Optional[str] = None,
+    model_path: Optional[str] = None,
+) -> Annotated[Pipeline, ArtifactConfig(name="sgd_pipeline", is_model_artifact=True)]:
+    """
+    Trains a linear model out of core: the zip archive is streamed in chunks of chunksize rows for the
+    imputation statistics, the feature scaling and each SGD epoch, so memory is bounded by one chunk.
+
+    warm_start_model_path points to a joblib-saved pipeline whose coefficients training continues from: a
+    scaler/model pipeline of a previous incremental run, or the preprocessor/linear model pipeline of
+    model_building_step (e.g. the deployed one), whose numeric coefficients are mapped to the features by name and
+    whose categorical columns are folded into the intercept. The trained pipeline is saved to model_path when given.
+    """
+    ingestor = ZipDataIngestor(member=member, chunksize=chunksize)
+    dataset_schema = DATASET_SCHEMAS[schema] if schema is not None else None
+
+    def chunk_source():
+        return ingestor.iter_chunks(file_path, dataset_schema)
+
+    imputer = StreamingFillingMissingValuesStrategy("mean").fit_chunks(chunk_source())
+    warm_start_model = joblib.load(warm_start_model_path) if warm_start_model_path is not None else None
+    strategy = IncrementalSGDRegressionStrategy(
+        features=features, imputer=imputer, n_epochs=n_epochs, warm_start_model=warm_start_model
+    )
+
+    logging.info("Building and training the model incrementally over chunks.")
+    pipeline = ModelBuilder(strategy).build_model_from_chunks(chunk_source, target_column)
+    if model_path is not None:
+        joblib.dump(pipeline, model_path)
+    return pipeline
@@ -0,0 +1,26 @@
+import logging
+from typing import Annotated
+from zenml import step
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from source.linear_predictor import export_linear_pipeline
+
+
+@step(enable_cache=False)
+def linear_export_step(trained_model: Pipeline, X_test: pd.DataFrame,
+                       path: str = "linear_predictor.json") -> Annotated[str, "Linear_predictor_path"]:
+    """
+    Compiles the trained linear pipeline into a pure-NumPy LinearPredictor saved at path, checks that it agrees
+    with the pipeline on X_test to 1e-9 and logs the single-row latency of both.
+
+    Returns:
+    str: The path of the saved predictor, for predictor(linear_model_path=...).
+    """
+    if not isinstance(X_test, pd.DataFrame):
+        raise TypeError("X_test must be a pandas DataFrame.")
+
+    predictor = export_linear_pipeline(trained_model, path)
+    max_difference = predictor.check_parity(trained_model, X_test)
+    logging.info(f"Linear predictor matches the pipeline on {len(X_test)} rows (max difference {max_difference:.3g}).")
+    logging.info(f"Single-row latency in microseconds: {predictor.benchmark(trained_model, X_test)}")
+    return path
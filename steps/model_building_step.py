@@ -1,14 +1,12 @@
 from zenml import step, Model, ArtifactConfig
-from typing import Annotated
+from typing import Annotated, Optional
 import logging
 import mlflow
 
 import pandas as pd
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+
+from source.model_training import train_pipeline
 
 from zenml.client import Client
 #Get the a experiment tracker from Zenml
@@ -23,7 +21,9 @@ model = Model(
 
 @step(enable_cache=False,model=model, experiment_tracker=experiment_tracker.name)
 def model_building_step(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: pd.DataFrame, y_train: pd.Series, search: bool = False,
+    search_time_budget: Optional[float] = None, autolog: bool = True, design_matrix_dir: Optional[str] = None,
+    model_type: str = "linear", n_threads: Optional[int] = None,
 ) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
     """
     Builds and trains a Linear Regression model using scikit-learn wrapped in a pipeline.
@@ -31,9 +31,20 @@ def model_building_step(
     Parameters:
     X_train (pd.DataFrame): The training data features.
     y_train (pd.Series): The training data labels/target.
+    search (bool): Instead of Linear Regression, search ridge, lasso, elastic net and histogram gradient boosting
+                   grids in parallel (ModelBuilder.search) and keep the best; the leaderboard is logged to MLflow.
+    search_time_budget (float): Seconds the search may take.
+    autolog (bool): Enable mlflow.sklearn.autolog for the parameters and metrics of every fit, which dominates the
+                    step on small data, and log the trained pipeline as the run's model; turn it off when only the
+                    model artifact is needed.
+    design_matrix_dir (str): Directory of a DesignMatrixCache holding the fitted binner and binned training matrix
+                             of model_type="hist_gradient_boosting", reused when the same rows are trained on again.
+    model_type (str): "linear", or "hist_gradient_boosting" for histogram gradient boosting on binned features
+                      with native categorical support (no one-hot encoding). Ignored when search is set.
+    n_threads (int): Threads used to train histogram gradient boosting. Defaults to every core.
 
     Returns:
-    Pipeline: The trained scikit-learn pipeline including preprocessing and the Linear Regression model.
+    Pipeline: The trained scikit-learn pipeline: a "preprocessor" and a "model" step.
     """
     # Ensure the inputs are of the correct type
     if not isinstance(X_train, pd.DataFrame):
@@ -41,55 +52,20 @@ def model_building_step(
     if not isinstance(y_train, pd.Series):
         raise TypeError("y_train must be a pandas Series.")
     
-    # Identifies the categorical and numerical columns
-    categorical_cols = X_train.select_dtypes(include=["object",'category']).columns
-    numerical_cols = X_train.select_dtypes(exclude=['object','category']).columns
-
-    logging.info(f"Categorical columns: {categorical_cols.tolist()}")
-    logging.info(f"Numerical columns: {numerical_cols.tolist()}")
-    
-    # Define preprocessing for categorical and numerical features
-    numerical_transformer = SimpleImputer(strategy="mean")
-    categorical_transformer = Pipeline(
-        steps=[
-            ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore"))
-        ]
-    )
-
-    # Bundle preprocessing  for numerical and categorical data
-    preprocessor = ColumnTransformer(
-        transformers=[
-            ("num", numerical_transformer, numerical_cols),
-            ("cat", categorical_transformer, categorical_cols),
-        ]
-    )
-
-    # Define the model training pipeline
-    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
-    
     # Start an MLflow run to log the model training process
     if not mlflow.active_run():
         mlflow.start_run() # Start a new MLflow run if there isn't one active
     
     try:
-        # Enable autologging for scikit learn to automatically capture model metrics, parameters, and artifacts
-        mlflow.sklearn.autolog()
-
-
-        logging.info("Building and training the Linear Regression model.")
-        pipeline.fit(X_train, y_train)
-        logging.info("Model training completed.")
-
-        # Log the columns that the model expects
-        onehot_encoder = (
-            pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
-        )
-        onehot_encoder.fit(X_train[categorical_cols])
-        expected_columns = numerical_cols.tolist() + list(
-            onehot_encoder.get_feature_names_out(categorical_cols)
+        # With autolog, the fits' parameters and metrics are captured automatically and the trained pipeline is
+        # logged as the run's model
+        pipeline, leaderboard = train_pipeline(
+            X_train, y_train, model_type=model_type, search=search, search_time_budget=search_time_budget,
+            design_matrix_dir=design_matrix_dir, n_threads=n_threads, autolog=autolog,
         )
-        logging.info(f"Model expects the following columns: {expected_columns}")
+        if leaderboard is not None:
+            mlflow.log_text(leaderboard.to_csv(index=False), "model_search_leaderboard.csv")
+            logging.info(f"Model search leaderboard:\n{leaderboard.head(10).to_string()}")
 
     except Exception as e:
         logging.error(f"Error during model training: {e}")
@@ -1,17 +1,34 @@
 import logging
-from typing import Tuple, List, Annotated
-import matplotlib.pyplot as plt
+from typing import Tuple, Annotated, Optional
 from zenml import step
 import pandas as pd
-from source.outlier_detection import OutlierDetector, ZScoreOutlierDetection, IQROutliersDetection
+from source.outlier_detection import (
+    OutlierDetector, ZScoreOutlierDetection, IQROutliersDetection, IsolationForestOutlierDetection, boxplot_summary,
+)
 
 @step
 def outlier_detection_step(df: pd.DataFrame,
                            features:list,
                            strategy:str = "z_score",
                            method:str = "remove", 
-                           threshold:int =3) -> Tuple[Annotated[pd.DataFrame,"Outlier_cleaned"], Annotated[List[plt.Figure], "Plots"]]:
-    """Detects and removes outliers using OutlierDetector."""
+                           threshold:int =3,
+                           fit: bool = True,
+                           state_path: Optional[str] = None,
+                           plot: bool = False,
+                           plot_dir: str = "outlier_plots",
+                           plot_format: str = "png") -> Tuple[Annotated[pd.DataFrame,"Outlier_cleaned"], Annotated[dict, "Boxplot_summary"]]:
+    """
+    Detects and removes or caps outliers using OutlierDetector.
+
+    With method="cap" the bounds are computed once and saved to state_path when given; with fit=False the bounds
+    saved at state_path are applied without refitting, as the serving path does.
+
+    strategy="isolation_forest" flags rows whose combination of the given features is unusual, using all cores;
+    with state_path the fitted forest is saved there for the predictor to flag suspicious requests.
+
+    The second output holds the boxplot statistics of each feature. Boxplots are only drawn when plot=True:
+    they are rendered in parallel to plot_format files in plot_dir and their paths added to the summary.
+    """
     logging.info(f"Starting outlier detection step with DataFrame of shape: {df.shape}")
 
     if df is None:
@@ -22,13 +39,37 @@ def outlier_detection_step(df: pd.DataFrame,
         logging.error(f"Expected pandas DataFrame, got {type(df)} instead.")
         raise ValueError("Input df must be a pandas DataFrame.")
 
-    df_numeric = df.select_dtypes(include=[int, float])
-    if strategy == "z_score":
+    if strategy == "isolation_forest" and method == "cap":
+        raise ValueError("strategy='isolation_forest' flags whole rows and only supports method='remove'.")
+
+    df_numeric = df.select_dtypes(include="number")
+    if not fit:
+        if method != "cap" or state_path is None:
+            raise ValueError("fit=False requires method='cap' and the state_path of saved bounds.")
+        detector = OutlierDetector.load(state_path)
+    elif strategy == "z_score":
         detector = OutlierDetector(ZScoreOutlierDetection(threshold))
     elif strategy == "IQR":
         detector = OutlierDetector(IQROutliersDetection())
+    elif strategy == "isolation_forest":
+        detector = OutlierDetector(IsolationForestOutlierDetection(features))
     else:
         raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
-    df_cleaned = detector.handle_outliers(df_numeric, method)
-    visualization = detector.visualize_outliers(df_numeric, features)
-    return df_cleaned, visualization
\ No newline at end of file
+
+    # The summary and plots describe the input: capping clips df_numeric in place, after which no value would be
+    # outside the whiskers.
+    summary = boxplot_summary(df_numeric, features)
+    if plot:
+        paths = detector.render_outlier_plots(df_numeric, features, output_dir=plot_dir, fmt=plot_format)
+        for feature, path in zip(features, paths):
+            summary[feature]["plot"] = path
+
+    if not fit:
+        df_cleaned = detector.cap(df_numeric)
+    else:
+        df_cleaned = detector.handle_outliers(df_numeric, method)
+        if strategy == "isolation_forest" and state_path is not None:
+            detector.strategy.save(state_path)
+        elif method == "cap" and state_path is not None:
+            detector.save(state_path)
+    return df_cleaned, summary
\ No newline at end of file
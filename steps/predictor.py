@@ -1,23 +1,68 @@
 import json 
+import logging
+from functools import lru_cache
+from typing import Optional
 from zenml import step
 from zenml.integrations.mlflow.services import MLFlowDeploymentService
 import numpy as np
 import pandas as pd
+from source.compiled_features import CompiledFeatureTransform
+from source.feature_engineering import FeatureEngineer
+from source.linear_predictor import LinearPredictor
+from source.outlier_detection import IsolationForestOutlierDetection, OutlierDetector
+
+
+@lru_cache(maxsize=4)
+def _load_compiled_transform(state_path: str, columns: tuple) -> CompiledFeatureTransform:
+    """Loads a fitted feature engineering plan and compiles it for the request columns once per process."""
+    return CompiledFeatureTransform(FeatureEngineer.load(state_path), columns)
+
+
+@lru_cache(maxsize=4)
+def _load_outlier_detector(state_path: str) -> OutlierDetector:
+    """Loads the outlier capping bounds once per process."""
+    return OutlierDetector.load(state_path)
+
+
+@lru_cache(maxsize=4)
+def _load_anomaly_detector(model_path: str) -> IsolationForestOutlierDetection:
+    """Loads the fitted isolation forest once per process."""
+    return IsolationForestOutlierDetection.load(model_path)
+
+
+@lru_cache(maxsize=4)
+def _load_linear_predictor(path: str) -> LinearPredictor:
+    """Loads the exported linear predictor once per process."""
+    return LinearPredictor.load(path)
+
 
 @step
-def predictor(service: MLFlowDeploymentService, input_data: str)-> np.ndarray:
+def predictor(service: MLFlowDeploymentService, input_data: str,
+              feature_state_path: Optional[str] = None,
+              outlier_state_path: Optional[str] = None,
+              anomaly_model_path: Optional[str] = None,
+              linear_model_path: Optional[str] = None)-> np.ndarray:
     """Run an inference request against a prediction service.
 
     Args:
         service (MLFlowDeploymentService): The deployed MLFlow service for prediction.
         input_data (str): The input data as a JSON string.
+        feature_state_path (str): Optional feature engineering plan saved by feature_engineering_step; its fitted
+            parameters are applied to the request before prediction.
+        outlier_state_path (str): Optional capping bounds saved by outlier_detection_step(method="cap"); the
+            request is clipped to them after feature engineering, as the training data was.
+        anomaly_model_path (str): Optional isolation forest saved by outlier_detection_step; requests it flags
+            as unusual combinations of values are logged as suspicious.
+        linear_model_path (str): Optional predictor saved by linear_export_step; the request is then predicted
+            in process from its compiled coefficients instead of by the MLflow service.
 
     Returns:
         np.ndarray: The model's prediction.
     """
 
     # Start the service (should be a NOP if already started)
-    service.start(timeout=10)
+    if linear_model_path is None:
+        service.start(timeout=10)
 
     # Load the input data from JSON string
     data = json.loads(input_data)
@@ -68,6 +113,32 @@ def predictor(service: MLFlowDeploymentService, input_data: str)-> np.ndarray:
         "Yr Sold",
     ]
 
+    # Apply the feature engineering and outlier capping fitted at training time (e.g. the log transform of
+    # Gr Liv Area) straight on the request rows, without building a DataFrame
+    if (feature_state_path is not None or outlier_state_path is not None or anomaly_model_path is not None
+            or linear_model_path is not None):
+        columns = expected_columns
+        data_array = np.asarray(data["data"], dtype=np.float64)
+        if feature_state_path is not None:
+            compiled = _load_compiled_transform(feature_state_path, tuple(expected_columns))
+            data_array = compiled.transform(data_array)
+            columns = compiled.output_columns
+        if outlier_state_path is not None:
+            _load_outlier_detector(outlier_state_path).cap_array(data_array, columns)
+        if anomaly_model_path is not None:
+            anomaly_detector = _load_anomaly_detector(anomaly_model_path)
+            positions = [list(columns).index(column) for column in anomaly_detector.columns_]
+            suspicious = np.flatnonzero(anomaly_detector.is_outlier(data_array[:, positions]))
+            if len(suspicious):
+                logging.warning(f"Suspicious request rows (unusual combination of values): {suspicious.tolist()}")
+        if linear_model_path is not None:
+            return _load_linear_predictor(linear_model_path).predict(data_array, columns=columns)
+        # The deployed model is the full training pipeline, which selects its input columns by name: send named
+        # records of the engineered columns, in the same form as the plain path below.
+        records = [dict(zip(columns, row)) for row in data_array.tolist()]
+        prediction = service.predict(np.array(records))
+        return prediction
+
     # Convert the data into a DataFrame with the correct columns
     df = pd.DataFrame(data["data"], columns=expected_columns)
 
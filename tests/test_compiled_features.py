@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from source.compiled_features import CompiledFeatureTransform
+from source.feature_engineering import (
+    FeatureEngineer,
+    HashingEncoding,
+    LogTransformation,
+    MinMaxScaling,
+    OneHotEncoding,
+    StandardScaling,
+)
+from source.handle_missing_values import FillingMissingValuesStrategy
+
+COLUMNS = ["Gr Liv Area", "Lot Area", "Overall Qual", "Neighborhood", "Alley", "MS Zoning"]
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 200
+    df = pd.DataFrame({
+        "Gr Liv Area": rng.uniform(500, 4000, n),
+        "Lot Area": rng.uniform(1000, 20000, n),
+        "Overall Qual": rng.integers(1, 11, n).astype(float),
+        "Neighborhood": rng.choice(["NAmes", "CollgCr", "OldTown", "Edwards"], n).astype(object),
+        "Alley": rng.choice(["Grvl", "Pave", None], n).astype(object),
+        "MS Zoning": rng.choice(["RL", "RM", "FV"], n).astype(object),
+    })
+    df.loc[::17, "Lot Area"] = np.nan
+    return df[COLUMNS]
+
+
+def _fit(df: pd.DataFrame):
+    imputer = FillingMissingValuesStrategy(method="mean").fit(df)
+    engineer = FeatureEngineer([
+        LogTransformation(["Gr Liv Area"]),
+        StandardScaling(["Gr Liv Area", "Lot Area"]),
+        MinMaxScaling(["Overall Qual"]),
+        OneHotEncoding(["Neighborhood", "Alley"]),
+        HashingEncoding(["MS Zoning"], n_buckets=8),
+    ])
+    engineer.fit(imputer.transform(df))
+    return imputer, engineer
+
+
+def _dataframe_path(df: pd.DataFrame, imputer, engineer) -> np.ndarray:
+    expected = engineer.transform(imputer.transform(df))
+    return np.column_stack([
+        column.sparse.to_dense().to_numpy(dtype=np.float64) if isinstance(column.dtype, pd.SparseDtype)
+        else column.to_numpy(dtype=np.float64)
+        for _, column in expected.items()
+    ])
+
+
+def _rows(df: pd.DataFrame) -> np.ndarray:
+    return df.astype(object).where(df.notna(), None).to_numpy()
+
+
+def test_batch_matches_dataframe_path(frame):
+    imputer, engineer = _fit(frame)
+    compiled = CompiledFeatureTransform(engineer, COLUMNS, imputer)
+
+    assert compiled.output_columns == list(engineer.transform(imputer.transform(frame)).columns)
+    np.testing.assert_allclose(compiled.transform(_rows(frame)), _dataframe_path(frame, imputer, engineer),
+                               rtol=1e-9, atol=1e-9)
+
+
+def test_single_rows_match_dataframe_path(frame):
+    imputer, engineer = _fit(frame)
+    compiled = CompiledFeatureTransform(engineer, COLUMNS, imputer)
+    expected = _dataframe_path(frame, imputer, engineer)
+
+    for i, row in enumerate(_rows(frame)):
+        np.testing.assert_allclose(compiled.transform(row), expected[i], rtol=1e-9, atol=1e-9)
+        record = {column: value for column, value in zip(COLUMNS, row) if value is not None}
+        np.testing.assert_allclose(compiled.transform_record(record), expected[i], rtol=1e-9, atol=1e-9)
+
+
+def test_unseen_and_missing_categories(frame):
+    imputer, engineer = _fit(frame)
+    compiled = CompiledFeatureTransform(engineer, COLUMNS, imputer)
+    unseen = frame.head(3).copy()
+    unseen["Neighborhood"] = ["Unknown", None, "NAmes"]
+    unseen["Alley"] = [None, "Pave", "Unknown"]
+
+    np.testing.assert_allclose(compiled.transform(_rows(unseen)), _dataframe_path(unseen, imputer, engineer),
+                               rtol=1e-9, atol=1e-9)
+    assert compiled.check_parity(unseen, engineer, imputer) < 1e-9
+
+
+def test_saved_plan_compiles_identically(frame, tmp_path):
+    imputer, engineer = _fit(frame)
+    engineer.save(str(tmp_path / "feature_state.npz"))
+    loaded = FeatureEngineer.load(str(tmp_path / "feature_state.npz"))
+
+    compiled = CompiledFeatureTransform(loaded, COLUMNS, imputer)
+    np.testing.assert_allclose(compiled.transform(_rows(frame)), _dataframe_path(frame, imputer, engineer),
+                               rtol=1e-9, atol=1e-9)
+
+
+def test_unsupported_plan_is_rejected(frame):
+    imputer, engineer = _fit(frame)
+    conflicting = FeatureEngineer([
+        OneHotEncoding(["Neighborhood"]),
+        StandardScaling(["Neighborhood_NAmes"]),
+    ])
+    conflicting.fit(imputer.transform(frame))
+
+    with pytest.raises(ValueError):
+        CompiledFeatureTransform(conflicting, COLUMNS, imputer)
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+import source.ingest_data as ingest_data
+from source.ingest_data import IncrementalDataIngestor, MultiFileDataIngestor
+
+
+def _write_source(path, months):
+    pd.DataFrame({
+        "Order": range(1, len(months) + 1),
+        "Yr Sold": 2010,
+        "Mo Sold": months,
+        "SalePrice": [100_000 + 1_000 * month for month in months],
+    }).to_csv(path, index=False)
+
+
+def _ingest(source, state_dir):
+    ingestor = IncrementalDataIngestor(MultiFileDataIngestor(), str(state_dir))
+    return ingestor, ingestor.ingest(str(source))
+
+
+def test_partition_is_only_read_once_committed(tmp_path, monkeypatch):
+    source = tmp_path / "sales.csv"
+    state_dir = tmp_path / "state"
+    _write_source(source, [1, 2, 3])
+    _ingest(source, state_dir)
+
+    # The second run writes its partition, then dies before committing the watermark.
+    _write_source(source, [1, 2, 3, 4, 5])
+    atomic_write = ingest_data.atomic_write
+
+    def crash(path, data):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(ingest_data, "atomic_write", crash)
+    with pytest.raises(KeyboardInterrupt):
+        _ingest(source, state_dir)
+    monkeypatch.setattr(ingest_data, "atomic_write", atomic_write)
+
+    # The uncommitted partition is not part of the history, even when a run has no new rows of its own.
+    _write_source(source, [1, 2, 3])
+    assert _ingest(source, state_dir)[1]["Mo Sold"].tolist() == [1, 2, 3]
+
+    _write_source(source, [1, 2, 3, 4, 5])
+    ingestor, df = _ingest(source, state_dir)
+    assert df["Mo Sold"].tolist() == [1, 2, 3, 4, 5]
+    assert ingestor.new_partition["new_rows"] == 2
+    assert _ingest(source, state_dir)[1]["Mo Sold"].tolist() == [1, 2, 3, 4, 5]
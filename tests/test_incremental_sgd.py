@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.pipeline import Pipeline
+
+from source.model_building import IncrementalSGDRegressionStrategy
+from source.model_training import train_pipeline
+
+NUMERICAL = ["Gr Liv Area", "Lot Area", "Overall Qual"]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 400
+    X = pd.DataFrame({
+        "Gr Liv Area": rng.uniform(500, 4000, n),
+        "Lot Area": rng.uniform(1000, 20000, n),
+        "Overall Qual": rng.integers(1, 11, n).astype(float),
+        "Neighborhood": rng.choice(["NAmes", "CollgCr", "OldTown"], n, p=[0.6, 0.3, 0.1]).astype(object),
+    })
+    y = pd.Series(50 * X["Gr Liv Area"] + 2 * X["Lot Area"] + 10_000 * X["Overall Qual"]
+                  + X["Neighborhood"].map({"NAmes": 0, "CollgCr": 20_000, "OldTown": -5_000})
+                  + rng.normal(0, 1_000, n), name="SalePrice")
+    return X, y
+
+
+def test_warm_start_from_deployed_pipeline_keeps_its_predictions(data):
+    X, y = data
+    deployed, _ = train_pipeline(X[NUMERICAL], y)
+
+    # Without any epoch, the warm-started model is the deployed one, rescaled to the SGD feature scaling.
+    strategy = IncrementalSGDRegressionStrategy(n_epochs=0, warm_start_model=deployed)
+    pipeline = strategy.build_and_train_model(X[NUMERICAL], y)
+    np.testing.assert_allclose(pipeline.predict(X[NUMERICAL]), deployed.predict(X[NUMERICAL]), rtol=1e-9)
+
+
+def test_warm_start_folds_categoricals_into_intercept(data):
+    X, y = data
+    deployed, _ = train_pipeline(X, y)
+
+    strategy = IncrementalSGDRegressionStrategy(n_epochs=0, warm_start_model=deployed)
+    pipeline = strategy.build_and_train_model(X, y)
+    assert list(pipeline.named_steps["scaler"].feature_names_in_) == NUMERICAL
+    # Rows of the most frequent category are predicted as by the deployed model.
+    rows = X[X["Neighborhood"] == "NAmes"]
+    np.testing.assert_allclose(pipeline.predict(rows[NUMERICAL]), deployed.predict(rows), rtol=1e-9)
+
+    trained = IncrementalSGDRegressionStrategy(n_epochs=2, warm_start_model=deployed).build_and_train_model(X, y)
+    assert np.isfinite(trained.predict(X[NUMERICAL])).all()
+
+
+def test_warm_start_rejects_other_models(data):
+    X, y = data
+    deployed, _ = train_pipeline(X[NUMERICAL], y)
+    deployed.steps[-1] = ("model", HistGradientBoostingRegressor(max_iter=5).fit(
+        deployed.named_steps["preprocessor"].transform(X[NUMERICAL]), y))
+    with pytest.raises(ValueError):
+        IncrementalSGDRegressionStrategy(n_epochs=0, warm_start_model=deployed).build_and_train_model(X, y)
+    with pytest.raises(ValueError):
+        bare = Pipeline([("model", HistGradientBoostingRegressor())])
+        IncrementalSGDRegressionStrategy(n_epochs=0, warm_start_model=bare).build_and_train_model(X, y)
@@ -0,0 +1,53 @@
+import time
+
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+
+from source.model_building import (
+    HistGradientBoostingStrategy,
+    LinearRegressionStrategy,
+    ModelBuilder,
+    PipelineModelBuildingStrategy,
+    RidgeRegressionStrategy,
+)
+
+
+def _sleep(X):
+    time.sleep(60)
+    return X
+
+
+class SlowStrategy(PipelineModelBuildingStrategy):
+    def build_pipeline(self) -> Pipeline:
+        return Pipeline([("sleep", FunctionTransformer(_sleep)), ("model", Ridge())])
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    X = sparse.hstack([sparse.random(1000, 50, density=0.1, random_state=0), rng.normal(size=(1000, 3))]).tocsr()
+    return X, X @ rng.normal(size=X.shape[1]) + rng.normal(size=1000)
+
+
+def test_time_budget_stops_running_candidates():
+    X, y = _data()
+    candidates = [(RidgeRegressionStrategy, {"alpha": [1.0, 10.0]}), (SlowStrategy, {})]
+
+    start = time.monotonic()
+    model, leaderboard = ModelBuilder(LinearRegressionStrategy()).search(
+        X, y, candidates=candidates, time_budget=3, max_workers=3
+    )
+    assert time.monotonic() - start < 30
+    assert set(leaderboard["strategy"]) == {"RidgeRegressionStrategy"}
+    assert model.predict(X[:5]).shape == (5,)
+
+
+def test_sparse_input_reaches_every_candidate():
+    X, y = _data()
+    candidates = [(RidgeRegressionStrategy, {"alpha": [1.0]}), (HistGradientBoostingStrategy, {"max_iter": [10]})]
+
+    model, leaderboard = ModelBuilder(LinearRegressionStrategy()).search(X, y, candidates=candidates, max_workers=2)
+    assert (leaderboard["status"] == "ok").all()
+    assert model.predict(X[:5]).shape == (5,)
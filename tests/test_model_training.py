@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+
+from source.design_matrix import build_preprocessor
+from source.model_training import expected_columns, split_feature_columns, train_pipeline
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 300
+    X = pd.DataFrame({
+        "Gr Liv Area": rng.uniform(500, 4000, n),
+        "Lot Area": rng.uniform(1000, 20000, n),
+        "Overall Qual": rng.integers(1, 11, n).astype(float),
+        "Neighborhood": rng.choice(["NAmes", "CollgCr", "OldTown", "Edwards"], n).astype(object),
+    })
+    X.loc[::13, "Lot Area"] = np.nan
+    y = pd.Series(50 * X["Gr Liv Area"] + 10_000 * X["Overall Qual"] + rng.normal(0, 1_000, n), name="SalePrice")
+    return X, y
+
+
+def test_linear_pipeline_matches_pipeline_fit(data):
+    X, y = data
+    pipeline, leaderboard = train_pipeline(X, y)
+
+    assert leaderboard is None
+    assert list(pipeline.named_steps) == ["preprocessor", "model"]
+    reference = Pipeline([("preprocessor", build_preprocessor(*split_feature_columns(X))),
+                          ("model", LinearRegression())]).fit(X, y)
+    np.testing.assert_allclose(pipeline.predict(X), reference.predict(X), rtol=1e-9)
+    assert expected_columns(pipeline)[:3] == ["Gr Liv Area", "Lot Area", "Overall Qual"]
+    assert "Neighborhood_NAmes" in expected_columns(pipeline)
+
+
+def test_search_returns_the_full_pipeline(data):
+    X, y = data
+    pipeline, leaderboard = train_pipeline(X, y, search=True)
+
+    assert len(leaderboard) > 0
+    assert list(pipeline.named_steps) == ["preprocessor", "model"]
+    assert pipeline.predict(X).shape == (len(X),)
+
+
+def test_binned_gradient_boosting_returns_the_full_pipeline(data, tmp_path):
+    X, y = data
+    pipeline, _ = train_pipeline(X, y, model_type="hist_gradient_boosting", design_matrix_dir=str(tmp_path))
+
+    assert list(pipeline.named_steps) == ["preprocessor", "model"]
+    assert pipeline.predict(X).shape == (len(X),)
+    assert "Neighborhood" in expected_columns(pipeline)
+
+
+@pytest.mark.parametrize("options", [{}, {"search": True}, {"model_type": "hist_gradient_boosting"}],
+                         ids=["linear", "search", "hist_gradient_boosting"])
+def test_logged_model_is_the_full_pipeline(data, tmp_path, options):
+    mlflow = pytest.importorskip("mlflow")
+    X, y = data
+    mlflow.set_tracking_uri(tmp_path.as_uri())
+    with mlflow.start_run() as run:
+        pipeline, _ = train_pipeline(X, y, autolog=True, **options)
+
+    logged = mlflow.sklearn.load_model(f"runs:/{run.info.run_id}/model")
+    assert isinstance(logged, Pipeline)
+    assert list(logged.named_steps) == ["preprocessor", "model"]
+    np.testing.assert_allclose(logged.predict(X), pipeline.predict(X))
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from source.model_building import LinearSufficientStatistics, SufficientStatisticsLinearRegressionStrategy
+
+
+def _data(seed, n=200):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({"Gr Liv Area": rng.uniform(500, 4000, n), "Overall Qual": rng.integers(1, 11, n).astype(float)})
+    y = pd.Series(50 * X["Gr Liv Area"] + 10_000 * X["Overall Qual"] + rng.normal(0, 1_000, n), name="SalePrice")
+    return X, y
+
+
+def _coefficients(pipeline):
+    model = pipeline.named_steps["model"]
+    return np.append(model.coef_, model.intercept_)
+
+
+def test_rerun_on_the_same_rows_is_not_counted_twice(tmp_path):
+    stats_path = str(tmp_path / "stats.npz")
+    X, y = _data(0)
+    once = SufficientStatisticsLinearRegressionStrategy(stats_path=stats_path).build_and_train_model(X, y)
+
+    # A retried run sees the same rows, possibly reloaded with another index.
+    retried = X.set_index(X.index + 1_000)
+    again = SufficientStatisticsLinearRegressionStrategy(stats_path=stats_path).build_and_train_model(retried, y)
+    np.testing.assert_allclose(_coefficients(again), _coefficients(once))
+    stats, _ = LinearSufficientStatistics.load(stats_path)
+    assert stats.n == len(X) and len(stats.batches) == 1
+
+    # New rows are still merged, as if both batches were fitted together.
+    X_new, y_new = _data(1)
+    merged = SufficientStatisticsLinearRegressionStrategy(stats_path=stats_path).build_and_train_model(X_new, y_new)
+    combined = SufficientStatisticsLinearRegressionStrategy().build_and_train_model(
+        pd.concat([X, X_new], ignore_index=True), pd.concat([y, y_new], ignore_index=True)
+    )
+    np.testing.assert_allclose(_coefficients(merged), _coefficients(combined), rtol=1e-9)
+    assert LinearSufficientStatistics.load(stats_path)[0].n == len(X) + len(X_new)